@@ -4,9 +4,9 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.generics import RetrieveUpdateAPIView
 
+from apps.common.throttling import ScopedRateThrottle
 from apps.accounts.api.v1.serializers import UserSerializer
 
 logger = logging.getLogger("app.v1.user_view")
@@ -5,6 +5,9 @@ MAX_AVATAR_SIZE_MB = 2
 MAX_AVATAR_SIZE = 2 * 1024 * 1024
 VALID_AVATAR_EXTENSIONS = [".jpg", ".jpeg", ".png", ".webp"]
 
+# Seconds a user's language (looked up by email) stays cached
+USER_LANGUAGE_CACHE_TTL = 60 * 60
+
 
 class UserStatus(models.TextChoices):
     ACTIVE = "active", "Active"
@@ -59,6 +59,13 @@ class UserModel(AbstractBaseUser, PermissionsMixin):
         """String representation of the user."""
         return self.email
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Email as stored in the database, a change drops its cached language
+        instance.stored_email = instance.__dict__.get("email")
+        return instance
+
     @property
     def is_staff(self) -> bool:
         """Check if the user is staff."""
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from django.utils import timezone
 
 from apps.accounts.constants import UserRole
@@ -189,6 +189,23 @@ class UserRepository:
         settings = SettingsModel.objects.get(user=user)
         return settings
 
+    @staticmethod
+    def get_languages_by_email(emails: Iterable[str]) -> Dict[str, str]:
+        """
+        Retrieve the settings language of many users in one query.
+
+        Args:
+            emails (Iterable[str]): Normalized emails to look up.
+
+        Returns:
+            Dict[str, str]: Email -> language, for users that have settings.
+        """
+        return dict(
+            SettingsModel.objects.filter(user__email__in=list(emails)).values_list(
+                "user__email", "language"
+            )
+        )
+
     # ----------------------------------------------------------------------
     # UTILITIES
     # ----------------------------------------------------------------------
@@ -1 +1,2 @@
 from .user_service import UserService
+from .user_language_service import UserLanguageService
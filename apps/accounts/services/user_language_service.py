@@ -0,0 +1,71 @@
+from typing import Dict, Iterable, Optional
+from django.core.cache import cache
+
+from apps.accounts.constants import USER_LANGUAGE_CACHE_TTL
+from apps.accounts.repositories import UserRepository
+
+USER_LANGUAGE_CACHE_KEY = "accounts:language:{email}"
+
+# Cached for emails without a user, so they are not looked up again
+UNKNOWN_LANGUAGE = ""
+
+
+class UserLanguageService:
+    """
+    Cached lookup of users' preferred language by email.
+
+    Used when sending emails, so resolving the recipient's language
+    normally costs a cache read instead of a query. Entries are dropped
+    when a user's settings or email change (see ``apps.accounts.signals``).
+    """
+
+    @staticmethod
+    def _cache_key(email: str) -> str:
+        return USER_LANGUAGE_CACHE_KEY.format(email=email)
+
+    @staticmethod
+    def _normalize(email: str) -> str:
+        return email.lower().strip()
+
+    @classmethod
+    def get_language(cls, email: str) -> Optional[str]:
+        """
+        Return the language of the user with email.
+
+        Returns:
+            Optional[str]: The language code, or None if no user has it.
+        """
+        return cls.get_languages([email]).get(cls._normalize(email))
+
+    @classmethod
+    def get_languages(cls, emails: Iterable[str]) -> Dict[str, Optional[str]]:
+        """
+        Return the languages of many users, querying only uncached emails.
+
+        Returns:
+            Dict[str, Optional[str]]: Normalized email -> language code, or
+            None for emails without a user.
+        """
+        normalized = {cls._normalize(email) for email in emails}
+        keys = {cls._cache_key(email): email for email in normalized}
+        cached = cache.get_many(list(keys))
+        languages = {keys[key]: value for key, value in cached.items()}
+
+        missing = [email for key, email in keys.items() if key not in cached]
+        if missing:
+            found = UserRepository.get_languages_by_email(missing)
+            loaded = {email: found.get(email, UNKNOWN_LANGUAGE) for email in missing}
+            cache.set_many(
+                {cls._cache_key(email): language for email, language in loaded.items()},
+                timeout=USER_LANGUAGE_CACHE_TTL,
+            )
+            languages.update(loaded)
+
+        return {email: language or None for email, language in languages.items()}
+
+    @classmethod
+    def forget(cls, *emails: str) -> None:
+        """Drop the cached language of emails."""
+        cache.delete_many(
+            [cls._cache_key(cls._normalize(email)) for email in emails if email]
+        )
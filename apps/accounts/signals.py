@@ -0,0 +1,31 @@
+from django.dispatch import receiver
+from django.db.models.signals import post_delete, post_save
+
+from apps.accounts.models import UserModel, SettingsModel
+from apps.accounts.services import UserLanguageService
+
+
+@receiver(post_save, sender=SettingsModel)
+@receiver(post_delete, sender=SettingsModel)
+def forget_settings_language(sender, instance, **kwargs):
+    """Drop the cached language when a user's settings change."""
+    UserLanguageService.forget(instance.user.email)
+
+
+@receiver(post_save, sender=UserModel)
+def forget_user_language(sender, instance, created, update_fields=None, **kwargs):
+    """Drop cached languages of a new user's email or of a changed email."""
+    if update_fields is not None and "email" not in update_fields:
+        return
+    previous_email = getattr(instance, "stored_email", None)
+    if created:
+        UserLanguageService.forget(instance.email)
+    elif previous_email and previous_email != instance.email:
+        UserLanguageService.forget(instance.email, previous_email)
+    instance.stored_email = instance.email
+
+
+@receiver(post_delete, sender=UserModel)
+def forget_deleted_user_language(sender, instance, **kwargs):
+    """Drop the cached language of a deleted user."""
+    UserLanguageService.forget(instance.email)
@@ -1,13 +1,14 @@
 from django.contrib import admin
 from django.utils.html import format_html
 
+from apps.common.admin_performance import AdminPerformanceMixin, RecentWindowFilter
 from apps.authentication.models import OTPModel
 from apps.authentication.selectors import OTPSelectors
-from apps.authentication.repositories import OTPRepository
+from apps.authentication.repositories import DatabaseOTPStore
 
 
 @admin.register(OTPModel)
-class OTPAdmin(admin.ModelAdmin):
+class OTPAdmin(AdminPerformanceMixin, admin.ModelAdmin):
     """Admin panel for OTP management using service/repository/selector layers."""
 
     list_display = (
@@ -22,7 +23,8 @@ class OTPAdmin(admin.ModelAdmin):
     )
 
     search_fields = ("email",)
-    list_filter = ("otp_type", "is_used", "created_at")
+    search_help_text = "Email starting with the search term"
+    list_filter = (RecentWindowFilter, "otp_type", "is_used")
 
     readonly_fields = (
         "id",
@@ -39,7 +41,6 @@ class OTPAdmin(admin.ModelAdmin):
     )
 
     ordering = ("-created_at",)
-    date_hierarchy = "created_at"
     list_per_page = 25
 
     fieldsets = (
@@ -113,7 +114,7 @@ class OTPAdmin(admin.ModelAdmin):
     def action_mark_used(self, request, queryset):
         count = 0
         for otp in queryset:
-            OTPRepository.mark_used(otp)
+            DatabaseOTPStore.mark_used(otp)
             count += 1
         self.message_user(request, f"{count} OTPs marked as used ✓")
 
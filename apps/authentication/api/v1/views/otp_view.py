@@ -5,8 +5,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 from rest_framework.exceptions import ValidationError
-from rest_framework.throttling import ScopedRateThrottle
 
+from apps.common.throttling import ScopedRateThrottle
 from apps.authentication.services import AuthService
 from apps.authentication.api.v1.serializers import SendOTPSerializer
 
@@ -4,12 +4,22 @@ from config.env import (
     ENV_MAX_VERIFY_ATTEMPTS,
     ENV_OTP_EXPIRY_MINUTES,
     ENV_OTP_LENGTH,
+    ENV_OTP_STORAGE_BACKEND,
 )
 
 OTP_IN_CONSOLE = True
 OTP_LENGTH = ENV_OTP_LENGTH
 OTP_EXPIRY_MINUTES = ENV_OTP_EXPIRY_MINUTES
 MAX_VERIFY_ATTEMPTS = ENV_MAX_VERIFY_ATTEMPTS
+# The attempt that brings the count to MAX_VERIFY_ATTEMPTS is rejected,
+# so a code can be tried MAX_VERIFY_ATTEMPTS - 1 times
+OTP_ALLOWED_ATTEMPTS = MAX_VERIFY_ATTEMPTS - 1
+OTP_STORAGE_BACKEND = ENV_OTP_STORAGE_BACKEND
+OTP_PURGE_BATCH_SIZE = 1000
+# Concurrent sends to one email: how long the first holds the lock and
+# how long duplicates wait for its result (seconds)
+OTP_SEND_LOCK_TIMEOUT = 30
+OTP_SEND_WAIT_TIMEOUT = 5
 
 
 class OTPType(models.TextChoices):
@@ -17,3 +27,8 @@ class OTPType(models.TextChoices):
     REGISTER = "register", "Register"
     VERIFY_EMAIL = "verify_email", "Verify email"
     RESET_PASSWORD = "reset_password", "Reset password"
+
+
+class OTPStorageBackend(models.TextChoices):
+    DATABASE = "database", "Database"
+    REDIS = "redis", "Redis"
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='otpmodel',
+            name='authenticat_email_7d7235_idx',
+        ),
+        migrations.AddIndex(
+            model_name='otpmodel',
+            index=models.Index(fields=['email'], name='auth_otp_email_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
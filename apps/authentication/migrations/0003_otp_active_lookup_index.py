@@ -0,0 +1,17 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('authentication', '0002_otp_email_prefix_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='otpmodel',
+            index=models.Index(condition=models.Q(('is_used', False)), fields=['email', 'otp_type', '-created_at'], name='auth_otp_active_lookup_idx'),
+        ),
+    ]
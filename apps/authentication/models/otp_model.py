@@ -38,7 +38,18 @@ class OTPModel(models.Model):
         verbose_name_plural = "OTP Codes"
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["email"]),
+            # Pattern ops let prefix searches (LIKE 'x%') use it on PostgreSQL
+            models.Index(
+                fields=["email"],
+                name="auth_otp_email_idx",
+                opclasses=["varchar_pattern_ops"],
+            ),
+            # Pending OTP lookup of get_active_otp, newest first
+            models.Index(
+                fields=["email", "otp_type", "-created_at"],
+                name="auth_otp_active_lookup_idx",
+                condition=Q(is_used=False),
+            ),
         ]
         constraints = [
             models.UniqueConstraint(
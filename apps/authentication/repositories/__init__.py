@@ -1 +1,3 @@
 from .otp_repo import OTPRepository
+from .otp_db_store import DatabaseOTPStore
+from .otp_redis_store import RedisOTPStore
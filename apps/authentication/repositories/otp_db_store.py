@@ -0,0 +1,78 @@
+from typing import Optional
+from datetime import timedelta
+from django.utils import timezone
+from django.db.models import F, Q
+from apps.authentication.models import OTPModel
+from apps.authentication.constants import OTP_EXPIRY_MINUTES, OTP_ALLOWED_ATTEMPTS
+
+
+class DatabaseOTPStore:
+    """OTP storage in the OTP table."""
+
+    @staticmethod
+    def create_otp(email: str, otp_type: str, salt: str, code_hash: str) -> OTPModel:
+        """Create new OTP for email."""
+        qs = OTPModel.objects.create(
+            email=email, otp_type=otp_type, salt=salt, code_hash=code_hash
+        )
+        return qs
+
+    @staticmethod
+    def delete_expired(otp: OTPModel):
+        """Delete otp, which has expired, so a new one can take its place."""
+        OTPModel.objects.filter(pk=otp.pk).delete()
+
+    @staticmethod
+    def purge_expired(limit: int) -> int:
+        """
+        Delete up to limit expired or used OTPs.
+
+        Returns:
+            int: Number of OTPs deleted.
+        """
+        cutoff = timezone.now() - timedelta(minutes=OTP_EXPIRY_MINUTES)
+        ids = list(
+            OTPModel.objects.filter(Q(is_used=True) | Q(created_at__lt=cutoff))
+            .order_by()
+            .values_list("pk", flat=True)[:limit]
+        )
+        if not ids:
+            return 0
+        deleted, _ = OTPModel.objects.filter(pk__in=ids).delete()
+        return deleted
+
+    @staticmethod
+    def get_active_otp(email: str, otp_type) -> Optional[OTPModel]:
+        """Get active OTP for email and otp_type."""
+        qs = OTPModel.objects.filter(
+            email=email, otp_type=otp_type, is_used=False
+        ).first()
+        return qs
+
+    @staticmethod
+    def verify_attempt(otp: OTPModel, is_match: bool) -> bool:
+        """
+        Count one verification attempt of otp and use it up if is_match.
+
+        One conditional UPDATE that only matches while otp is unused,
+        unexpired and has attempts left, so concurrent attempts cannot
+        both use the same code.
+
+        Returns:
+            bool: True if this attempt used otp up.
+        """
+        now = timezone.now()
+        updated = OTPModel.objects.filter(
+            pk=otp.pk,
+            is_used=False,
+            attempts__lt=OTP_ALLOWED_ATTEMPTS,
+            created_at__gte=now - timedelta(minutes=OTP_EXPIRY_MINUTES),
+        ).update(attempts=F("attempts") + 1, is_used=is_match, updated_at=now)
+        return bool(updated) and is_match
+
+    @staticmethod
+    def mark_used(otp: OTPModel):
+        """Mark OTP as used."""
+        if not otp.is_used:
+            otp.is_used = True
+            otp.save(update_fields=["is_used"])
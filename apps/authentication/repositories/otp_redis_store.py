@@ -0,0 +1,163 @@
+import uuid
+from typing import Dict, Optional
+from datetime import datetime, timezone as dt_timezone
+from django.db import IntegrityError
+from django.utils import timezone
+
+from apps.common.redis_client import AtomicScript, get_redis_client
+from apps.authentication.models import OTPModel
+from apps.authentication.constants import OTP_EXPIRY_MINUTES, OTP_ALLOWED_ATTEMPTS
+
+OTP_KEY = "auth:otp:{otp_type}:{email}"
+
+# KEYS: the OTP hash. ARGV: id, salt, code_hash, created_at, ttl in ms.
+# Stores the OTP unless an unexpired one already exists.
+CREATE_OTP_LUA = """
+if redis.call("EXISTS", KEYS[1]) == 1 then
+    return 0
+end
+redis.call(
+    "HSET", KEYS[1],
+    "id", ARGV[1], "salt", ARGV[2], "code_hash", ARGV[3],
+    "created_at", ARGV[4], "attempts", 0
+)
+redis.call("PEXPIRE", KEYS[1], ARGV[5])
+return 1
+"""
+
+# KEYS: the OTP hash. ARGV: id of the OTP the caller holds, allowed attempts,
+# "1" if the code matched. Counts the attempt and deletes the OTP on a
+# match; returns 1 if it was used up, 0 if it is gone or out of attempts.
+VERIFY_ATTEMPT_LUA = """
+local state = redis.call("HMGET", KEYS[1], "id", "attempts")
+if state[1] ~= ARGV[1] or tonumber(state[2]) >= tonumber(ARGV[2]) then
+    return 0
+end
+if ARGV[3] == "1" then
+    redis.call("DEL", KEYS[1])
+    return 1
+end
+redis.call("HINCRBY", KEYS[1], "attempts", 1)
+return 0
+"""
+
+
+def _create_otp_local(client, keys, args):
+    if client.exists(keys[0]):
+        return 0
+    otp_id, salt, code_hash, created_at, ttl = args
+    client.hset(
+        keys[0],
+        {
+            "id": otp_id,
+            "salt": salt,
+            "code_hash": code_hash,
+            "created_at": created_at,
+            "attempts": "0",
+        },
+    )
+    client.pexpire(keys[0], int(ttl))
+    return 1
+
+
+def _verify_attempt_local(client, keys, args):
+    otp_id, max_attempts, is_match = args
+    state = client.hgetall(keys[0])
+    if state.get("id") != otp_id or int(state["attempts"]) >= int(max_attempts):
+        return 0
+    if is_match == "1":
+        client.delete(keys[0])
+        return 1
+    client.hset(keys[0], {"attempts": str(int(state["attempts"]) + 1)})
+    return 0
+
+
+create_otp = AtomicScript(CREATE_OTP_LUA, _create_otp_local)
+verify_attempt = AtomicScript(VERIFY_ATTEMPT_LUA, _verify_attempt_local)
+
+
+class RedisOTPStore:
+    """
+    OTP storage in Redis.
+
+    Each pending OTP is a hash per (otp_type, email) whose key expires
+    with the OTP, so there is nothing to clean up. OTPs are created, and
+    attempts counted and matched OTPs deleted, by atomic scripts. OTPs
+    are handed out as unsaved ``OTPModel`` instances.
+    """
+
+    @staticmethod
+    def _key(email: str, otp_type: str) -> str:
+        return OTP_KEY.format(otp_type=otp_type, email=email)
+
+    @staticmethod
+    def _to_model(email: str, otp_type: str, state: Dict[str, str]) -> OTPModel:
+        created_at = datetime.fromtimestamp(float(state["created_at"]), dt_timezone.utc)
+        return OTPModel(
+            id=uuid.UUID(state["id"]),
+            email=email,
+            otp_type=otp_type,
+            salt=state["salt"],
+            code_hash=state["code_hash"],
+            attempts=int(state["attempts"]),
+            created_at=created_at,
+            updated_at=created_at,
+        )
+
+    @classmethod
+    def create_otp(
+        cls, email: str, otp_type: str, salt: str, code_hash: str
+    ) -> OTPModel:
+        """
+        Create new OTP for email.
+
+        Raises:
+            IntegrityError: If an unexpired OTP of otp_type exists for email,
+                like the database's one active OTP per email and type rule.
+        """
+        state = {
+            "id": str(uuid.uuid4()),
+            "salt": salt,
+            "code_hash": code_hash,
+            "created_at": repr(timezone.now().timestamp()),
+            "attempts": "0",
+        }
+        created = create_otp(
+            get_redis_client(),
+            [cls._key(email, otp_type)],
+            [
+                state["id"],
+                salt,
+                code_hash,
+                state["created_at"],
+                OTP_EXPIRY_MINUTES * 60 * 1000,
+            ],
+        )
+        if not created:
+            raise IntegrityError(f"An active {otp_type} OTP exists for {email}")
+        return cls._to_model(email, otp_type, state)
+
+    @staticmethod
+    def delete_expired(otp: OTPModel):
+        """Nothing to do, the key of an expired OTP expires with it."""
+
+    @classmethod
+    def get_active_otp(cls, email: str, otp_type) -> Optional[OTPModel]:
+        """Get active OTP for email and otp_type."""
+        state = get_redis_client().hgetall(cls._key(email, otp_type))
+        return cls._to_model(email, otp_type, state) if state else None
+
+    @classmethod
+    def verify_attempt(cls, otp: OTPModel, is_match: bool) -> bool:
+        """
+        Count one verification attempt of otp and use it up if is_match.
+
+        Returns:
+            bool: True if this attempt used otp up.
+        """
+        used = verify_attempt(
+            get_redis_client(),
+            [cls._key(otp.email, otp.otp_type)],
+            [str(otp.id), OTP_ALLOWED_ATTEMPTS, "1" if is_match else "0"],
+        )
+        return bool(used)
@@ -1,47 +1,46 @@
 from typing import Optional
-from datetime import timedelta
-from django.utils import timezone
-from django.db.models import F, Q
 from apps.authentication.models import OTPModel
-from apps.authentication.constants import OTP_EXPIRY_MINUTES
+from apps.authentication.constants import OTP_STORAGE_BACKEND, OTPStorageBackend
+from .otp_db_store import DatabaseOTPStore
+from .otp_redis_store import RedisOTPStore
+
+OTP_STORES = {
+    OTPStorageBackend.DATABASE: DatabaseOTPStore,
+    OTPStorageBackend.REDIS: RedisOTPStore,
+}
 
 
 class OTPRepository:
-    """Repository layer for OTP-related DB operations."""
+    """
+    Repository layer for OTP storage.
+
+    Delegates to the store selected by ``OTP_STORAGE_BACKEND``: rows of
+    the OTP table (``DatabaseOTPStore``) or Redis hashes that expire with
+    the OTP (``RedisOTPStore``).
+    """
+
+    store = OTP_STORES[OTPStorageBackend(OTP_STORAGE_BACKEND)]
 
-    @staticmethod
-    def create_otp(email: str, otp_type: str, salt: str, code_hash: str) -> OTPModel:
+    @classmethod
+    def create_otp(
+        cls, email: str, otp_type: str, salt: str, code_hash: str
+    ) -> OTPModel:
         """Create new OTP for email."""
-        qs = OTPModel.objects.create(
+        return cls.store.create_otp(
             email=email, otp_type=otp_type, salt=salt, code_hash=code_hash
         )
-        return qs
-
-    @staticmethod
-    def delete_expired_otp(email: str):
-        """Delete expired or used OTPs for email."""
-        OTPModel.objects.filter(email=email).filter(
-            Q(is_used=True)
-            | Q(created_at__lt=timezone.now() - timedelta(minutes=OTP_EXPIRY_MINUTES))
-        ).delete()
-
-    @staticmethod
-    def get_active_otp(email: str, otp_type) -> Optional[OTPModel]:
+
+    @classmethod
+    def delete_expired(cls, otp: OTPModel):
+        """Delete otp, which has expired, so a new one can take its place."""
+        cls.store.delete_expired(otp)
+
+    @classmethod
+    def get_active_otp(cls, email: str, otp_type) -> Optional[OTPModel]:
         """Get active OTP for email and otp_type."""
-        qs = OTPModel.objects.filter(
-            email=email, otp_type=otp_type, is_used=False
-        ).first()
-        return qs
-
-    @staticmethod
-    def increment_attempts(otp: OTPModel):
-        """Increment attempts by 1 for OTP."""
-        OTPModel.objects.filter(pk=otp.pk).update(attempts=F("attempts") + 1)
-        otp.refresh_from_db(fields=["attempts"])
-
-    @staticmethod
-    def mark_used(otp: OTPModel):
-        """Mark OTP as used."""
-        if not otp.is_used:
-            otp.is_used = True
-            otp.save(update_fields=["is_used"])
+        return cls.store.get_active_otp(email, otp_type)
+
+    @classmethod
+    def verify_attempt(cls, otp: OTPModel, is_match: bool) -> bool:
+        """Count a verification attempt of otp, True if it used otp up."""
+        return cls.store.verify_attempt(otp, is_match)
@@ -44,10 +44,7 @@ class OTPSelectors:
         4. checking if remaining attempts is greater than 0
         """
         # Check if code is correct
-        hashed_code = OTPSelectors.hash_code(code, otp.salt)
-        is_code_correct = hmac.compare_digest(hashed_code, otp.code_hash)
-
-        if not is_code_correct:
+        if not OTPSelectors.matches(otp, code):
             return False
 
         # Check if OTP is not used, expired, or has remaining attempts
@@ -58,6 +55,12 @@ class OTPSelectors:
         result = not is_used and not is_expired and remaining_attempts > 0
         return result
 
+    @staticmethod
+    def matches(otp: OTPModel, code: str) -> bool:
+        """Compare code with the OTP's code_hash in constant time."""
+        hashed_code = OTPSelectors.hash_code(code, otp.salt)
+        return hmac.compare_digest(hashed_code, otp.code_hash)
+
     @staticmethod
     def hash_code(code: str, salt: str) -> str:
         """
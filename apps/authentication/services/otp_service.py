@@ -1,12 +1,30 @@
+import time
+import logging
 import secrets
-from django.db import transaction
+from typing import Dict
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from rest_framework.exceptions import ValidationError
 
-from apps.mailer.tasks import send_email_async
+from apps.mailer.services import EmailOutboxService
 from apps.authentication.models import OTPModel
 from apps.authentication.selectors import OTPSelectors
-from apps.authentication.repositories import OTPRepository
-from apps.authentication.constants import OTP_LENGTH, OTPType, ENV_OTP_EXPIRY_MINUTES
+from apps.authentication.repositories import OTPRepository, DatabaseOTPStore
+from apps.authentication.constants import (
+    OTP_LENGTH,
+    OTP_PURGE_BATCH_SIZE,
+    OTP_SEND_LOCK_TIMEOUT,
+    OTP_SEND_WAIT_TIMEOUT,
+    OTPType,
+    ENV_OTP_EXPIRY_MINUTES,
+)
+
+logger = logging.getLogger("app.authentication.otp")
+
+# Held while an OTP is sent; duplicates read the sender's result by its token
+SEND_LOCK_KEY = "auth:otp:send:{otp_type}:{email}"
+SEND_RESULT_KEY = "auth:otp:send_result:{token}"
+SEND_POLL_INTERVAL = 0.05
 
 
 class OTPService:
@@ -21,12 +39,31 @@ class OTPService:
     """
 
     @staticmethod
-    @transaction.atomic
+    def _otp_exists() -> ValidationError:
+        return ValidationError(
+            {
+                "form": "An active OTP already exists. Please wait before requesting a new one."
+            },
+            code="otp_exists",
+        )
+
+    @staticmethod
+    def _unpack(result: Dict) -> OTPModel:
+        if "error" in result:
+            raise ValidationError(result["error"])
+        return result["otp"]
+
+    @staticmethod
     def send_otp(email: str, otp_type: OTPType) -> OTPModel:
         """
         Generates a new OTP, enforces existing cooldown limits,
         stores the OTP (salt + hashed code), and triggers the sending logic.
 
+        Concurrent calls for the same email and otp_type are single-flight:
+        the first one takes a cache lock and sends, the others touch
+        neither the database nor the broker and get its result (the same
+        OTP, or the same error).
+
         Args:
             email (str): Target email address for OTP.
             otp_type (OTPType): Purpose/type of OTP (REGISTER, LOGIN, etc.)
@@ -37,19 +74,55 @@ class OTPService:
         Returns:
             OTPModel: The newly created OTP database object.
         """
+        lock_key = SEND_LOCK_KEY.format(otp_type=otp_type, email=email)
+        token = secrets.token_hex(8)
+        if not cache.add(lock_key, token, timeout=OTP_SEND_LOCK_TIMEOUT):
+            return OTPService._await_send(lock_key)
+
+        try:
+            result = {"otp": OTPService._send_otp(email, otp_type)}
+        except ValidationError as e:
+            result = {"error": e.detail}
+        except IntegrityError:
+            # Raced a sender that did not see the lock (it had timed out)
+            result = {"error": OTPService._otp_exists().detail}
+        except Exception:
+            cache.delete(lock_key)
+            raise
+
+        cache.set(
+            SEND_RESULT_KEY.format(token=token),
+            result,
+            timeout=OTP_SEND_WAIT_TIMEOUT * 2,
+        )
+        cache.delete(lock_key)
+        return OTPService._unpack(result)
+
+    @staticmethod
+    def _await_send(lock_key: str) -> OTPModel:
+        """Wait for the in-flight send holding lock_key and return its result."""
+        token = cache.get(lock_key)
+        deadline = time.monotonic() + OTP_SEND_WAIT_TIMEOUT
+        while token is not None and time.monotonic() < deadline:
+            result = cache.get(SEND_RESULT_KEY.format(token=token))
+            if result is not None:
+                return OTPService._unpack(result)
+            time.sleep(SEND_POLL_INTERVAL)
+        raise OTPService._otp_exists()
 
-        # 1. Remove expired OTPs to keep DB clean
-        OTPRepository.delete_expired_otp(email)
+    @staticmethod
+    @transaction.atomic
+    def _send_otp(email: str, otp_type: OTPType) -> OTPModel:
+        """Create, store and queue a new OTP; the work behind ``send_otp``."""
 
-        # 2. Check if a usable OTP already exists
+        # 1. Check if a usable OTP already exists
         pending_otp = OTPRepository.get_active_otp(email, otp_type)
         if pending_otp and not OTPSelectors.is_expired(pending_otp):
-            raise ValidationError(
-                {
-                    "form": "An active OTP already exists. Please wait before requesting a new one."
-                },
-                code="otp_exists",
-            )
+            raise OTPService._otp_exists()
+
+        # 2. Drop an expired one (other stale OTPs are purged periodically)
+        if pending_otp:
+            OTPRepository.delete_expired(pending_otp)
 
         # 3. Generate new OTP
         otp_code = f"{secrets.randbelow(10 ** OTP_LENGTH):0{OTP_LENGTH}d}"
@@ -57,7 +130,23 @@ class OTPService:
         otp_salt = secrets.token_hex(16)
         otp_hash = OTPSelectors.hash_code(otp_code, otp_salt)
 
-        # 4. Save OTP in repository
+        # 4. Queue the email in the same transaction, the outbox relay
+        # publishes it to Celery once the transaction is committed
+        EmailOutboxService.enqueue(
+            template_slug="otp-verification",
+            recipient_email=email,
+            recipient_name=email,
+            context={
+                "name": email,
+                "otp_code": otp_code,
+                "expiry_minutes": ENV_OTP_EXPIRY_MINUTES,
+                "site_name": "Online Menu",
+                "support_email": "support@example.com",
+            },
+        )
+
+        # 5. Save OTP in repository, last: the Redis store is not rolled
+        # back with the transaction, so nothing may fail after it
         otp_instance = OTPRepository.create_otp(
             email=email,
             otp_type=otp_type,
@@ -70,29 +159,18 @@ class OTPService:
         # print(f"Code:  {otp_code}")
         # print("====================================\n")
 
-        # Send single email asynchronously
-        send_email_async.delay(
-            template_slug="otp-verification",
-            recipient_email=otp_instance.email,
-            recipient_name=otp_instance.email,
-            context={
-                "name": otp_instance.email,
-                "otp_code": otp_code,
-                "expiry_minutes": ENV_OTP_EXPIRY_MINUTES,
-                "site_name": "Online Menu",
-                "support_email": "support@example.com",
-            },
-        )  # type: ignore
-
         return otp_instance
 
     @staticmethod
-    @transaction.atomic
     def verify_otp(email: str, code: str, otp_type: OTPType) -> bool:
         """
         Validates an OTP against the stored hashed code, enforcing
         expiration rules and incrementing attempt counters.
 
+        Costs one read and one conditional write; the write only succeeds
+        while the OTP is unused, unexpired and has attempts left, so a
+        code cannot be used twice by concurrent requests.
+
         Args:
             email (str): Email that OTP was sent to.
             code (str): Code provided by the user.
@@ -107,14 +185,30 @@ class OTPService:
         if not pending_otp:
             return False
 
-        # 2. Increase attempt count (stored in DB)
-        OTPRepository.increment_attempts(pending_otp)
+        # 2. Compare the code with the stored hash
+        is_match = OTPSelectors.matches(pending_otp, code)
 
-        # 3. Check validity
-        is_valid = OTPSelectors.is_valid(pending_otp, code)
+        # 3. Count the attempt, using the OTP up if the code matched
+        return OTPRepository.verify_attempt(pending_otp, is_match)
 
-        if is_valid:
-            OTPRepository.mark_used(pending_otp)
-            return True
+    @staticmethod
+    def purge_expired(batch_size: int = OTP_PURGE_BATCH_SIZE) -> int:
+        """
+        Delete expired and used OTPs from the OTP table in batches.
+
+        Every batch is its own short DELETE, so sends and verifications
+        are never blocked for long.
 
-        return False
+        Returns:
+            int: Number of OTPs deleted.
+        """
+        purged = 0
+        while True:
+            deleted = DatabaseOTPStore.purge_expired(batch_size)
+            purged += deleted
+            if deleted < batch_size:
+                break
+
+        if purged:
+            logger.info(f"Purged {purged} expired or used OTPs")
+        return purged
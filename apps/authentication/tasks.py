@@ -0,0 +1,11 @@
+from celery import shared_task
+
+from apps.authentication.services import OTPService
+
+
+@shared_task
+def purge_expired_otps_async():
+    """
+    Periodic Celery task that deletes expired and used OTPs.
+    """
+    return OTPService.purge_expired()
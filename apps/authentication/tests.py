@@ -0,0 +1,289 @@
+import threading
+from datetime import timedelta
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.exceptions import ValidationError
+
+from config.env import ENV_REDIS_URL
+from apps.common.redis_client import LOCAL_REDIS_URL, get_redis_client
+from apps.mailer.models import EmailOutboxModel
+from apps.authentication.models import OTPModel
+from apps.authentication.selectors import OTPSelectors
+from apps.authentication.repositories import (
+    OTPRepository,
+    DatabaseOTPStore,
+    RedisOTPStore,
+)
+from apps.authentication.services import OTPService
+from apps.authentication.services.otp_service import (
+    SEND_LOCK_KEY,
+    SEND_RESULT_KEY,
+)
+from apps.authentication.constants import OTP_ALLOWED_ATTEMPTS, OTPType
+
+EMAIL = "guest@example.com"
+LOCMEM_CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+
+def sent_code(email: str = EMAIL) -> str:
+    """Return the code of the last OTP email queued for email."""
+    entry = EmailOutboxModel.objects.filter(recipient_email=email).last()
+    return entry.context["otp_code"]
+
+
+class OTPStoreTests:
+    """
+    Send and verify rules every OTP store must follow.
+
+    Mixed into one ``TestCase`` per store, which sets ``store``.
+    """
+
+    store = None
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(OTPRepository, "store", self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def create_otp(self, code: str = "123456") -> OTPModel:
+        salt = "salt"
+        return OTPRepository.create_otp(
+            email=EMAIL,
+            otp_type=OTPType.LOGIN,
+            salt=salt,
+            code_hash=OTPSelectors.hash_code(code, salt),
+        )
+
+    def test_send_otp_stores_otp_and_queues_its_email(self):
+        otp = OTPService.send_otp(EMAIL, OTPType.LOGIN)
+
+        active = OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN)
+        self.assertEqual(active.id, otp.id)
+        self.assertTrue(OTPSelectors.matches(active, sent_code()))
+
+    def test_send_otp_rejects_duplicate(self):
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+
+        with self.assertRaises(ValidationError) as ctx:
+            OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        self.assertEqual(ctx.exception.get_codes(), {"form": "otp_exists"})
+        self.assertEqual(EmailOutboxModel.objects.count(), 1)
+
+    def test_send_otp_allows_other_otp_type(self):
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        OTPService.send_otp(EMAIL, OTPType.RESET_PASSWORD)
+
+        self.assertEqual(EmailOutboxModel.objects.count(), 2)
+
+    def test_create_otp_raises_integrity_error_on_duplicate(self):
+        self.create_otp()
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.create_otp()
+
+    def test_failed_enqueue_stores_no_otp(self):
+        with mock.patch(
+            "apps.authentication.services.otp_service.EmailOutboxService.enqueue",
+            side_effect=RuntimeError("outbox unavailable"),
+        ):
+            with self.assertRaises(RuntimeError):
+                OTPService.send_otp(EMAIL, OTPType.LOGIN)
+
+        self.assertIsNone(OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN))
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+
+    def test_verify_otp_accepts_code_once(self):
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        code = sent_code()
+
+        self.assertTrue(OTPService.verify_otp(EMAIL, code, OTPType.LOGIN))
+        self.assertFalse(OTPService.verify_otp(EMAIL, code, OTPType.LOGIN))
+
+    def test_verify_otp_accepts_code_on_last_allowed_attempt(self):
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        code = sent_code()
+        wrong = "x" * len(code)
+
+        for _ in range(OTP_ALLOWED_ATTEMPTS - 1):
+            self.assertFalse(OTPService.verify_otp(EMAIL, wrong, OTPType.LOGIN))
+
+        otp = OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN)
+        self.assertEqual(otp.attempts, OTP_ALLOWED_ATTEMPTS - 1)
+        self.assertTrue(OTPService.verify_otp(EMAIL, code, OTPType.LOGIN))
+
+    def test_verify_otp_rejects_code_after_max_attempts(self):
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        code = sent_code()
+        wrong = "x" * len(code)
+
+        for _ in range(OTP_ALLOWED_ATTEMPTS):
+            self.assertFalse(OTPService.verify_otp(EMAIL, wrong, OTPType.LOGIN))
+        self.assertFalse(OTPService.verify_otp(EMAIL, code, OTPType.LOGIN))
+
+    def test_verify_otp_without_otp(self):
+        self.assertFalse(OTPService.verify_otp(EMAIL, "123456", OTPType.LOGIN))
+
+    def test_verify_attempt_uses_otp_up_once_for_concurrent_readers(self):
+        # Both requests read the OTP before either one writes
+        self.create_otp()
+        first = OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN)
+        second = OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN)
+
+        self.assertTrue(OTPRepository.verify_attempt(first, True))
+        self.assertFalse(OTPRepository.verify_attempt(second, True))
+
+    def test_verify_otp_uses_code_once_for_concurrent_correct_attempts(self):
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        code = sent_code()
+        # Both requests read the OTP before either one writes
+        read = OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN)
+        with mock.patch.object(
+            OTPRepository.store, "get_active_otp", return_value=read
+        ):
+            results = [
+                OTPService.verify_otp(EMAIL, code, OTPType.LOGIN) for _ in range(2)
+            ]
+
+        self.assertEqual(results, [True, False])
+
+    def test_verify_attempt_stops_at_max_for_concurrent_readers(self):
+        self.create_otp()
+        readers = [
+            OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN)
+            for _ in range(OTP_ALLOWED_ATTEMPTS + 1)
+        ]
+
+        for otp in readers[:-1]:
+            self.assertFalse(OTPRepository.verify_attempt(otp, False))
+        self.assertFalse(OTPRepository.verify_attempt(readers[-1], True))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class DatabaseOTPStoreTests(OTPStoreTests, TestCase):
+    store = DatabaseOTPStore
+
+    def test_verify_attempt_rejects_expired_otp(self):
+        otp = self.create_otp()
+        OTPModel.objects.filter(pk=otp.pk).update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
+
+        self.assertFalse(OTPRepository.verify_attempt(otp, True))
+
+    def test_send_otp_replaces_expired_otp(self):
+        otp = self.create_otp()
+        OTPModel.objects.filter(pk=otp.pk).update(
+            created_at=timezone.now() - timedelta(days=1)
+        )
+
+        new_otp = OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        self.assertNotEqual(new_otp.id, otp.id)
+        self.assertFalse(OTPModel.objects.filter(pk=otp.pk).exists())
+
+
+@skipUnless(
+    ENV_REDIS_URL.startswith(LOCAL_REDIS_URL),
+    "Run with REDIS_URL=local:// to test the Redis store",
+)
+@override_settings(CACHES=LOCMEM_CACHES)
+class RedisOTPStoreTests(OTPStoreTests, TestCase):
+    store = RedisOTPStore
+
+    def setUp(self):
+        super().setUp()
+        get_redis_client().flushall()
+
+    def test_verify_otp_deletes_used_otp(self):
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
+
+        self.assertTrue(OTPService.verify_otp(EMAIL, sent_code(), OTPType.LOGIN))
+        self.assertIsNone(OTPRepository.get_active_otp(EMAIL, OTPType.LOGIN))
+        self.assertFalse(OTPModel.objects.exists())
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class OTPSendSingleFlightTests(TestCase):
+    """Concurrent ``send_otp`` calls for one email share one send."""
+
+    lock_key = SEND_LOCK_KEY.format(otp_type=OTPType.LOGIN, email=EMAIL)
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(OTPRepository, "store", DatabaseOTPStore)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_duplicate_send_gets_result_of_send_in_flight(self):
+        send_otp = OTPService._send_otp
+        await_send = OTPService._await_send
+        waiting = threading.Event()
+        threads, duplicate = [], {}
+
+        def wait_for_send(lock_key):
+            waiting.set()
+            return await_send(lock_key)
+
+        def send_duplicate():
+            try:
+                duplicate["otp"] = OTPService.send_otp(EMAIL, OTPType.LOGIN)
+            except Exception as e:
+                duplicate["error"] = e
+
+        def send_with_duplicate(email, otp_type):
+            # The duplicate arrives while this send holds the lock
+            threads.append(threading.Thread(target=send_duplicate))
+            threads[0].start()
+            waiting.wait(timeout=5)
+            return send_otp(email, otp_type)
+
+        with mock.patch.object(
+            OTPService, "_await_send", staticmethod(wait_for_send)
+        ), mock.patch.object(
+            OTPService, "_send_otp", staticmethod(send_with_duplicate)
+        ):
+            otp = OTPService.send_otp(EMAIL, OTPType.LOGIN)
+            threads[0].join(timeout=5)
+
+        self.assertEqual(duplicate, {"otp": otp})
+        self.assertEqual(OTPModel.objects.count(), 1)
+        self.assertEqual(EmailOutboxModel.objects.count(), 1)
+        self.assertIsNone(cache.get(self.lock_key))
+
+    def test_duplicate_send_gets_error_of_send_in_flight(self):
+        error = OTPService._otp_exists().detail
+        cache.set(self.lock_key, "token")
+        cache.set(SEND_RESULT_KEY.format(token="token"), {"error": error})
+
+        with self.assertRaises(ValidationError) as ctx:
+            OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        self.assertEqual(ctx.exception.detail, error)
+        self.assertFalse(EmailOutboxModel.objects.exists())
+
+    @mock.patch(
+        "apps.authentication.services.otp_service.OTP_SEND_WAIT_TIMEOUT", 0.1
+    )
+    def test_duplicate_send_without_result_reports_existing_otp(self):
+        cache.set(self.lock_key, "token")
+
+        with self.assertRaises(ValidationError) as ctx:
+            OTPService.send_otp(EMAIL, OTPType.LOGIN)
+        self.assertEqual(ctx.exception.get_codes(), {"form": "otp_exists"})
+        self.assertFalse(OTPModel.objects.exists())
+
+    def test_failed_send_releases_lock(self):
+        with mock.patch(
+            "apps.authentication.services.otp_service.EmailOutboxService.enqueue",
+            side_effect=RuntimeError("outbox unavailable"),
+        ):
+            with self.assertRaises(RuntimeError):
+                OTPService.send_otp(EMAIL, OTPType.LOGIN)
+
+        self.assertIsNone(cache.get(self.lock_key))
+        OTPService.send_otp(EMAIL, OTPType.LOGIN)
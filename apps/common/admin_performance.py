@@ -0,0 +1,247 @@
+from datetime import timedelta
+from typing import Optional
+
+from django.contrib import admin
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.functional import cached_property
+from django.contrib.admin.options import ShowFacets
+from django.contrib.admin.views.main import ChangeList, ORDER_VAR
+
+# Query string parameter holding the keyset cursor of the current page
+CURSOR_VAR = "after"
+CURSOR_SEPARATOR = "|"
+
+# Rows counted exactly before the paginator falls back to an estimate
+MAX_EXACT_COUNT = 10000
+
+# Planner row estimates of a whole table, per database vendor
+TABLE_ESTIMATE_SQL = {
+    "postgresql": "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+    "mysql": (
+        "SELECT TABLE_ROWS FROM information_schema.TABLES "
+        "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s"
+    ),
+}
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator whose count stays cheap on very large tables.
+
+    At most ``MAX_EXACT_COUNT`` rows are counted. Beyond that an
+    unfiltered list reports the planner's row estimate of the table and
+    a filtered one reports the cap (``is_capped`` is then True).
+    """
+
+    is_capped = False
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        counted = queryset.order_by()[: MAX_EXACT_COUNT + 1].count()
+        if counted <= MAX_EXACT_COUNT:
+            return counted
+
+        if not queryset.query.where:
+            estimate = self._table_estimate(queryset)
+            if estimate is not None and estimate > MAX_EXACT_COUNT:
+                return estimate
+        self.is_capped = True
+        return MAX_EXACT_COUNT
+
+    @staticmethod
+    def _table_estimate(queryset) -> Optional[int]:
+        connection = connections[queryset.db]
+        sql = TABLE_ESTIMATE_SQL.get(connection.vendor)
+        if sql is None:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [queryset.model._meta.db_table])
+            row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else None
+
+
+class KeysetChangeList(ChangeList):
+    """
+    Change list paged by a (keyset_field, pk) cursor instead of OFFSET.
+
+    While the list keeps its default newest-first order every page is
+    one indexed range scan, however deep it is, and links to the next
+    (older) page. Sorting by a column falls back to numbered pages with
+    an estimated count.
+    """
+
+    def __init__(self, request, *args, **kwargs):
+        # The cursor is not a field lookup, keep it away from the filters
+        request.GET = request.GET.copy()
+        self.cursor_value = request.GET.pop(CURSOR_VAR, [""])[-1]
+        self.keyset = ORDER_VAR not in request.GET
+        self.keyset_next_url = None
+        self.keyset_first_url = None
+        self.result_count_capped = False
+        super().__init__(request, *args, **kwargs)
+
+    @cached_property
+    def cursor(self):
+        """
+        The (position, pk) the page starts after, None if there is none.
+
+        A malformed cursor, e.g. a hand-edited URL, is dropped and the
+        first page is shown.
+        """
+        value, _, pk = self.cursor_value.partition(CURSOR_SEPARATOR)
+        if not value or not pk:
+            return None
+        try:
+            position = parse_datetime(value)
+            pk = self.model._meta.pk.to_python(pk)
+        except (ValueError, ValidationError):
+            return None
+        return (position, pk) if position and pk is not None else None
+
+    @property
+    def keyset_field(self) -> str:
+        return self.model_admin.keyset_field
+
+    def get_ordering(self, request, queryset):
+        if self.keyset:
+            return [f"-{self.keyset_field}", "-pk"]
+        return super().get_ordering(request, queryset)
+
+    def get_queryset(self, request, exclude_parameters=None):
+        queryset = super().get_queryset(request, exclude_parameters)
+        if self.keyset and self.cursor is not None:
+            position, pk = self.cursor
+            queryset = queryset.filter(
+                Q(**{f"{self.keyset_field}__lt": position})
+                | Q(**{self.keyset_field: position, "pk__lt": pk})
+            )
+        return queryset
+
+    def get_results(self, request):
+        if not self.keyset:
+            super().get_results(request)
+            self.result_count_capped = getattr(self.paginator, "is_capped", False)
+            return
+
+        paginator = self.model_admin.get_paginator(
+            request, self.queryset, self.list_per_page
+        )
+        rows = list(self.queryset[: self.list_per_page + 1])
+        result_list = rows[: self.list_per_page]
+
+        if len(rows) > self.list_per_page:
+            last = result_list[-1]
+            cursor = "{}{}{}".format(
+                getattr(last, self.keyset_field).isoformat(),
+                CURSOR_SEPARATOR,
+                last.pk,
+            )
+            self.keyset_next_url = self.get_query_string({CURSOR_VAR: cursor})
+        if self.cursor is not None:
+            self.keyset_first_url = self.get_query_string()
+
+        # Count only on the first page, deeper pages show no total
+        self.result_count = paginator.count if self.cursor is None else len(result_list)
+        self.result_count_capped = getattr(paginator, "is_capped", False)
+        self.show_full_result_count = False
+        self.show_admin_actions = True
+        self.full_result_count = None
+        self.result_list = result_list
+        self.can_show_all = False
+        self.multi_page = False
+        self.paginator = paginator
+
+
+class RecentWindowFilter(admin.SimpleListFilter):
+    """
+    Limits the change list to a recent time window unless "All time" is picked.
+
+    Filters on the admin's ``recent_window_field`` and starts at its
+    ``recent_window_default``, so the first page load never scans the
+    whole table.
+    """
+
+    title = "created"
+    parameter_name = "window"
+
+    WINDOWS = {
+        "24h": ("Last 24 hours", timedelta(hours=24)),
+        "7d": ("Last 7 days", timedelta(days=7)),
+        "30d": ("Last 30 days", timedelta(days=30)),
+        "all": ("All time", None),
+    }
+
+    def __init__(self, request, params, model, model_admin):
+        self.model_admin = model_admin
+        super().__init__(request, params, model, model_admin)
+
+    def lookups(self, request, model_admin):
+        return [(key, label) for key, (label, _) in self.WINDOWS.items()]
+
+    def value(self):
+        value = super().value()
+        if value not in self.WINDOWS:
+            return self.model_admin.recent_window_default
+        return value
+
+    def choices(self, changelist):
+        for lookup, title in self.lookup_choices:
+            yield {
+                "selected": self.value() == lookup,
+                "query_string": changelist.get_query_string(
+                    {self.parameter_name: lookup}
+                ),
+                "display": title,
+            }
+
+    def queryset(self, request, queryset):
+        window = self.WINDOWS[self.value()][1]
+        if window is None:
+            return queryset
+        field = self.model_admin.recent_window_field
+        return queryset.filter(**{f"{field}__gte": timezone.now() - window})
+
+
+class AdminPerformanceMixin:
+    """
+    ModelAdmin mixin for change lists over very large tables.
+
+    - counts are capped or estimated (``EstimatedCountPaginator``), and
+      the unfiltered total and facet counts are never computed
+    - pages are walked by a keyset cursor on ``keyset_field``
+    - ``search_fields`` are matched as case sensitive prefixes, which an
+      index on the column can serve (``varchar_pattern_ops`` on PostgreSQL)
+    - ``RecentWindowFilter`` (put it in ``list_filter``) limits the list
+      to ``recent_window_default`` until another window is picked
+
+    Avoid ``date_hierarchy``, its drill-down runs aggregates over the
+    whole filtered table.
+    """
+
+    keyset_field = "created_at"
+    recent_window_field = "created_at"
+    recent_window_default = "7d"
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    show_facets = ShowFacets.NEVER
+
+    def get_changelist(self, request, **kwargs):
+        return KeysetChangeList
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        search_fields = self.get_search_fields(request)
+        if not search_term or not search_fields:
+            return queryset, False
+
+        condition = Q()
+        for field in search_fields:
+            condition |= Q(**{f"{field.lstrip('^=@')}__startswith": search_term})
+        return queryset.filter(condition), False
@@ -0,0 +1,164 @@
+import time
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+import redis
+
+from config.env import ENV_REDIS_URL
+
+LOCAL_REDIS_URL = "local://"
+
+
+class LocalRedis:
+    """
+    In-process stand-in for Redis, used in tests and local development.
+
+    Implements the small subset of commands the project relies on.
+    Atomic scripts do not run Lua here: ``AtomicScript`` runs their Python
+    equivalent while holding ``lock``.
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._data: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+
+    @staticmethod
+    def time() -> float:
+        """Current time in seconds (Redis ``TIME``)."""
+        return time.time()
+
+    def _alive(self, key: str) -> bool:
+        deadline = self._expires.get(key)
+        if deadline is not None and deadline <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return key in self._data
+
+    def get(self, key: str) -> Any:
+        with self.lock:
+            return self._data.get(key) if self._alive(key) else None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        px: Optional[int] = None,
+        ex: Optional[int] = None,
+        nx: bool = False,
+    ) -> bool:
+        with self.lock:
+            if nx and self._alive(key):
+                return False
+            self._data[key] = value
+            self._expires.pop(key, None)
+            if px is not None or ex is not None:
+                self.pexpire(key, px if px is not None else ex * 1000)
+            return True
+
+    def delete(self, *keys: str) -> int:
+        with self.lock:
+            deleted = 0
+            for key in keys:
+                if self._alive(key):
+                    deleted += 1
+                self._data.pop(key, None)
+                self._expires.pop(key, None)
+            return deleted
+
+    def exists(self, key: str) -> int:
+        with self.lock:
+            return int(self._alive(key))
+
+    def hgetall(self, key: str) -> Dict[str, Any]:
+        with self.lock:
+            return dict(self._data.get(key, {})) if self._alive(key) else {}
+
+    def hset(self, key: str, mapping: Dict[str, Any]) -> int:
+        with self.lock:
+            current = self._data.get(key) if self._alive(key) else None
+            if current is None:
+                current = self._data[key] = {}
+            added = len(set(mapping) - set(current))
+            current.update(mapping)
+            return added
+
+    def hsetnx(self, key: str, field: str, value: Any) -> int:
+        with self.lock:
+            current = self._data.get(key) if self._alive(key) else None
+            if current is None:
+                current = self._data[key] = {}
+            if field in current:
+                return 0
+            current[field] = value
+            return 1
+
+    def pexpire(self, key: str, milliseconds: int) -> bool:
+        with self.lock:
+            if not self._alive(key):
+                return False
+            self._expires[key] = time.monotonic() + milliseconds / 1000
+            return True
+
+    def pttl(self, key: str) -> int:
+        with self.lock:
+            if not self._alive(key):
+                return -2
+            deadline = self._expires.get(key)
+            if deadline is None:
+                return -1
+            return max(0, int((deadline - time.monotonic()) * 1000))
+
+    def flushall(self) -> None:
+        with self.lock:
+            self._data.clear()
+            self._expires.clear()
+
+
+class AtomicScript:
+    """
+    A Lua script paired with an equivalent Python implementation.
+
+    On a real Redis the Lua source is run with EVALSHA. On ``LocalRedis``
+    the Python callable ``local(client, keys, args)`` is run under the
+    client's lock, which gives the same atomicity in a single process.
+    """
+
+    def __init__(self, lua: str, local: Callable[[LocalRedis, List, List], Any]):
+        self.lua = lua
+        self.local = local
+        self._scripts: Dict[int, Any] = {}
+
+    def __call__(self, client, keys: List, args: List) -> Any:
+        if isinstance(client, LocalRedis):
+            with client.lock:
+                return self.local(client, keys, args)
+
+        script = self._scripts.get(id(client))
+        if script is None:
+            script = self._scripts[id(client)] = client.register_script(self.lua)
+        return script(keys=keys, args=args)
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_redis_client():
+    """
+    Return the shared Redis client configured by ``REDIS_URL``.
+
+    ``local://`` returns a process-wide ``LocalRedis`` instead.
+    """
+    global _client
+
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if ENV_REDIS_URL.startswith(LOCAL_REDIS_URL):
+                    _client = LocalRedis()
+                else:
+                    _client = redis.Redis.from_url(
+                        ENV_REDIS_URL, decode_responses=True
+                    )
+    return _client
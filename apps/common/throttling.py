@@ -0,0 +1,89 @@
+import logging
+import math
+from rest_framework import throttling
+
+from apps.common.redis_client import AtomicScript, get_redis_client
+
+logger = logging.getLogger("app.common.throttling")
+
+# KEYS: the throttle key. ARGV: emission interval and burst tolerance (ms).
+# Generic cell rate algorithm: the key holds the theoretical arrival time
+# of the next request. Returns 0 if the request is allowed (and moves that
+# time on by one interval), else the milliseconds until it would be.
+GCRA_LUA = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local interval = tonumber(ARGV[1])
+local tolerance = tonumber(ARGV[2])
+local tat = math.max(tonumber(redis.call("GET", KEYS[1])) or now, now)
+local wait = tat + interval - tolerance - now
+if wait > 0 then
+    return math.ceil(wait)
+end
+tat = tat + interval
+redis.call("SET", KEYS[1], tostring(tat), "PX", math.ceil(tat - now))
+return 0
+"""
+
+
+def _gcra_local(client, keys, args):
+    now = int(client.time() * 1000)
+    interval, tolerance = float(args[0]), float(args[1])
+    tat = max(float(client.get(keys[0]) or now), now)
+    wait = tat + interval - tolerance - now
+    if wait > 0:
+        return math.ceil(wait)
+    client.set(keys[0], repr(tat + interval), px=math.ceil(tat + interval - now))
+    return 0
+
+
+gcra = AtomicScript(GCRA_LUA, _gcra_local)
+
+
+class GCRARateThrottle(throttling.SimpleRateThrottle):
+    """
+    Rate throttle shared by every worker and node.
+
+    Instead of a request history in the local cache, each key is one
+    Redis value (the GCRA theoretical arrival time) updated by an atomic
+    script: a rate of ``N/period`` allows bursts of N requests and then
+    one request every period / N. If Redis cannot be reached requests
+    are let through rather than failed.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        interval = self.duration * 1000 / self.num_requests
+        try:
+            wait_ms = gcra(
+                get_redis_client(),
+                [self.key],
+                [repr(interval), repr(interval * self.num_requests)],
+            )
+        except Exception as e:
+            logger.warning(f"Throttle {self.key} not checked: {e}")
+            return True
+
+        self.wait_seconds = int(wait_ms) / 1000
+        return not self.wait_seconds
+
+    def wait(self):
+        return getattr(self, "wait_seconds", None)
+
+
+class AnonRateThrottle(throttling.AnonRateThrottle, GCRARateThrottle):
+    """``anon`` rate per client IP of anonymous requests."""
+
+
+class UserRateThrottle(throttling.UserRateThrottle, GCRARateThrottle):
+    """``user`` rate per user (per IP when anonymous)."""
+
+
+class ScopedRateThrottle(throttling.ScopedRateThrottle, GCRARateThrottle):
+    """Rate of the view's ``throttle_scope`` per user or IP."""
@@ -1,2 +1,7 @@
 from .email_log_admin import EmailLogAdmin
 from .email_template_admin import EmailTemplateAdmin
+from .email_campaign_admin import EmailCampaignAdmin
+from .email_outbox_admin import EmailOutboxAdmin
+from .email_stats_admin import EmailStatsAdmin
+from .email_context_value_admin import EmailContextValueAdmin
+from .email_dead_letter_admin import EmailDeadLetterAdmin
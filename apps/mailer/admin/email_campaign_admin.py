@@ -0,0 +1,55 @@
+from django.contrib import admin
+from apps.mailer.models import EmailCampaignModel
+
+
+@admin.register(EmailCampaignModel)
+class EmailCampaignAdmin(admin.ModelAdmin):
+    """Admin interface for EmailCampaign progress."""
+
+    list_display = [
+        "template_slug",
+        "status",
+        "total",
+        "queued_display",
+        "sent",
+        "failed",
+        "finished_at",
+        "created_at",
+    ]
+    list_filter = ["status", "created_at"]
+    search_fields = ["template_slug"]
+    readonly_fields = [
+        "template_slug",
+        "context",
+        "status",
+        "total",
+        "queued_display",
+        "sent",
+        "failed",
+        "chunk_size",
+        "finished_at",
+        "updated_at",
+        "created_at",
+    ]
+
+    fieldsets = (
+        ("Campaign", {"fields": ("template_slug", "status", "context")}),
+        (
+            "Progress",
+            {"fields": ("total", "queued_display", "sent", "failed", "chunk_size")},
+        ),
+        (
+            "Timestamps",
+            {"fields": ("finished_at", "created_at", "updated_at")},
+        ),
+    )
+
+    def has_add_permission(self, request):
+        """Campaigns are created by send_bulk_emails_async."""
+        return False
+
+    def queued_display(self, obj):
+        """Recipients not processed yet."""
+        return obj.queued
+
+    queued_display.short_description = "Queued"
@@ -0,0 +1,20 @@
+from django.contrib import admin
+from apps.mailer.models import EmailContextValueModel
+
+
+@admin.register(EmailContextValueModel)
+class EmailContextValueAdmin(admin.ModelAdmin):
+    """Admin interface for shared EmailContextValues."""
+
+    list_display = ["name", "value", "created_at"]
+    list_filter = ["name"]
+    search_fields = ["name"]
+    readonly_fields = ["name", "value", "digest", "created_at"]
+
+    def has_add_permission(self, request):
+        """Values are created by the mailer."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Values are referenced by email logs and must not change."""
+        return False
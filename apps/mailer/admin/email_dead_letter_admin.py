@@ -0,0 +1,29 @@
+from django.contrib import admin
+from apps.mailer.models import EmailDeadLetterModel
+
+
+@admin.register(EmailDeadLetterModel)
+class EmailDeadLetterAdmin(admin.ModelAdmin):
+    """Admin interface for rejected send requests (EmailDeadLetters)."""
+
+    list_display = ["recipient_email", "template_slug", "reason", "created_at"]
+    list_filter = ["reason", "template_slug"]
+    search_fields = ["recipient_email"]
+    readonly_fields = [
+        "template_slug",
+        "recipient_email",
+        "recipient_name",
+        "reason",
+        "missing_variables",
+        "context_keys",
+        "idempotency_key",
+        "created_at",
+    ]
+
+    def has_add_permission(self, request):
+        """Entries are created by EmailDeadLetterService."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Entries are a record of rejected requests."""
+        return False
@@ -1,11 +1,13 @@
 from django.contrib import admin
 from django.urls import reverse
 from django.utils.html import format_html
+from apps.common.admin_performance import AdminPerformanceMixin, RecentWindowFilter
 from apps.mailer.models import EmailLogModel
+from apps.mailer.services import ContextStorageService
 
 
 @admin.register(EmailLogModel)
-class EmailLogAdmin(admin.ModelAdmin):
+class EmailLogAdmin(AdminPerformanceMixin, admin.ModelAdmin):
     """Admin interface for EmailLog."""
 
     list_display = [
@@ -16,15 +18,20 @@ class EmailLogAdmin(admin.ModelAdmin):
         "sent_at",
         "created_at",
     ]
-    list_filter = ["status", "created_at", "sent_at"]
-    search_fields = ["recipient_email", "recipient_name", "subject"]
+    list_filter = [RecentWindowFilter, "status", "sent_at"]
+    search_fields = ["recipient_email"]
+    search_help_text = "Recipient email starting with the search term"
     readonly_fields = [
         "template",
         "recipient_email",
         "recipient_name",
         "subject",
         "context_data",
+        "full_context",
         "error_message",
+        "retry_count",
+        "next_retry_at",
+        "idempotency_key",
         "sent_at",
         "opened_at",
         "clicked_at",
@@ -36,10 +43,29 @@ class EmailLogAdmin(admin.ModelAdmin):
         ("Recipient Information", {"fields": ("recipient_email", "recipient_name")}),
         (
             "Email Details",
-            {"fields": ("template", "subject", "status", "context_data")},
+            {
+                "fields": (
+                    "template",
+                    "subject",
+                    "status",
+                    "context_data",
+                    "full_context",
+                )
+            },
         ),
         ("Tracking", {"fields": ("sent_at", "opened_at", "clicked_at")}),
-        ("Error Information", {"fields": ("error_message",), "classes": ("collapse",)}),
+        (
+            "Error Information",
+            {
+                "fields": (
+                    "error_message",
+                    "retry_count",
+                    "next_retry_at",
+                    "idempotency_key",
+                ),
+                "classes": ("collapse",),
+            },
+        ),
         (
             "Timestamps",
             {"fields": ("created_at", "updated_at"), "classes": ("collapse",)},
@@ -54,6 +80,12 @@ class EmailLogAdmin(admin.ModelAdmin):
         """Allow deletion for cleanup."""
         return True
 
+    def full_context(self, obj):
+        """Stored context with shared values filled back in."""
+        return ContextStorageService.expand(obj.context_data)
+
+    full_context.short_description = "Full context"
+
     def template_link(self, obj):
         """Link to the associated template."""
         if obj.template:
@@ -0,0 +1,31 @@
+from django.contrib import admin
+from apps.mailer.models import EmailOutboxModel
+
+
+@admin.register(EmailOutboxModel)
+class EmailOutboxAdmin(admin.ModelAdmin):
+    """Admin interface for entries waiting in the EmailOutbox."""
+
+    list_display = [
+        "recipient_email",
+        "template_slug",
+        "attempts",
+        "available_at",
+        "created_at",
+    ]
+    list_filter = ["template_slug"]
+    search_fields = ["recipient_email"]
+    exclude = ["context"]
+    readonly_fields = [
+        "template_slug",
+        "recipient_email",
+        "recipient_name",
+        "attempts",
+        "last_error",
+        "available_at",
+        "created_at",
+    ]
+
+    def has_add_permission(self, request):
+        """Entries are created by EmailOutboxService."""
+        return False
@@ -0,0 +1,21 @@
+from django.contrib import admin
+from apps.mailer.models import EmailStatsModel
+
+
+@admin.register(EmailStatsModel)
+class EmailStatsAdmin(admin.ModelAdmin):
+    """Admin interface for hourly EmailStats."""
+
+    list_display = ["hour", "template_slug", "status", "count"]
+    list_filter = ["status", "template_slug"]
+    search_fields = ["template_slug"]
+    date_hierarchy = "hour"
+    readonly_fields = ["template_slug", "status", "hour", "count", "updated_at"]
+
+    def has_add_permission(self, request):
+        """Statistics are maintained by the mailer."""
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        """Statistics are read-only."""
+        return False
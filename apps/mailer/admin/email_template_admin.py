@@ -11,26 +11,50 @@ class EmailTemplateAdmin(admin.ModelAdmin):
     list_display = [
         "name",
         "slug",
+        "language",
         "template_type",
         "is_active",
         "updated_at",
         "created_at",
         # "preview_button",
     ]
-    list_filter = ["template_type", "is_active", "created_at"]
+    list_filter = ["language", "template_type", "is_active", "created_at"]
     search_fields = ["name", "slug", "subject"]
-    readonly_fields = ["created_at", "updated_at"]
+    readonly_fields = [
+        "variables",
+        "required_variables",
+        "created_at",
+        "updated_at",
+    ]
     prepopulated_fields = {"slug": ("name",)}
 
     fieldsets = (
         (
             "Basic Information",
-            {"fields": ("name", "slug", "template_type", "is_active")},
+            {
+                "fields": (
+                    "name",
+                    "slug",
+                    "language",
+                    "template_type",
+                    "is_active",
+                    "track_engagement",
+                )
+            },
         ),
         (
             "Content",
-            {"fields": ("subject", "html_content", "text_content", "variables")},
+            {
+                "fields": (
+                    "subject",
+                    "html_content",
+                    "text_content",
+                    "variables",
+                    "required_variables",
+                )
+            },
         ),
+        ("Log Storage", {"fields": ("context_policy",)}),
         (
             "Metadata",
             {"fields": ("created_at", "updated_at"), "classes": ("collapse",)},
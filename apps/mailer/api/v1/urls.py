@@ -0,0 +1,15 @@
+from django.urls import path
+
+
+from .views import (
+    # Tracking
+    TrackOpenAPIView,
+    TrackClickAPIView,
+)
+
+
+urlpatterns = [
+    # Tracking
+    path("track/open/<str:token>/", TrackOpenAPIView.as_view(), name="track-open"),
+    path("track/click/", TrackClickAPIView.as_view(), name="track-click"),
+]
@@ -0,0 +1 @@
+from .tracking_view import TrackOpenAPIView, TrackClickAPIView
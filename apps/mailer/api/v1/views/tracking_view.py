@@ -0,0 +1,59 @@
+import base64
+import logging
+from django.http import HttpResponse, HttpResponseRedirect
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.permissions import AllowAny
+
+from apps.mailer.services import EmailTrackingService
+
+logger = logging.getLogger("app.v1.tracking_view")
+
+# 1x1 transparent GIF
+PIXEL = base64.b64decode("R0lGODlhAQABAIAAAAAAAP///yH5BAEAAAAALAAAAAABAAEAAAIBRAA7")
+
+
+class TrackOpenAPIView(APIView):
+    http_method_names = ["get"]
+    permission_classes = [AllowAny]
+    # Loaded by mail clients: no auth, and a campaign must not be throttled
+    authentication_classes = []
+    throttle_classes = []
+
+    def get(self, request: Request, token: str, *args, **kwargs):
+        log_id = EmailTrackingService.parse_open_token(token)
+        if log_id is not None:
+            try:
+                EmailTrackingService.record_open(log_id)
+            except Exception as e:
+                logger.error(f"Exception in TrackOpenAPIView: {e}")
+
+        # Always answer with the pixel, broken images look bad in emails
+        response = HttpResponse(PIXEL, content_type="image/gif")
+        response["Cache-Control"] = "no-store, max-age=0"
+        return response
+
+
+class TrackClickAPIView(APIView):
+    http_method_names = ["get"]
+    permission_classes = [AllowAny]
+    authentication_classes = []
+    throttle_classes = []
+
+    def get(self, request: Request, *args, **kwargs):
+        data = EmailTrackingService.parse_click_token(request.query_params.get("t", ""))
+        if data is None:
+            logger.warning("Invalid token in TrackClickAPIView")
+            return Response(
+                {"success": False, "message": "Invalid tracking link."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            EmailTrackingService.record_click(data["log_id"])
+        except Exception as e:
+            logger.error(f"Exception in TrackClickAPIView: {e}")
+
+        return HttpResponseRedirect(data["url"])
@@ -0,0 +1,2 @@
+from .smtp_sink import SMTPSink
+from .runner import MailerBenchmark
@@ -0,0 +1,306 @@
+import time
+import json
+import logging
+from pathlib import Path
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+from django.db import connection, transaction
+from django.template.loader import get_template
+from django.test.utils import CaptureQueriesContext, override_settings
+
+from config.celery import app
+from apps.mailer.constants import EmailStatus, SendingEngine
+from apps.mailer.exceptions import EmailSendError
+from apps.mailer.models import EmailTemplateModel
+from apps.mailer.repositories import flush_log_buffer
+from apps.mailer.services import (
+    ContextStorageService,
+    EmailSendingService,
+    TemplateCacheService,
+    close_connection_pool,
+)
+from .smtp_sink import SMTPSink
+
+logger = logging.getLogger("app.mailer.benchmark")
+
+BENCHMARK_SLUG = "benchmark-otp"
+
+# Transaction control statements of the benchmark's own rollback
+# savepoint, not part of the measured code path
+IGNORED_QUERY_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
+# Metrics where a higher value is a regression
+LOWER_IS_BETTER = ("p50_ms", "p99_ms", "queries_per_message")
+
+
+def percentile(samples: List[float], q: float) -> float:
+    """Return the q-th percentile (0..1) of samples, nearest rank."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+class MailerBenchmark:
+    """
+    Throughput benchmark of the mailer hot path against a local SMTP sink.
+
+    Each scenario sends ``messages`` emails through one entry point and
+    reports messages/sec, p50/p99 latency per message and database
+    queries per message. Everything runs inside a transaction that is
+    rolled back, so the database is left untouched; Celery tasks are
+    run eagerly in process.
+    """
+
+    SCENARIOS = (
+        "send_email",
+        "send_bulk_emails",
+        "send_bulk_emails_asyncio",
+        "send_email_async",
+        "send_bulk_emails_async",
+    )
+
+    def __init__(
+        self,
+        messages: int = 200,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        disconnect_rate: float = 0.0,
+        seed: Optional[int] = 0,
+    ):
+        self.messages = messages
+        self.sink = SMTPSink(
+            latency=latency,
+            error_rate=error_rate,
+            disconnect_rate=disconnect_rate,
+            seed=seed,
+        )
+
+    def run(self, scenarios: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """
+        Run the given scenarios (all by default).
+
+        Returns:
+            dict: Scenario name -> metrics.
+        """
+        results = {}
+        with self.sink, self._environment():
+            for name in scenarios or self.SCENARIOS:
+                results[name] = self._run_scenario(name)
+        return results
+
+    @contextmanager
+    def _environment(self):
+        smtp_settings = override_settings(
+            EMAIL_BACKEND="django.core.mail.backends.smtp.EmailBackend",
+            EMAIL_HOST=self.sink.host,
+            EMAIL_PORT=self.sink.port,
+            EMAIL_USE_TLS=False,
+            EMAIL_USE_SSL=False,
+            EMAIL_HOST_USER="",
+            EMAIL_HOST_PASSWORD="",
+            DEFAULT_FROM_EMAIL="benchmark@localhost",
+            MAILER_SEND_RATES={"hosts": {}, "templates": {}},
+        )
+        eager = app.conf.task_always_eager
+
+        close_connection_pool()
+        smtp_settings.enable()
+        app.conf.task_always_eager = True
+        try:
+            yield
+        finally:
+            app.conf.task_always_eager = eager
+            close_connection_pool()
+            smtp_settings.disable()
+            TemplateCacheService.publish(BENCHMARK_SLUG, None)
+
+    def _run_scenario(self, name: str) -> Dict:
+        recipients = [
+            {"email": f"user{i}@benchmark.local", "name": f"User {i}"}
+            for i in range(self.messages)
+        ]
+        send: Callable[[List[Dict]], List[float]] = getattr(self, f"_{name}")
+
+        with transaction.atomic():
+            self._create_template()
+            TemplateCacheService.clear()
+            self.sink.reset()
+
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                latencies = send(recipients)
+                flush_log_buffer()
+                elapsed = time.perf_counter() - started
+
+            failed = EmailTemplateModel.objects.get(
+                slug=BENCHMARK_SLUG
+            ).logs.exclude(status=EmailStatus.SENT).count()
+            transaction.set_rollback(True)
+        # Shared context values created in the rolled back transaction
+        ContextStorageService.clear()
+
+        query_count = len(
+            [
+                query
+                for query in queries.captured_queries
+                if not query["sql"].startswith(IGNORED_QUERY_PREFIXES)
+            ]
+        )
+        result = {
+            "messages": self.messages,
+            "failed": failed,
+            "seconds": round(elapsed, 4),
+            "msgs_per_sec": round(self.messages / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+            "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+            "queries_per_message": round(query_count / self.messages, 3),
+        }
+        logger.info(f"Benchmark {name}: {result}")
+        return result
+
+    @staticmethod
+    def _create_template() -> EmailTemplateModel:
+        template = get_template("email_templates/otp.html")
+        html_content = template.template.source  # type: ignore
+        return EmailTemplateModel.objects.create(
+            name="Benchmark OTP",
+            slug=BENCHMARK_SLUG,
+            subject="Your Verification Code - {{ site_name }}",
+            html_content=html_content,
+            context_policy={
+                "keep": ["name", "expiry_minutes"],
+                "redact": ["otp_code"],
+                "shared": ["site_name", "support_email"],
+            },
+        )
+
+    @staticmethod
+    def _context(recipient: Dict) -> Dict:
+        return {
+            "name": recipient["name"],
+            "otp_code": "123456",
+            "expiry_minutes": 5,
+            "site_name": "Benchmark",
+            "support_email": "support@benchmark.local",
+        }
+
+    def _timed_each(self, recipients: List[Dict], send: Callable) -> List[float]:
+        latencies = []
+        for recipient in recipients:
+            started = time.perf_counter()
+            send(recipient)
+            latencies.append(time.perf_counter() - started)
+        return latencies
+
+    def _sink_latencies(self, started: float) -> List[float]:
+        """Time between consecutive deliveries, for batched entry points."""
+        times = [started] + sorted(self.sink.received_at)
+        return [later - earlier for earlier, later in zip(times, times[1:])]
+
+    def _send_email(self, recipients: List[Dict]) -> List[float]:
+        service = EmailSendingService()
+
+        def send(recipient):
+            try:
+                service.send_email(
+                    template_slug=BENCHMARK_SLUG,
+                    recipient_email=recipient["email"],
+                    context=self._context(recipient),
+                    recipient_name=recipient["name"],
+                )
+            except EmailSendError:
+                pass
+
+        return self._timed_each(recipients, send)
+
+    def _send_bulk_emails(self, recipients: List[Dict]) -> List[float]:
+        started = time.perf_counter()
+        EmailSendingService().send_bulk_emails(
+            template_slug=BENCHMARK_SLUG,
+            recipients=recipients,
+            context=self._context({"name": ""}),
+        )
+        return self._sink_latencies(started)
+
+    def _send_bulk_emails_asyncio(self, recipients: List[Dict]) -> List[float]:
+        started = time.perf_counter()
+        EmailSendingService(engine=SendingEngine.ASYNCIO).send_bulk_emails(
+            template_slug=BENCHMARK_SLUG,
+            recipients=recipients,
+            context=self._context({"name": ""}),
+        )
+        return self._sink_latencies(started)
+
+    def _send_email_async(self, recipients: List[Dict]) -> List[float]:
+        from apps.mailer.tasks import send_email_async
+
+        def send(recipient):
+            send_email_async.apply(
+                kwargs={
+                    "template_slug": BENCHMARK_SLUG,
+                    "recipient_email": recipient["email"],
+                    "context": self._context(recipient),
+                    "recipient_name": recipient["name"],
+                }
+            )
+
+        return self._timed_each(recipients, send)
+
+    def _send_bulk_emails_async(self, recipients: List[Dict]) -> List[float]:
+        from apps.mailer.tasks import send_bulk_emails_async
+
+        started = time.perf_counter()
+        send_bulk_emails_async.apply(
+            kwargs={
+                "template_slug": BENCHMARK_SLUG,
+                "recipients": recipients,
+                "context": self._context({"name": ""}),
+            }
+        )
+        return self._sink_latencies(started)
+
+    @staticmethod
+    def save_baseline(results: Dict[str, Dict], path: Path) -> None:
+        """Store results as the baseline to compare later runs against."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2, sort_keys=True))
+
+    @staticmethod
+    def compare(
+        results: Dict[str, Dict], path: Path, tolerance: float = 0.2
+    ) -> List[str]:
+        """
+        Compare results with a stored baseline.
+
+        Throughput and latency may drift by ``tolerance`` (a fraction)
+        before counting as a regression; any increase in queries per
+        message is one.
+
+        Returns:
+            list: A description of every regression found.
+        """
+        baseline = json.loads(path.read_text())
+        regressions = []
+
+        for name, metrics in results.items():
+            base = baseline.get(name)
+            if base is None:
+                continue
+
+            if metrics["msgs_per_sec"] < base["msgs_per_sec"] * (1 - tolerance):
+                regressions.append(
+                    f"{name}: msgs_per_sec {metrics['msgs_per_sec']} "
+                    f"< baseline {base['msgs_per_sec']}"
+                )
+            for metric in LOWER_IS_BETTER:
+                allowed = base[metric] * (
+                    1 if metric == "queries_per_message" else 1 + tolerance
+                )
+                if metrics[metric] > allowed:
+                    regressions.append(
+                        f"{name}: {metric} {metrics[metric]} > baseline {base[metric]}"
+                    )
+
+        return regressions
@@ -0,0 +1,178 @@
+import time
+import random
+import logging
+import threading
+import socketserver
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger("app.mailer.smtp_sink")
+
+
+class SMTPSinkHandler(socketserver.StreamRequestHandler):
+    """Speaks just enough SMTP for Django's SMTP backend (no TLS, no AUTH)."""
+
+    server: "SMTPSinkServer"
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        sink = self.server.sink
+        self.reply("220 localhost SMTP sink ready")
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip().split(" ", 1)[0].upper()
+
+            if command == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250 8BITMIME")
+            elif command in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                size = self._read_data()
+                if not sink.deliver(size):
+                    # Injected disconnect: drop the connection mid-session
+                    return
+                if sink.should_fail():
+                    self.reply("451 Requested action aborted: injected error")
+                else:
+                    self.reply("250 OK: queued")
+            elif command == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+    def _read_data(self) -> int:
+        size = 0
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                return size
+            size += len(line)
+
+
+class SMTPSinkServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    # Concurrent senders open many sessions at once
+    request_queue_size = 128
+
+    def __init__(self, address: Tuple[str, int], sink: "SMTPSink"):
+        super().__init__(address, SMTPSinkHandler)
+        self.sink = sink
+
+
+class SMTPSink:
+    """
+    Local SMTP server that accepts and discards every message.
+
+    Used to measure the mailer without a real mail server. Every message
+    can be delayed by ``latency`` seconds (plus up to ``jitter``),
+    rejected with a 451 reply with probability ``error_rate``, or have
+    its connection dropped with probability ``disconnect_rate``.
+
+    Usage::
+
+        with SMTPSink(latency=0.01) as sink:
+            # point EMAIL_HOST / EMAIL_PORT at sink.host / sink.port
+            ...
+        print(sink.received)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        disconnect_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.disconnect_rate = disconnect_rate
+        self.received = 0
+        self.rejected = 0
+        self.disconnected = 0
+        self.received_at: List[float] = []
+
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = SMTPSinkServer((host, port), self)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        return self._server.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def _roll(self, rate: float) -> bool:
+        if not rate:
+            return False
+        with self._lock:
+            return self._random.random() < rate
+
+    def deliver(self, size: int) -> bool:
+        """Simulate the server's work for one message; False drops the session."""
+        delay = self.latency
+        if self.jitter:
+            with self._lock:
+                delay += self._random.uniform(0, self.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if self._roll(self.disconnect_rate):
+            with self._lock:
+                self.disconnected += 1
+            return False
+        return True
+
+    def should_fail(self) -> bool:
+        """Decide whether to reject the message just received."""
+        failed = self._roll(self.error_rate)
+        with self._lock:
+            if failed:
+                self.rejected += 1
+            else:
+                self.received += 1
+                self.received_at.append(time.perf_counter())
+        return failed
+
+    def reset(self) -> None:
+        """Zero the counters."""
+        with self._lock:
+            self.received = self.rejected = self.disconnected = 0
+            self.received_at = []
+
+    def start(self) -> "SMTPSink":
+        """Serve in a background thread."""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="smtp-sink", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"SMTP sink listening on {self.host}:{self.port}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "SMTPSink":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
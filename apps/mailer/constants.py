@@ -1,5 +1,89 @@
 from django.db import models
 
+from config.env import (
+    ENV_EMAIL_POOL_SIZE,
+    ENV_EMAIL_SENDING_ENGINE,
+    ENV_EMAIL_ASYNC_CONCURRENCY,
+    ENV_EMAIL_BULK_BATCH_SIZE,
+    ENV_EMAIL_CAMPAIGN_CHUNK_SIZE,
+    ENV_EMAIL_OUTBOX_BATCH_SIZE,
+    ENV_EMAIL_IDEMPOTENCY_TTL,
+    ENV_EMAIL_DEFAULT_LANGUAGE,
+    ENV_EMAIL_RETRY_MAX_ATTEMPTS,
+    ENV_EMAIL_RETRY_BASE_DELAY,
+    ENV_EMAIL_RETRY_MAX_DELAY,
+    ENV_EMAIL_RETRY_MAX_AGE_HOURS,
+    ENV_EMAIL_TRACKING_URL,
+    ENV_EMAIL_LOG_BUFFERING,
+    ENV_EMAIL_LOG_BUFFER_SIZE,
+    ENV_EMAIL_LOG_BUFFER_INTERVAL,
+    ENV_EMAIL_LOG_ARCHIVE_DIR,
+    ENV_EMAIL_LOG_RETENTION_DAYS,
+    ENV_EMAIL_OUTBOX_RELAY_INTERVAL,
+    ENV_EMAIL_HEALTHCHECK_INTERVAL,
+    ENV_EMAIL_MAX_MESSAGES_PER_CONNECTION,
+)
+
+# SMTP connection pool (per worker process)
+EMAIL_POOL_SIZE = ENV_EMAIL_POOL_SIZE
+EMAIL_HEALTHCHECK_INTERVAL = ENV_EMAIL_HEALTHCHECK_INTERVAL
+EMAIL_MAX_MESSAGES_PER_CONNECTION = ENV_EMAIL_MAX_MESSAGES_PER_CONNECTION
+
+# Engine sending bulk batches: "pool" (one message at a time over the
+# connection pool) or "asyncio" (concurrent SMTP sessions per batch)
+EMAIL_SENDING_ENGINE = ENV_EMAIL_SENDING_ENGINE
+EMAIL_ASYNC_CONCURRENCY = ENV_EMAIL_ASYNC_CONCURRENCY
+
+# Recipients rendered, logged and sent together by send_bulk_emails
+EMAIL_BULK_BATCH_SIZE = ENV_EMAIL_BULK_BATCH_SIZE
+# Recipients handled by one Celery task of a bulk campaign
+EMAIL_CAMPAIGN_CHUNK_SIZE = ENV_EMAIL_CAMPAIGN_CHUNK_SIZE
+
+# Buffered EmailLog status writes: flushed every N logs or T seconds
+EMAIL_LOG_BUFFERING = ENV_EMAIL_LOG_BUFFERING
+EMAIL_LOG_BUFFER_SIZE = ENV_EMAIL_LOG_BUFFER_SIZE
+EMAIL_LOG_BUFFER_INTERVAL = ENV_EMAIL_LOG_BUFFER_INTERVAL
+
+# Context variables that differ between the recipients of a bulk send
+EMAIL_RECIPIENT_VARIABLES = ("recipient_name", "recipient_email")
+
+# Template variant used when none exists in the recipient's language
+EMAIL_DEFAULT_LANGUAGE = ENV_EMAIL_DEFAULT_LANGUAGE
+
+# Failed email sweeper: resends per log, backoff (seconds, doubled per
+# attempt and jittered), age after which failures are given up, and
+# logs loaded per keyset chunk
+EMAIL_RETRY_MAX_ATTEMPTS = ENV_EMAIL_RETRY_MAX_ATTEMPTS
+EMAIL_RETRY_BASE_DELAY = ENV_EMAIL_RETRY_BASE_DELAY
+EMAIL_RETRY_MAX_DELAY = ENV_EMAIL_RETRY_MAX_DELAY
+EMAIL_RETRY_MAX_AGE_HOURS = ENV_EMAIL_RETRY_MAX_AGE_HOURS
+EMAIL_RETRY_BATCH_SIZE = 100
+
+# EmailLog archival: rows older than the retention window are moved to
+# compressed files (relative paths are resolved against BASE_DIR)
+EMAIL_LOG_RETENTION_DAYS = ENV_EMAIL_LOG_RETENTION_DAYS
+EMAIL_LOG_ARCHIVE_DIR = ENV_EMAIL_LOG_ARCHIVE_DIR
+EMAIL_LOG_ARCHIVE_BATCH_SIZE = 1000
+
+# Seconds an idempotency key of a send request is remembered in the cache
+EMAIL_IDEMPOTENCY_TTL = ENV_EMAIL_IDEMPOTENCY_TTL
+# Seconds after which the send claim of a crashed attempt may be taken over
+EMAIL_SEND_CLAIM_TIMEOUT = 10 * 60
+
+# Open/click tracking: public origin of the tracking endpoints and logs
+# updated per query when buffered hits are flushed
+EMAIL_TRACKING_URL = ENV_EMAIL_TRACKING_URL
+EMAIL_TRACKING_FLUSH_BATCH_SIZE = 500
+
+# Outbox relay: rows published per batch and seconds between polls
+EMAIL_OUTBOX_BATCH_SIZE = ENV_EMAIL_OUTBOX_BATCH_SIZE
+EMAIL_OUTBOX_RELAY_INTERVAL = ENV_EMAIL_OUTBOX_RELAY_INTERVAL
+
+# Enqueue-to-start latency histogram of Celery queues: bucket upper
+# bounds in seconds, and minutes of per-minute buckets kept in the cache
+TASK_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2, 5, 10, 30, 60, 300)
+TASK_LATENCY_RETENTION_MINUTES = 24 * 60
+
 
 class TemplateType(models.TextChoices):
     CUSTOM = "custom", "Custom Template"
@@ -10,4 +94,28 @@ class EmailStatus(models.TextChoices):
     SENT = "sent", "Sent"
     FAILED = "failed", "Failed"
     PENDING = "pending", "Pending"
+    SENDING = "sending", "Sending"
     BOUNCED = "bounced", "Bounced"
+
+
+class SendingEngine(models.TextChoices):
+    POOL = "pool", "Connection pool"
+    ASYNCIO = "asyncio", "Asyncio"
+
+
+class DeadLetterReason(models.TextChoices):
+    MISSING_VARIABLES = "missing_variables", "Missing variables"
+    TEMPLATE_NOT_FOUND = "template_not_found", "Template not found"
+
+
+class CampaignStatus(models.TextChoices):
+    QUEUED = "queued", "Queued"
+    RUNNING = "running", "Running"
+    COMPLETED = "completed", "Completed"
+    FAILED = "failed", "Failed"
+
+
+class CampaignChunkStatus(models.TextChoices):
+    PENDING = "pending", "Pending"
+    DONE = "done", "Done"
+    FAILED = "failed", "Failed"
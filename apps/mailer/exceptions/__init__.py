@@ -1 +1,7 @@
-from .exceptions import EmailServiceError, TemplateNotFoundError, EmailSendError
+from .exceptions import (
+    EmailServiceError,
+    TemplateNotFoundError,
+    EmailSendError,
+    SendRateLimited,
+    InvalidTemplateContext,
+)
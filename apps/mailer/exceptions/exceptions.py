@@ -17,3 +17,21 @@ class EmailSendError(EmailServiceError):
     """Raised when email sending fails."""
 
     pass
+
+
+class InvalidTemplateContext(EmailServiceError):
+    """Raised when a send context lacks variables the template requires."""
+
+    def __init__(self, missing, detail=None, code=None):
+        super().__init__(
+            detail or f"Missing template variables: {', '.join(missing)}", code
+        )
+        self.missing = list(missing)
+
+
+class SendRateLimited(EmailServiceError):
+    """Raised when sending now would exceed a configured send rate."""
+
+    def __init__(self, retry_after: float, detail=None, code=None):
+        super().__init__(detail or f"Send rate exceeded, retry in {retry_after}s", code)
+        self.retry_after = retry_after
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand
+
+from apps.mailer.services import EmailLogArchiveService
+from apps.mailer.constants import (
+    EMAIL_LOG_RETENTION_DAYS,
+    EMAIL_LOG_ARCHIVE_BATCH_SIZE,
+)
+
+
+class Command(BaseCommand):
+    """Management command to archive old email logs."""
+
+    help = "Move email logs older than the retention window to compressed files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=EMAIL_LOG_RETENTION_DAYS,
+            help="Archive logs created more than this many days ago",
+        )
+        parser.add_argument(
+            "--output-dir",
+            default=None,
+            help="Archive directory (defaults to EMAIL_LOG_ARCHIVE_DIR)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=EMAIL_LOG_ARCHIVE_BATCH_SIZE,
+            help="Logs written and deleted per batch",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        self.stdout.write("Archiving email logs...")
+
+        result = EmailLogArchiveService.archive(
+            retention_days=options["days"],
+            archive_dir=options["output_dir"],
+            batch_size=options["batch_size"],
+        )
+
+        for path in result["files"]:
+            self.stdout.write(f"Wrote: {path}")
+
+        self.stdout.write(
+            self.style.SUCCESS(f'\nArchived {result["archived"]} email logs.')
+        )
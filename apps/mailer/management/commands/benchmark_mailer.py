@@ -0,0 +1,100 @@
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.mailer.benchmark import MailerBenchmark
+
+DEFAULT_BASELINE = "benchmarks/mailer_baseline.json"
+
+
+class Command(BaseCommand):
+    """Management command to benchmark the mailer against a local SMTP sink."""
+
+    help = "Measure mailer throughput, latency and queries per message"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages",
+            type=int,
+            default=200,
+            help="Messages sent per scenario",
+        )
+        parser.add_argument(
+            "--scenario",
+            action="append",
+            choices=MailerBenchmark.SCENARIOS,
+            help="Scenario to run (repeatable, defaults to all)",
+        )
+        parser.add_argument(
+            "--latency",
+            type=float,
+            default=0.0,
+            help="Seconds the SMTP sink waits before accepting a message",
+        )
+        parser.add_argument(
+            "--error-rate",
+            type=float,
+            default=0.0,
+            help="Fraction of messages the SMTP sink rejects",
+        )
+        parser.add_argument(
+            "--disconnect-rate",
+            type=float,
+            default=0.0,
+            help="Fraction of messages on which the SMTP sink drops the connection",
+        )
+        parser.add_argument(
+            "--baseline",
+            default=DEFAULT_BASELINE,
+            help="Baseline JSON file (relative paths are resolved against BASE_DIR)",
+        )
+        parser.add_argument(
+            "--save-baseline",
+            action="store_true",
+            help="Store the results as the new baseline",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            default=0.2,
+            help="Allowed throughput/latency drift from the baseline (fraction)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        baseline = Path(options["baseline"])
+        if not baseline.is_absolute():
+            baseline = Path(settings.BASE_DIR) / baseline
+
+        benchmark = MailerBenchmark(
+            messages=options["messages"],
+            latency=options["latency"],
+            error_rate=options["error_rate"],
+            disconnect_rate=options["disconnect_rate"],
+        )
+        results = benchmark.run(options["scenario"])
+
+        for name, metrics in results.items():
+            self.stdout.write(
+                f"{name}: {metrics['msgs_per_sec']} msgs/sec, "
+                f"p50 {metrics['p50_ms']} ms, p99 {metrics['p99_ms']} ms, "
+                f"{metrics['queries_per_message']} queries/msg, "
+                f"{metrics['failed']}/{metrics['messages']} failed"
+            )
+
+        if options["save_baseline"]:
+            MailerBenchmark.save_baseline(results, baseline)
+            self.stdout.write(self.style.SUCCESS(f"Saved baseline to {baseline}"))
+            return
+
+        if not baseline.exists():
+            self.stdout.write("No baseline to compare against.")
+            return
+
+        regressions = MailerBenchmark.compare(results, baseline, options["tolerance"])
+        if regressions:
+            for regression in regressions:
+                self.stdout.write(self.style.ERROR(regression))
+            raise CommandError(f"{len(regressions)} regressions against the baseline")
+
+        self.stdout.write(self.style.SUCCESS("No regressions against the baseline."))
@@ -17,13 +17,11 @@ class Command(BaseCommand):
             "slug": "otp-verification",
             "subject": "Your Verification Code - {{ site_name }}",
             "template_file": "email_templates/otp.html",
-            "variables": [
-                "name",
-                "otp_code",
-                "expiry_minutes",
-                "site_name",
-                "support_email",
-            ],
+            "context_policy": {
+                "keep": ["name", "expiry_minutes"],
+                "redact": ["otp_code"],
+                "shared": ["site_name", "support_email"],
+            },
         }
     ]
 
@@ -43,12 +41,13 @@ class Command(BaseCommand):
                 # Create or update template
                 obj, created = EmailTemplateModel.objects.update_or_create(
                     slug=template_data["slug"],
+                    language=template_data.get("language", ""),
                     defaults={
                         "name": template_data["name"],
                         "subject": template_data["subject"],
                         "html_content": html_content,
                         "template_type": TemplateType.CUSTOM,
-                        "variables": template_data["variables"],
+                        "context_policy": template_data.get("context_policy", {}),
                         "is_active": True,
                     },
                 )
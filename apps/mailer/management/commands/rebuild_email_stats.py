@@ -0,0 +1,15 @@
+from django.core.management.base import BaseCommand
+
+from apps.mailer.repositories import EmailStatsRepository
+
+
+class Command(BaseCommand):
+    """Management command to rebuild email statistics."""
+
+    help = "Recompute the hourly email statistics from the email log table"
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        self.stdout.write("Rebuilding email statistics...")
+        buckets = EmailStatsRepository.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Wrote {buckets} hourly buckets."))
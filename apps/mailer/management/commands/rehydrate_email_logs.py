@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from apps.mailer.services import EmailLogArchiveService
+
+
+class Command(BaseCommand):
+    """Management command to read archived email logs."""
+
+    help = "Stream archived email logs to stdout or load them back into the database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Archive files (.jsonl.gz)")
+        parser.add_argument(
+            "--load",
+            action="store_true",
+            help="Insert the logs back into the log table",
+        )
+        parser.add_argument("--email", help="Only print logs for this recipient")
+        parser.add_argument("--status", help="Only print logs with this status")
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        for path in options["paths"]:
+            if options["load"]:
+                restored = EmailLogArchiveService.rehydrate(path)
+                self.stdout.write(
+                    self.style.SUCCESS(f"Restored {restored} email logs from {path}")
+                )
+                continue
+
+            for row in EmailLogArchiveService.iter_archive(path):
+                if options["email"] and row["recipient_email"] != options["email"]:
+                    continue
+                if options["status"] and row["status"] != options["status"]:
+                    continue
+                self.stdout.write(EmailLogArchiveService.dumps(row))
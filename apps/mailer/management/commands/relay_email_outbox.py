@@ -0,0 +1,57 @@
+import time
+from django.db import close_old_connections
+from django.core.management.base import BaseCommand
+
+from apps.mailer.services import EmailOutboxService
+from apps.mailer.constants import EMAIL_OUTBOX_BATCH_SIZE, EMAIL_OUTBOX_RELAY_INTERVAL
+
+
+class Command(BaseCommand):
+    """Management command to relay the email outbox to Celery."""
+
+    help = "Continuously publish pending email outbox entries to Celery"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=EMAIL_OUTBOX_BATCH_SIZE,
+            help="Entries published per batch",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=EMAIL_OUTBOX_RELAY_INTERVAL,
+            help="Seconds to sleep when the outbox is empty",
+        )
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Drain the outbox once and exit",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        batch_size = options["batch_size"]
+        interval = options["interval"]
+
+        self.stdout.write("Relaying email outbox...")
+
+        try:
+            while True:
+                close_old_connections()
+                result = EmailOutboxService.relay(batch_size=batch_size)
+
+                if result["published"]:
+                    self.stdout.write(f'Published {result["published"]} emails')
+
+                # Keep draining while full batches are coming in
+                if result["published"] == batch_size:
+                    continue
+                if options["once"]:
+                    break
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS("Email outbox relay stopped."))
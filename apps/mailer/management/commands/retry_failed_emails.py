@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+
+from apps.mailer.services import EmailRetryService
+from apps.mailer.constants import (
+    EMAIL_RETRY_BATCH_SIZE,
+    EMAIL_RETRY_MAX_AGE_HOURS,
+)
+
+
+class Command(BaseCommand):
+    """Management command to resend failed emails."""
+
+    help = "Resend failed emails that are due for a retry"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=EMAIL_RETRY_BATCH_SIZE,
+            help="Failed logs loaded and resent per chunk",
+        )
+        parser.add_argument(
+            "--max-age-hours",
+            type=int,
+            default=EMAIL_RETRY_MAX_AGE_HOURS,
+            help="Only retry emails that failed within this many hours",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        self.stdout.write("Retrying failed emails...")
+
+        result = EmailRetryService().sweep(
+            batch_size=options["batch_size"],
+            max_age_hours=options["max_age_hours"],
+        )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'\nSent {result["sent"]}, failed again {result["failed"]}, '
+                f'gave up {result["given_up"]} emails.'
+            )
+        )
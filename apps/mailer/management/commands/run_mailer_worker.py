@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from config.celery import app
+
+
+class Command(BaseCommand):
+    """Management command to start a Celery worker for one mailer pool."""
+
+    help = "Start a Celery worker for a pool defined in MAILER_WORKER_POOLS"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "pool",
+            choices=sorted(settings.MAILER_WORKER_POOLS),
+            help="Worker pool to start",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            help="Override the pool's number of worker processes",
+        )
+        parser.add_argument(
+            "--loglevel",
+            default="info",
+            help="Celery log level",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        pool = options["pool"]
+        config = settings.MAILER_WORKER_POOLS[pool]
+
+        argv = [
+            "worker",
+            f"--hostname={pool}@%h",
+            f"--queues={','.join(config['queues'])}",
+            f"--concurrency={options['concurrency'] or config['concurrency']}",
+            f"--prefetch-multiplier={config['prefetch_multiplier']}",
+            f"--loglevel={options['loglevel']}",
+        ]
+
+        self.stdout.write(f"Starting '{pool}' worker: {' '.join(argv)}")
+        app.worker_main(argv)
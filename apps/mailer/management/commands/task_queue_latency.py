@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+
+from apps.mailer.services import TaskLatencyService
+
+
+class Command(BaseCommand):
+    """Management command to report Celery queue latency."""
+
+    help = "Show enqueue-to-start latency of Celery tasks per queue"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--minutes",
+            type=int,
+            default=15,
+            help="Size of the reported window in minutes",
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=1.0,
+            help="Report the share of tasks started within this many seconds",
+        )
+        parser.add_argument(
+            "--queue",
+            action="append",
+            help="Queue to report (repeatable, defaults to all routed queues)",
+        )
+
+    def handle(self, *args, **options):
+        """Execute the command."""
+        minutes = options["minutes"]
+        threshold = options["threshold"]
+
+        self.stdout.write(f"Task latency over the last {minutes} minutes:")
+        for queue in options["queue"] or TaskLatencyService.queues():
+            stats = TaskLatencyService.summary(queue, minutes, threshold)
+            if not stats["count"]:
+                self.stdout.write(f"  {queue}: no tasks")
+                continue
+
+            within = stats["within_threshold"] * 100
+            self.stdout.write(
+                f"  {queue}: {stats['count']} tasks, "
+                f"p50 <= {stats['p50']}s, p95 <= {stats['p95']}s, "
+                f"p99 <= {stats['p99']}s, {within:.1f}% within {threshold}s"
+            )
@@ -0,0 +1,56 @@
+# Generated by Django 5.2.8 on 2026-10-17 00:56
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailCampaignModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('template_slug', models.SlugField(max_length=255)),
+                ('context', models.JSONField(blank=True, default=dict, help_text='Base context for all recipients')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('completed', 'Completed')], db_index=True, default='queued', max_length=20)),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('sent', models.PositiveIntegerField(default=0)),
+                ('failed', models.PositiveIntegerField(default=0)),
+                ('chunk_size', models.PositiveIntegerField()),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Email Campaign',
+                'verbose_name_plural': 'Email Campaigns',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='EmailCampaignChunkModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('index', models.PositiveIntegerField()),
+                ('recipients', models.JSONField(default=list, help_text="List of dicts with 'email' and optional 'name'")),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('done', 'Done')], default='pending', max_length=20)),
+                ('sent', models.PositiveIntegerField(default=0)),
+                ('failed', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('campaign', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='chunks', to='mailer.emailcampaignmodel')),
+            ],
+            options={
+                'verbose_name': 'Email Campaign Chunk',
+                'verbose_name_plural': 'Email Campaign Chunks',
+                'ordering': ['campaign', 'index'],
+                'constraints': [models.UniqueConstraint(fields=('campaign', 'index'), name='unique_campaign_chunk_index')],
+            },
+        ),
+    ]
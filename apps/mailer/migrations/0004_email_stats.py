@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:00
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0003_email_outbox'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailStatsModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('template_slug', models.SlugField(blank=True, max_length=255)),
+                ('status', models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed'), ('pending', 'Pending'), ('bounced', 'Bounced')], max_length=20)),
+                ('hour', models.DateTimeField()),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Email Statistic',
+                'verbose_name_plural': 'Email Statistics',
+                'ordering': ['-hour'],
+                'indexes': [models.Index(fields=['hour', 'status'], name='mailer_emai_hour_a63de7_idx')],
+                'constraints': [models.UniqueConstraint(fields=('template_slug', 'status', 'hour'), name='unique_email_stats_bucket')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0004_email_stats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaillogmodel',
+            name='idempotency_key',
+            field=models.CharField(blank=True, help_text='Key of the send request, retries resume this log', max_length=255, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:09
+
+import apps.mailer.validators
+from django.db import migrations, models
+
+
+OTP_CONTEXT_POLICY = {
+    "keep": ["name", "expiry_minutes"],
+    "redact": ["otp_code"],
+    "shared": ["site_name", "support_email"],
+}
+
+
+def set_otp_context_policy(apps, schema_editor):
+    """Stop storing plaintext OTP codes on logs of the existing OTP template."""
+    EmailTemplateModel = apps.get_model("mailer", "EmailTemplateModel")
+    EmailTemplateModel.objects.filter(
+        slug="otp-verification", context_policy={}
+    ).update(context_policy=OTP_CONTEXT_POLICY)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0005_emaillog_idempotency_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailContextValueModel',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('value', models.JSONField()),
+                ('digest', models.CharField(help_text='SHA-256 of name and value', max_length=64, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Email Context Value',
+                'verbose_name_plural': 'Email Context Values',
+                'ordering': ['name', 'id'],
+            },
+        ),
+        migrations.AddField(
+            model_name='emailtemplatemodel',
+            name='context_policy',
+            field=models.JSONField(blank=True, default=dict, help_text='How the render context is stored on email logs: lists of variable names under "keep", "hash", "redact" and "shared". Variables not listed are dropped; an empty policy stores the full context.', validators=[apps.mailer.validators.TemplateValidator.validate_context_policy]),
+        ),
+        migrations.RunPython(set_otp_context_policy, migrations.RunPython.noop),
+    ]
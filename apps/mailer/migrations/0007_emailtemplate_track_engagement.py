@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0006_email_context_storage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailtemplatemodel',
+            name='track_engagement',
+            field=models.BooleanField(default=False, help_text='Track opens and link clicks of sent emails'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0007_emailtemplate_track_engagement'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emaillogmodel',
+            name='next_retry_at',
+            field=models.DateTimeField(blank=True, help_text='Not resent by the sweeper before this time', null=True),
+        ),
+        migrations.AddField(
+            model_name='emaillogmodel',
+            name='retry_count',
+            field=models.PositiveSmallIntegerField(default=0, help_text='Resends by the failed email sweeper'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0008_emaillog_retry'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='emaillogmodel',
+            name='mailer_emai_recipie_ad4039_idx',
+        ),
+        migrations.AddIndex(
+            model_name='emaillogmodel',
+            index=models.Index(fields=['recipient_email', 'created_at'], name='mailer_log_recipient_idx', opclasses=['varchar_pattern_ops', 'timestamptz_ops']),
+        ),
+    ]
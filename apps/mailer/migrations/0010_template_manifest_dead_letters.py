@@ -0,0 +1,60 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:23
+
+import uuid
+from django.db import migrations, models
+
+from apps.mailer.validators import TemplateValidator
+
+
+def extract_template_manifests(apps, schema_editor):
+    """Fill the variable manifest of templates saved before it existed."""
+    EmailTemplateModel = apps.get_model("mailer", "EmailTemplateModel")
+    for template in EmailTemplateModel.objects.all():
+        variables, required = TemplateValidator.extract_manifest(
+            template.subject, template.html_content, template.text_content
+        )
+        # update() keeps updated_at, the published cache version stays valid
+        EmailTemplateModel.objects.filter(pk=template.pk).update(
+            variables=variables, required_variables=required
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0009_emaillog_recipient_prefix_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailtemplatemodel',
+            name='required_variables',
+            field=models.JSONField(blank=True, default=list, help_text='Variables printed without a default (extracted on save); send requests missing one are rejected'),
+        ),
+        migrations.AlterField(
+            model_name='emailtemplatemodel',
+            name='variables',
+            field=models.JSONField(blank=True, default=list, help_text='List of variables used in template (extracted on save)'),
+        ),
+        migrations.CreateModel(
+            name='EmailDeadLetterModel',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('template_slug', models.SlugField(max_length=255)),
+                ('recipient_email', models.EmailField(max_length=254)),
+                ('recipient_name', models.CharField(blank=True, max_length=255)),
+                ('reason', models.CharField(choices=[('missing_variables', 'Missing variables'), ('template_not_found', 'Template not found')], max_length=32)),
+                ('missing_variables', models.JSONField(blank=True, default=list)),
+                ('context_keys', models.JSONField(blank=True, default=list)),
+                ('idempotency_key', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Email Dead Letter',
+                'verbose_name_plural': 'Email Dead Letters',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['template_slug', 'created_at'], name='mailer_emai_templat_21515a_idx')],
+            },
+        ),
+        migrations.RunPython(extract_template_manifests, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0010_template_manifest_dead_letters'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='emailtemplatemodel',
+            name='language',
+            field=models.CharField(blank=True, choices=[('en', 'English'), ('fa', 'Persian')], help_text='Language of this variant, blank for the fallback variant', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='emailtemplatemodel',
+            name='slug',
+            field=models.SlugField(help_text='URL-friendly template identifier, shared by its language variants', max_length=255),
+        ),
+        migrations.AddConstraint(
+            model_name='emailtemplatemodel',
+            constraint=models.UniqueConstraint(fields=('slug', 'language'), name='unique_template_slug_language'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0011_emailtemplate_language_variants'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emaillogmodel',
+            name='status',
+            field=models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed'), ('pending', 'Pending'), ('sending', 'Sending'), ('bounced', 'Bounced')], db_index=True, default='pending', max_length=20),
+        ),
+        migrations.AlterField(
+            model_name='emailstatsmodel',
+            name='status',
+            field=models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed'), ('pending', 'Pending'), ('sending', 'Sending'), ('bounced', 'Bounced')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0013_campaign_failed_status'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emailtemplatemodel',
+            name='name',
+            field=models.CharField(help_text='Template name, unique per language and usually shared by variants', max_length=255),
+        ),
+        migrations.AddConstraint(
+            model_name='emailtemplatemodel',
+            constraint=models.UniqueConstraint(fields=('name', 'language'), name='unique_template_name_language'),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-17 01:51
+
+from django.db import migrations
+
+from apps.mailer.validators import TemplateValidator
+
+
+def refresh_template_manifests(apps, schema_editor):
+    """Re-extract manifests, which missed variables only read by other tags."""
+    EmailTemplateModel = apps.get_model("mailer", "EmailTemplateModel")
+    for template in EmailTemplateModel.objects.all():
+        variables, required = TemplateValidator.extract_manifest(
+            template.subject, template.html_content, template.text_content
+        )
+        # update() keeps updated_at, the published cache version stays valid
+        EmailTemplateModel.objects.filter(pk=template.pk).update(
+            variables=variables, required_variables=required
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mailer', '0014_emailtemplate_name_per_language'),
+    ]
+
+    operations = [
+        migrations.RunPython(refresh_template_manifests, migrations.RunPython.noop),
+    ]
@@ -1,2 +1,7 @@
 from .email_log_model import EmailLogModel
 from .email_template_model import EmailTemplateModel
+from .email_campaign_model import EmailCampaignModel, EmailCampaignChunkModel
+from .email_outbox_model import EmailOutboxModel
+from .email_stats_model import EmailStatsModel
+from .email_context_value_model import EmailContextValueModel
+from .email_dead_letter_model import EmailDeadLetterModel
@@ -0,0 +1,89 @@
+import uuid
+from django.db import models
+
+from apps.mailer.constants import CampaignStatus, CampaignChunkStatus
+
+
+class EmailCampaignModel(models.Model):
+    """
+    A bulk send split into chunks, with aggregate delivery progress.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    template_slug = models.SlugField(max_length=255)
+    context = models.JSONField(
+        default=dict, blank=True, help_text="Base context for all recipients"
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=CampaignStatus.choices,
+        default=CampaignStatus.QUEUED,
+        db_index=True,
+    )
+
+    total = models.PositiveIntegerField(default=0)
+    sent = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    chunk_size = models.PositiveIntegerField()
+
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Email Campaign"
+        verbose_name_plural = "Email Campaigns"
+
+    def __str__(self):
+        return f"{self.template_slug} - {self.total} recipients ({self.status})"
+
+    @property
+    def queued(self) -> int:
+        """Recipients not processed yet."""
+        return max(0, self.total - self.sent - self.failed)
+
+
+class EmailCampaignChunkModel(models.Model):
+    """
+    A fixed-size slice of a campaign's recipients, sent by one task.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    campaign = models.ForeignKey(
+        EmailCampaignModel, on_delete=models.CASCADE, related_name="chunks"
+    )
+    index = models.PositiveIntegerField()
+
+    recipients = models.JSONField(
+        default=list, help_text="List of dicts with 'email' and optional 'name'"
+    )
+
+    status = models.CharField(
+        max_length=20,
+        choices=CampaignChunkStatus.choices,
+        default=CampaignChunkStatus.PENDING,
+    )
+
+    sent = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["campaign", "index"]
+        verbose_name = "Email Campaign Chunk"
+        verbose_name_plural = "Email Campaign Chunks"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["campaign", "index"], name="unique_campaign_chunk_index"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.campaign_id} #{self.index} ({self.status})"
@@ -0,0 +1,29 @@
+from django.db import models
+
+
+class EmailContextValueModel(models.Model):
+    """
+    A context value shared by many email logs.
+
+    Static values such as ``site_name`` are stored once and email logs
+    only keep the ids of the values they were rendered with.
+    """
+
+    # Small integer ids keep the references in log rows short
+    id = models.BigAutoField(primary_key=True)
+
+    name = models.CharField(max_length=255)
+    value = models.JSONField()
+    digest = models.CharField(
+        max_length=64, unique=True, help_text="SHA-256 of name and value"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["name", "id"]
+        verbose_name = "Email Context Value"
+        verbose_name_plural = "Email Context Values"
+
+    def __str__(self):
+        return f"{self.name} = {self.value}"
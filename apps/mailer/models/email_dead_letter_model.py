@@ -0,0 +1,35 @@
+import uuid
+from django.db import models
+from apps.mailer.constants import DeadLetterReason
+
+
+class EmailDeadLetterModel(models.Model):
+    """
+    A send request rejected before anything was rendered or sent.
+
+    Only the names of the context variables are kept, never their values.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    template_slug = models.SlugField(max_length=255)
+    recipient_email = models.EmailField()
+    recipient_name = models.CharField(max_length=255, blank=True)
+
+    reason = models.CharField(max_length=32, choices=DeadLetterReason.choices)
+    missing_variables = models.JSONField(default=list, blank=True)
+    context_keys = models.JSONField(default=list, blank=True)
+    idempotency_key = models.CharField(max_length=255, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["-created_at"]
+        verbose_name = "Email Dead Letter"
+        verbose_name_plural = "Email Dead Letters"
+        indexes = [
+            models.Index(fields=["template_slug", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient_email} - {self.template_slug} ({self.reason})"
@@ -38,6 +38,21 @@ class EmailLogModel(models.Model):
 
     error_message = models.TextField(blank=True)
 
+    retry_count = models.PositiveSmallIntegerField(
+        default=0, help_text="Resends by the failed email sweeper"
+    )
+    next_retry_at = models.DateTimeField(
+        null=True, blank=True, help_text="Not resent by the sweeper before this time"
+    )
+
+    idempotency_key = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        unique=True,
+        help_text="Key of the send request, retries resume this log",
+    )
+
     sent_at = models.DateTimeField(null=True, blank=True)
     opened_at = models.DateTimeField(null=True, blank=True)
     clicked_at = models.DateTimeField(null=True, blank=True)
@@ -51,8 +66,20 @@ class EmailLogModel(models.Model):
         verbose_name_plural = "Email Logs"
         indexes = [
             models.Index(fields=["status", "created_at"]),
-            models.Index(fields=["recipient_email", "created_at"]),
+            # Pattern ops let prefix searches (LIKE 'x%') use it on PostgreSQL
+            models.Index(
+                fields=["recipient_email", "created_at"],
+                name="mailer_log_recipient_idx",
+                opclasses=["varchar_pattern_ops", "timestamptz_ops"],
+            ),
         ]
 
     def __str__(self):
         return f"{self.recipient_email} - {self.subject} ({self.status})"
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Status as stored in the database, used to maintain EmailStatsModel
+        instance.stored_status = instance.__dict__.get("status")
+        return instance
@@ -0,0 +1,38 @@
+import uuid
+from django.db import models
+from django.utils import timezone
+
+
+class EmailOutboxModel(models.Model):
+    """
+    An email waiting to be published to the Celery broker.
+
+    Rows are written in the same transaction as the business data that
+    triggered the email and relayed to ``send_email_async`` afterwards.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    template_slug = models.SlugField(max_length=255)
+    recipient_email = models.EmailField()
+    recipient_name = models.CharField(max_length=255, blank=True)
+    context = models.JSONField(default=dict, blank=True)
+
+    attempts = models.PositiveSmallIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    available_at = models.DateTimeField(
+        default=timezone.now, help_text="Not relayed before this time"
+    )
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["created_at"]
+        verbose_name = "Email Outbox Entry"
+        verbose_name_plural = "Email Outbox"
+        indexes = [
+            models.Index(fields=["available_at", "created_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient_email} - {self.template_slug}"
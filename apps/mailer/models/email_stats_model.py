@@ -0,0 +1,41 @@
+import uuid
+from django.db import models
+
+from apps.mailer.constants import EmailStatus
+
+
+class EmailStatsModel(models.Model):
+    """
+    Hourly email counts per template and status.
+
+    Maintained incrementally whenever a log is created or changes status,
+    so reporting never has to scan the log table. ``hour`` is the hour
+    the logs were created in.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+
+    template_slug = models.SlugField(max_length=255, blank=True)
+    status = models.CharField(max_length=20, choices=EmailStatus.choices)
+    hour = models.DateTimeField()
+
+    count = models.IntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["-hour"]
+        verbose_name = "Email Statistic"
+        verbose_name_plural = "Email Statistics"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["template_slug", "status", "hour"],
+                name="unique_email_stats_bucket",
+            )
+        ]
+        indexes = [
+            models.Index(fields=["hour", "status"]),
+        ]
+
+    def __str__(self):
+        return f"{self.template_slug} {self.status} @ {self.hour}: {self.count}"
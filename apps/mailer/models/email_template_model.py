@@ -1,6 +1,8 @@
 import uuid
 from django.db import models
+from apps.accounts.constants import UserLanguage
 from apps.mailer.constants import TemplateType
+from apps.mailer.validators import TemplateValidator
 
 
 class EmailTemplateModel(models.Model):
@@ -11,10 +13,18 @@ class EmailTemplateModel(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
 
     name = models.CharField(
-        max_length=255, unique=True, help_text="Unique template name"
+        max_length=255,
+        help_text="Template name, unique per language and usually shared by variants",
     )
     slug = models.SlugField(
-        max_length=255, unique=True, help_text="URL-friendly template identifier"
+        max_length=255,
+        help_text="URL-friendly template identifier, shared by its language variants",
+    )
+    language = models.CharField(
+        max_length=20,
+        choices=UserLanguage.choices,
+        blank=True,
+        help_text="Language of this variant, blank for the fallback variant",
     )
 
     subject = models.CharField(max_length=255, help_text="Email subject line")
@@ -35,7 +45,30 @@ class EmailTemplateModel(models.Model):
     variables = models.JSONField(
         default=list,
         blank=True,
-        help_text="List of variables used in template",
+        help_text="List of variables used in template (extracted on save)",
+    )
+    required_variables = models.JSONField(
+        default=list,
+        blank=True,
+        help_text=(
+            "Variables printed without a default (extracted on save); "
+            "send requests missing one are rejected"
+        ),
+    )
+
+    context_policy = models.JSONField(
+        default=dict,
+        blank=True,
+        validators=[TemplateValidator.validate_context_policy],
+        help_text=(
+            "How the render context is stored on email logs: lists of variable "
+            'names under "keep", "hash", "redact" and "shared". Variables not '
+            "listed are dropped; an empty policy stores the full context."
+        ),
+    )
+
+    track_engagement = models.BooleanField(
+        default=False, help_text="Track opens and link clicks of sent emails"
     )
 
     is_active = models.BooleanField(default=True)
@@ -51,6 +84,33 @@ class EmailTemplateModel(models.Model):
             models.Index(fields=["slug", "is_active"]),
             models.Index(fields=["template_type", "is_active"]),
         ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["slug", "language"], name="unique_template_slug_language"
+            ),
+            models.UniqueConstraint(
+                fields=["name", "language"], name="unique_template_name_language"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.template_type})"
+
+    def clean(self):
+        for content in (self.subject, self.html_content, self.text_content):
+            if content:
+                TemplateValidator.validate_template_syntax(content)
+
+    def save(self, *args, **kwargs):
+        # Compile the variable manifest once here instead of on every send
+        self.variables, self.required_variables = TemplateValidator.extract_manifest(
+            self.subject, self.html_content, self.text_content
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {
+                *update_fields,
+                "variables",
+                "required_variables",
+            }
+        super().save(*args, **kwargs)
@@ -1,2 +1,8 @@
 from .email_log_repo import EmailLogRepository
 from .email_template_repo import EmailTemplateRepository
+from .email_campaign_repo import EmailCampaignRepository
+from .email_outbox_repo import EmailOutboxRepository
+from .email_log_buffer import EmailLogStatusBuffer, get_log_buffer, flush_log_buffer
+from .email_stats_repo import EmailStatsRepository
+from .email_context_value_repo import EmailContextValueRepository
+from .email_dead_letter_repo import EmailDeadLetterRepository
@@ -0,0 +1,130 @@
+from typing import Dict, List, Optional
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.mailer.constants import CampaignStatus, CampaignChunkStatus
+from apps.mailer.models import EmailCampaignModel, EmailCampaignChunkModel
+
+
+class EmailCampaignRepository:
+    """Repository for EmailCampaign and EmailCampaignChunk data access."""
+
+    @staticmethod
+    @transaction.atomic
+    def create_campaign(
+        template_slug: str,
+        recipients: List[Dict[str, str]],
+        context: dict,
+        chunk_size: int,
+    ) -> EmailCampaignModel:
+        """Create a campaign and split its recipients into chunks."""
+        campaign = EmailCampaignModel.objects.create(
+            template_slug=template_slug,
+            context=context,
+            total=len(recipients),
+            chunk_size=chunk_size,
+        )
+        EmailCampaignChunkModel.objects.bulk_create(
+            [
+                EmailCampaignChunkModel(
+                    campaign=campaign,
+                    index=index,
+                    recipients=recipients[start : start + chunk_size],
+                )
+                for index, start in enumerate(range(0, len(recipients), chunk_size))
+            ]
+        )
+        return campaign
+
+    @staticmethod
+    def get_by_id(campaign_id) -> Optional[EmailCampaignModel]:
+        """Retrieve a campaign by id."""
+        return EmailCampaignModel.objects.filter(pk=campaign_id).first()
+
+    @staticmethod
+    def get_chunk(chunk_id) -> Optional[EmailCampaignChunkModel]:
+        """Retrieve a chunk together with its campaign."""
+        return (
+            EmailCampaignChunkModel.objects.select_related("campaign")
+            .filter(pk=chunk_id)
+            .first()
+        )
+
+    @staticmethod
+    def get_pending_chunk_ids(campaign: EmailCampaignModel) -> List:
+        """Ids of the chunks of a campaign that were not sent yet."""
+        return list(
+            campaign.chunks.filter(status=CampaignChunkStatus.PENDING)
+            .order_by("index")
+            .values_list("id", flat=True)
+        )
+
+    @staticmethod
+    def mark_running(campaign: EmailCampaignModel) -> None:
+        """Mark campaign as dispatched to the workers."""
+        EmailCampaignModel.objects.filter(pk=campaign.pk).update(
+            status=CampaignStatus.RUNNING, updated_at=timezone.now()
+        )
+        campaign.status = CampaignStatus.RUNNING
+
+    @staticmethod
+    @transaction.atomic
+    def complete_chunk(chunk: EmailCampaignChunkModel, sent: int, failed: int) -> bool:
+        """
+        Mark chunk as done and add its counts to the campaign.
+
+        Returns:
+            bool: False if the chunk had already been completed.
+        """
+        now = timezone.now()
+        updated = EmailCampaignChunkModel.objects.filter(
+            pk=chunk.pk, status=CampaignChunkStatus.PENDING
+        ).update(
+            status=CampaignChunkStatus.DONE, sent=sent, failed=failed, updated_at=now
+        )
+        if not updated:
+            return False
+
+        EmailCampaignModel.objects.filter(pk=chunk.campaign_id).update(
+            sent=F("sent") + sent, failed=F("failed") + failed, updated_at=now
+        )
+        return True
+
+    @staticmethod
+    @transaction.atomic
+    def fail_chunk(chunk: EmailCampaignChunkModel) -> bool:
+        """
+        Mark chunk as failed, counting all of its recipients as failed.
+
+        Returns:
+            bool: False if the chunk had already been completed.
+        """
+        now = timezone.now()
+        failed = len(chunk.recipients)
+        updated = EmailCampaignChunkModel.objects.filter(
+            pk=chunk.pk, status=CampaignChunkStatus.PENDING
+        ).update(status=CampaignChunkStatus.FAILED, failed=failed, updated_at=now)
+        if not updated:
+            return False
+
+        EmailCampaignModel.objects.filter(pk=chunk.campaign_id).update(
+            failed=F("failed") + failed, updated_at=now
+        )
+        return True
+
+    @staticmethod
+    def mark_failed(campaign_id) -> None:
+        """Mark campaign as ended without all of its chunks finishing."""
+        now = timezone.now()
+        EmailCampaignModel.objects.filter(pk=campaign_id).update(
+            status=CampaignStatus.FAILED, finished_at=now, updated_at=now
+        )
+
+    @staticmethod
+    def mark_completed(campaign_id) -> None:
+        """Mark campaign as finished."""
+        now = timezone.now()
+        EmailCampaignModel.objects.filter(pk=campaign_id).update(
+            status=CampaignStatus.COMPLETED, finished_at=now, updated_at=now
+        )
@@ -0,0 +1,50 @@
+from typing import Dict, Iterable
+
+from apps.mailer.models import EmailContextValueModel
+
+
+class EmailContextValueRepository:
+    """Repository for shared EmailContextValue data access."""
+
+    @staticmethod
+    def get_or_create_ids(values: Dict[str, Dict]) -> Dict[str, int]:
+        """
+        Return the ids of shared values, inserting the missing ones.
+
+        Args:
+            values: Digest -> {"name": ..., "value": ...}
+
+        Returns:
+            dict: Digest -> id
+        """
+        ids = dict(
+            EmailContextValueModel.objects.filter(digest__in=values).values_list(
+                "digest", "id"
+            )
+        )
+        missing = [digest for digest in values if digest not in ids]
+        if missing:
+            EmailContextValueModel.objects.bulk_create(
+                [
+                    EmailContextValueModel(digest=digest, **values[digest])
+                    for digest in missing
+                ],
+                ignore_conflicts=True,
+            )
+            # ignore_conflicts does not return ids, and another worker may
+            # have inserted some of the rows first
+            ids.update(
+                EmailContextValueModel.objects.filter(digest__in=missing).values_list(
+                    "digest", "id"
+                )
+            )
+        return ids
+
+    @staticmethod
+    def get_values(ids: Iterable[int]) -> Dict[str, object]:
+        """Return name -> value of the given shared values."""
+        return dict(
+            EmailContextValueModel.objects.filter(pk__in=list(ids)).values_list(
+                "name", "value"
+            )
+        )
@@ -0,0 +1,28 @@
+from typing import Iterable
+
+from apps.mailer.models import EmailDeadLetterModel
+
+
+class EmailDeadLetterRepository:
+    """Repository for EmailDeadLetter data access."""
+
+    @staticmethod
+    def create_entry(
+        template_slug: str,
+        recipient_email: str,
+        reason: str,
+        recipient_name: str = "",
+        missing_variables: Iterable[str] = (),
+        context_keys: Iterable[str] = (),
+        idempotency_key: str = "",
+    ) -> EmailDeadLetterModel:
+        """Create a new dead letter entry."""
+        return EmailDeadLetterModel.objects.create(
+            template_slug=template_slug,
+            recipient_email=recipient_email,
+            recipient_name=recipient_name,
+            reason=reason,
+            missing_variables=sorted(missing_variables),
+            context_keys=sorted(context_keys),
+            idempotency_key=idempotency_key or "",
+        )
@@ -0,0 +1,134 @@
+import os
+import atexit
+import logging
+import threading
+from typing import Dict, List, Optional
+from django.db import connection, transaction
+from django.utils import timezone
+
+from apps.mailer.models import EmailLogModel
+from apps.mailer.constants import EMAIL_LOG_BUFFER_SIZE, EMAIL_LOG_BUFFER_INTERVAL
+from .email_stats_repo import EmailStatsRepository
+
+logger = logging.getLogger("app.mailer.log_buffer")
+
+# Fields written when a log changes state
+STATUS_FIELDS = [
+    "status",
+    "sent_at",
+    "error_message",
+    "retry_count",
+    "next_retry_at",
+    "updated_at",
+]
+
+
+class EmailLogStatusBuffer:
+    """
+    In-memory buffer that coalesces EmailLog status transitions.
+
+    Transitions are kept per log (the latest one wins) and written with
+    a single bulk update once ``max_size`` logs are pending or the oldest
+    pending transition is ``max_age`` seconds old.
+    """
+
+    def __init__(
+        self,
+        max_size: int = EMAIL_LOG_BUFFER_SIZE,
+        max_age: float = EMAIL_LOG_BUFFER_INTERVAL,
+    ):
+        self.max_size = max_size
+        self.max_age = max_age
+        self._pending: Dict[object, EmailLogModel] = {}
+        self._lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, log: EmailLogModel) -> None:
+        """Queue the current state of log for writing."""
+        log.updated_at = timezone.now()
+        with self._lock:
+            self._pending[log.pk] = log
+            full = len(self._pending) >= self.max_size
+            if not full and self._timer is None:
+                self._timer = threading.Timer(self.max_age, self._flush_on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write every pending transition with one bulk update.
+
+        Returns:
+            int: Number of logs written.
+        """
+        with self._lock:
+            logs: List[EmailLogModel] = list(self._pending.values())
+            self._pending.clear()
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not logs:
+            return 0
+
+        try:
+            with transaction.atomic():
+                updated = EmailLogModel.objects.bulk_update(logs, STATUS_FIELDS)
+                EmailStatsRepository.record_logs(logs)
+            return updated
+        except Exception as e:
+            logger.error(f"Failed to flush {len(logs)} email log statuses: {e}")
+            # Keep transitions that did not land, newer ones take precedence
+            with self._lock:
+                for log in logs:
+                    self._pending.setdefault(log.pk, log)
+            raise
+
+    def _flush_on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+        try:
+            self.flush()
+        except Exception:
+            pass
+        finally:
+            # The timer thread owns its own database connection
+            connection.close()
+
+
+_buffer: Optional[EmailLogStatusBuffer] = None
+_buffer_pid: Optional[int] = None
+_buffer_lock = threading.Lock()
+
+
+def get_log_buffer() -> EmailLogStatusBuffer:
+    """Return the status buffer of the current process."""
+    global _buffer, _buffer_pid
+
+    pid = os.getpid()
+    if _buffer is None or _buffer_pid != pid:
+        with _buffer_lock:
+            if _buffer is None or _buffer_pid != pid:
+                _buffer = EmailLogStatusBuffer()
+                _buffer_pid = pid
+    return _buffer
+
+
+def flush_log_buffer() -> int:
+    """Flush the current process's buffer, if any."""
+    if _buffer is None or _buffer_pid != os.getpid():
+        return 0
+    return _buffer.flush()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    try:
+        flush_log_buffer()
+    except Exception:
+        pass
@@ -1,29 +1,70 @@
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from django.db import transaction
 from django.utils import timezone
-from django.db.models import QuerySet
+from django.db.models import Case, Q, QuerySet, Value, When
 
-from apps.mailer.constants import EmailStatus
 from apps.mailer.models import EmailTemplateModel, EmailLogModel
+from apps.mailer.constants import (
+    EmailStatus,
+    EMAIL_LOG_BUFFERING,
+    EMAIL_RETRY_BASE_DELAY,
+    EMAIL_RETRY_MAX_DELAY,
+    EMAIL_RETRY_MAX_ATTEMPTS,
+    EMAIL_SEND_CLAIM_TIMEOUT,
+)
+from .email_stats_repo import EmailStatsRepository
+from .email_log_buffer import STATUS_FIELDS, get_log_buffer
 
 
 class EmailLogRepository:
     """Repository for EmailLog data access."""
 
     @staticmethod
+    @transaction.atomic
     def create_log(
         template: EmailTemplateModel,
         recipient_email: str,
         subject: str,
         context_data: dict,
         recipient_name: str = "",
+        idempotency_key: Optional[str] = None,
     ) -> EmailLogModel:
-        """Create a new email log entry."""
-        return EmailLogModel.objects.create(
+        """
+        Create a new email log entry.
+
+        Raises:
+            IntegrityError: If a log with idempotency_key already exists.
+        """
+        log = EmailLogModel.objects.create(
             template=template,
             recipient_email=recipient_email,
             recipient_name=recipient_name,
             subject=subject,
             context_data=context_data,
+            idempotency_key=idempotency_key,
         )
+        EmailStatsRepository.record_logs([log])
+        return log
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_create_logs(logs: List[EmailLogModel]) -> List[EmailLogModel]:
+        """Insert many unsaved log entries with a single query."""
+        logs = EmailLogModel.objects.bulk_create(logs)
+        EmailStatsRepository.record_logs(logs)
+        return logs
+
+    @staticmethod
+    def get_by_id(log_id) -> Optional[EmailLogModel]:
+        """Get a log by id."""
+        return EmailLogModel.objects.filter(pk=log_id).first()
+
+    @staticmethod
+    def get_by_idempotency_key(key: str) -> Optional[EmailLogModel]:
+        """Get the log created for a send request."""
+        return EmailLogModel.objects.filter(idempotency_key=key).first()
 
     @staticmethod
     def get_by_recipient(email: str) -> QuerySet[EmailLogModel]:
@@ -37,13 +78,63 @@ class EmailLogRepository:
         """Get all failed email logs."""
         return EmailLogModel.objects.filter(status=EmailStatus.FAILED)
 
+    @staticmethod
+    def claim_for_sending(log: EmailLogModel) -> bool:
+        """
+        Take the right to send the message of log.
+
+        One conditional UPDATE from pending or failed to sending, so of
+        concurrent attempts at the same log only one sends. A claim older
+        than EMAIL_SEND_CLAIM_TIMEOUT (its attempt crashed) can be taken
+        over. The claim is not counted in the delivery stats, the final
+        status is recorded against the status log was loaded with.
+
+        Returns:
+            bool: True if the caller may send.
+        """
+        now = timezone.now()
+        stale = now - timedelta(seconds=EMAIL_SEND_CLAIM_TIMEOUT)
+        claimed = (
+            EmailLogModel.objects.filter(pk=log.pk)
+            .filter(
+                Q(status__in=[EmailStatus.PENDING, EmailStatus.FAILED])
+                | Q(status=EmailStatus.SENDING, updated_at__lt=stale)
+            )
+            .update(status=EmailStatus.SENDING, updated_at=now)
+        )
+        return bool(claimed)
+
+    @staticmethod
+    def claim_for_retry(logs: List[EmailLogModel]) -> List[EmailLogModel]:
+        """
+        Take the right to resend each of logs, see ``claim_for_sending``.
+
+        A log is only taken while it is still failed and due, so a log
+        a pending Celery retry or another sweep took (or already sent)
+        in the meantime is left alone.
+
+        Returns:
+            list: The logs the caller may resend, their loaded status kept.
+        """
+        now = timezone.now()
+        due = Q(next_retry_at__isnull=True) | Q(next_retry_at__lte=now)
+        return [
+            log
+            for log in logs
+            if EmailLogModel.objects.filter(pk=log.pk, status=EmailStatus.FAILED)
+            .filter(due)
+            .update(status=EmailStatus.SENDING, updated_at=now)
+        ]
+
     @staticmethod
     def mark_as_sent(log: EmailLogModel) -> EmailLogModel:
         """Mark email as successfully sent."""
         log.status = EmailStatus.SENT
         log.sent_at = timezone.now()
-        log.save(update_fields=["status", "sent_at", "updated_at"])
-        log.refresh_from_db()
+        if EMAIL_LOG_BUFFERING:
+            get_log_buffer().add(log)
+        else:
+            EmailLogRepository._save_status(log, ["status", "sent_at", "updated_at"])
         return log
 
     @staticmethod
@@ -51,6 +142,151 @@ class EmailLogRepository:
         """Mark email as failed with error message."""
         log.status = EmailStatus.FAILED
         log.error_message = error_message
-        log.save(update_fields=["status", "error_message", "updated_at"])
-        log.refresh_from_db()
+        EmailLogRepository.schedule_retry(log)
+        if EMAIL_LOG_BUFFERING:
+            get_log_buffer().add(log)
+        else:
+            EmailLogRepository._save_status(
+                log, ["status", "error_message", "next_retry_at", "updated_at"]
+            )
         return log
+
+    @staticmethod
+    def schedule_retry(log: EmailLogModel) -> None:
+        """
+        Set when the sweeper may resend a failed log.
+
+        The delay doubles with every resend and is jittered so logs that
+        failed together are not all retried at the same moment.
+        """
+        delay = min(EMAIL_RETRY_MAX_DELAY, EMAIL_RETRY_BASE_DELAY * 2**log.retry_count)
+        log.next_retry_at = timezone.now() + timedelta(
+            seconds=random.uniform(delay / 2, delay)
+        )
+
+    @staticmethod
+    def give_up_retries(log: EmailLogModel) -> None:
+        """Exclude a failed log from further sweeps."""
+        log.retry_count = max(log.retry_count, EMAIL_RETRY_MAX_ATTEMPTS)
+        log.next_retry_at = None
+
+    @staticmethod
+    def get_retryable_logs(
+        created_after: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, object]] = None,
+    ) -> List[EmailLogModel]:
+        """
+        Return up to limit failed logs that are due for a resend.
+
+        Only logs created after created_after with resends left are
+        considered. Rows are ordered by (created_at, id) and start
+        strictly after the ``after`` cursor (keyset pagination).
+        """
+        qs = EmailLogModel.objects.filter(
+            status=EmailStatus.FAILED,
+            created_at__gte=created_after,
+            retry_count__lt=EMAIL_RETRY_MAX_ATTEMPTS,
+        ).filter(Q(next_retry_at__isnull=True) | Q(next_retry_at__lte=timezone.now()))
+        if after is not None:
+            created_at, pk = after
+            qs = qs.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            )
+        return list(qs.select_related("template").order_by("created_at", "id")[:limit])
+
+    @staticmethod
+    @transaction.atomic
+    def _save_status(log: EmailLogModel, update_fields: List[str]) -> None:
+        """Save a status change and apply it to the delivery stats."""
+        log.save(update_fields=update_fields)
+        EmailStatsRepository.record_logs([log])
+
+    @staticmethod
+    @transaction.atomic
+    def bulk_update_statuses(logs: List[EmailLogModel]) -> int:
+        """Write the status fields (STATUS_FIELDS) of many logs in one query."""
+        now = timezone.now()
+        for log in logs:
+            log.updated_at = now
+        updated = EmailLogModel.objects.bulk_update(logs, STATUS_FIELDS)
+        EmailStatsRepository.record_logs(logs)
+        return updated
+
+    @staticmethod
+    def set_first_timestamps(field: str, timestamps: Dict[str, datetime]) -> int:
+        """
+        Set field (e.g. ``opened_at``) of many logs with one UPDATE.
+
+        Logs where field is already set keep their value.
+
+        Args:
+            field: Name of a nullable datetime field
+            timestamps: Log id -> timestamp
+
+        Returns:
+            int: Number of logs updated.
+        """
+        if not timestamps:
+            return 0
+        return EmailLogModel.objects.filter(
+            pk__in=list(timestamps), **{f"{field}__isnull": True}
+        ).update(
+            **{
+                field: Case(
+                    *[When(pk=pk, then=Value(ts)) for pk, ts in timestamps.items()]
+                )
+            }
+        )
+
+    @staticmethod
+    def get_logs_before(
+        cutoff: datetime,
+        limit: int,
+        after: Optional[Tuple[datetime, object]] = None,
+    ) -> List[dict]:
+        """
+        Return up to limit logs created before cutoff as dicts.
+
+        Rows are ordered by (created_at, id) and start strictly after the
+        ``after`` cursor, so successive calls walk the table by keyset
+        instead of OFFSET.
+        """
+        qs = EmailLogModel.objects.filter(created_at__lt=cutoff)
+        if after is not None:
+            created_at, pk = after
+            qs = qs.filter(
+                Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+            )
+        return list(qs.order_by("created_at", "id").values()[:limit])
+
+    @staticmethod
+    def delete_by_ids(ids: List) -> int:
+        """Delete the given logs."""
+        deleted, _ = EmailLogModel.objects.filter(pk__in=ids).delete()
+        return deleted
+
+    @staticmethod
+    def restore_logs(rows: List[dict]) -> int:
+        """
+        Re-insert archived logs, keeping their original timestamps.
+
+        Logs that still exist are left untouched.
+        """
+        logs = list({row["id"]: EmailLogModel(**row) for row in rows}.values())
+        existing = set(
+            EmailLogModel.objects.filter(
+                pk__in=[log.pk for log in logs]
+            ).values_list("pk", flat=True)
+        )
+        logs = [log for log in logs if log.pk not in existing]
+        if not logs:
+            return 0
+
+        timestamps = {log.pk: (log.created_at, log.updated_at) for log in logs}
+        EmailLogModel.objects.bulk_create(logs)
+        # auto_now/auto_now_add overwrote the timestamps on insert
+        for log in logs:
+            log.created_at, log.updated_at = timestamps[log.pk]
+        EmailLogModel.objects.bulk_update(logs, ["created_at", "updated_at"])
+        return len(logs)
@@ -0,0 +1,55 @@
+from datetime import timedelta
+from typing import Iterable, List
+from django.utils import timezone
+
+from apps.mailer.models import EmailOutboxModel
+
+
+class EmailOutboxRepository:
+    """Repository for EmailOutbox data access."""
+
+    @staticmethod
+    def create_entry(
+        template_slug: str,
+        recipient_email: str,
+        context: dict,
+        recipient_name: str = "",
+    ) -> EmailOutboxModel:
+        """Create a new outbox entry."""
+        return EmailOutboxModel.objects.create(
+            template_slug=template_slug,
+            recipient_email=recipient_email,
+            recipient_name=recipient_name,
+            context=context,
+        )
+
+    @staticmethod
+    def claim_batch(limit: int) -> List[EmailOutboxModel]:
+        """
+        Lock and return the oldest entries that are due.
+
+        Must be called inside a transaction. Rows locked by another relay
+        are skipped on databases that support it.
+        """
+        return list(
+            EmailOutboxModel.objects.select_for_update(skip_locked=True)
+            .filter(available_at__lte=timezone.now())
+            .order_by("created_at")[:limit]
+        )
+
+    @staticmethod
+    def delete_entries(ids: Iterable) -> None:
+        """Delete published entries."""
+        EmailOutboxModel.objects.filter(pk__in=list(ids)).delete()
+
+    @staticmethod
+    def postpone(entries: List[EmailOutboxModel], error: str) -> None:
+        """Record a failed publish and back off exponentially."""
+        now = timezone.now()
+        for entry in entries:
+            entry.attempts += 1
+            entry.last_error = error
+            entry.available_at = now + timedelta(seconds=min(2**entry.attempts, 300))
+        EmailOutboxModel.objects.bulk_update(
+            entries, ["attempts", "last_error", "available_at"]
+        )
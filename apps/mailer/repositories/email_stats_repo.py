@@ -0,0 +1,157 @@
+from datetime import datetime
+from collections import Counter
+from typing import Dict, Iterable, Optional, Tuple
+from django.utils import timezone
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncHour
+from django.db import IntegrityError, transaction
+
+from apps.mailer.models import EmailLogModel, EmailStatsModel, EmailTemplateModel
+
+StatsKey = Tuple[str, str, datetime]
+
+
+class EmailStatsRepository:
+    """Repository for the hourly EmailStats rollup."""
+
+    @staticmethod
+    def hour_of(value: datetime) -> datetime:
+        """Truncate a datetime to its hour bucket."""
+        return value.replace(minute=0, second=0, microsecond=0)
+
+    @staticmethod
+    def record_logs(logs: Iterable[EmailLogModel]) -> None:
+        """
+        Apply the status changes of logs to the rollup.
+
+        Each log moves one count from the status it was last stored with
+        (``stored_status``, none for new logs) to its current status.
+        """
+        logs = [
+            log
+            for log in logs
+            if getattr(log, "stored_status", None) != log.status
+        ]
+        if not logs:
+            return
+
+        slugs = EmailStatsRepository._template_slugs(logs)
+        deltas: Counter = Counter()
+        for log in logs:
+            slug = slugs.get(log.template_id, "")
+            hour = EmailStatsRepository.hour_of(log.created_at or timezone.now())
+            previous = getattr(log, "stored_status", None)
+            if previous:
+                deltas[(slug, previous, hour)] -= 1
+            deltas[(slug, log.status, hour)] += 1
+
+        EmailStatsRepository.apply_deltas(deltas)
+        for log in logs:
+            log.stored_status = log.status
+
+    @staticmethod
+    def _template_slugs(logs) -> Dict:
+        """Map template ids to slugs without a query per log."""
+        slugs = {}
+        missing = set()
+        for log in logs:
+            if log.template_id is None or log.template_id in slugs:
+                continue
+            if EmailLogModel.template.is_cached(log):
+                slugs[log.template_id] = log.template.slug
+            else:
+                missing.add(log.template_id)
+        if missing:
+            slugs.update(
+                EmailTemplateModel.objects.filter(pk__in=missing).values_list(
+                    "id", "slug"
+                )
+            )
+        return slugs
+
+    @staticmethod
+    def apply_deltas(deltas: Dict[StatsKey, int]) -> None:
+        """Add count deltas to their buckets, creating missing buckets."""
+        now = timezone.now()
+        for (slug, status, hour), delta in deltas.items():
+            if not delta:
+                continue
+            bucket = EmailStatsModel.objects.filter(
+                template_slug=slug, status=status, hour=hour
+            )
+            if bucket.update(count=F("count") + delta, updated_at=now):
+                continue
+            try:
+                with transaction.atomic():
+                    EmailStatsModel.objects.create(
+                        template_slug=slug, status=status, hour=hour, count=delta
+                    )
+            except IntegrityError:
+                # Created concurrently by another worker
+                bucket.update(count=F("count") + delta, updated_at=now)
+
+    @staticmethod
+    def get_count(
+        template_slug: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> int:
+        """Sum counts of the buckets matching the filters."""
+        qs = EmailStatsRepository._filter(template_slug, status, since, until)
+        return qs.aggregate(total=Sum("count"))["total"] or 0
+
+    @staticmethod
+    def get_breakdown(
+        template_slug: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """Sum counts per status."""
+        qs = EmailStatsRepository._filter(template_slug, None, since, until)
+        rows = qs.values("status").annotate(total=Sum("count"))
+        return {row["status"]: row["total"] for row in rows}
+
+    @staticmethod
+    def _filter(template_slug, status, since, until):
+        qs = EmailStatsModel.objects.all()
+        if template_slug is not None:
+            qs = qs.filter(template_slug=template_slug)
+        if status is not None:
+            qs = qs.filter(status=status)
+        if since is not None:
+            qs = qs.filter(hour__gte=EmailStatsRepository.hour_of(since))
+        if until is not None:
+            qs = qs.filter(hour__lt=until)
+        return qs
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild() -> int:
+        """
+        Recompute every bucket from the log table.
+
+        Meant for the initial backfill; logs that were archived are no
+        longer counted afterwards.
+
+        Returns:
+            int: Number of buckets written.
+        """
+        rows = (
+            EmailLogModel.objects.annotate(hour=TruncHour("created_at"))
+            .values("template__slug", "status", "hour")
+            .annotate(total=Count("id"))
+            .order_by()
+        )
+        buckets = [
+            EmailStatsModel(
+                template_slug=row["template__slug"] or "",
+                status=row["status"],
+                hour=row["hour"],
+                count=row["total"],
+            )
+            for row in rows
+        ]
+        EmailStatsModel.objects.all().delete()
+        EmailStatsModel.objects.bulk_create(buckets, batch_size=1000)
+        return len(buckets)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from django.db.models import QuerySet
 
 from apps.mailer.models import EmailTemplateModel
@@ -8,13 +8,22 @@ class EmailTemplateRepository:
     """Repository for EmailTemplate data access."""
 
     @staticmethod
-    def get_by_slug(slug: str, is_active: bool = True) -> Optional[EmailTemplateModel]:
-        """Retrieve a template by slug."""
+    def get_by_slug(
+        slug: str, language: str = "", is_active: bool = True
+    ) -> Optional[EmailTemplateModel]:
+        """Retrieve the variant of a template in language (blank for the fallback)."""
         try:
-            return EmailTemplateModel.objects.get(slug=slug, is_active=is_active)
+            return EmailTemplateModel.objects.get(
+                slug=slug, language=language, is_active=is_active
+            )
         except EmailTemplateModel.DoesNotExist:
             return None
 
+    @staticmethod
+    def get_variants(slug: str) -> List[EmailTemplateModel]:
+        """Retrieve every active language variant of a template."""
+        return list(EmailTemplateModel.objects.filter(slug=slug, is_active=True))
+
     @staticmethod
     def get_active_templates() -> QuerySet[EmailTemplateModel]:
         """Get all active templates."""
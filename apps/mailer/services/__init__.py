@@ -1,2 +1,23 @@
 from .email_sending_service import EmailSendingService
-from .email_template_service import EmailTemplateService
+from .email_template_service import EmailTemplateService, RenderedSkeleton
+from .template_cache_service import (
+    TemplateCacheService,
+    CompiledEmailTemplate,
+    CompiledTemplateFamily,
+)
+from .smtp_connection_pool import (
+    SMTPConnectionPool,
+    get_connection_pool,
+    close_connection_pool,
+)
+from .email_campaign_service import EmailCampaignService
+from .email_outbox_service import EmailOutboxService
+from .email_log_archive_service import EmailLogArchiveService
+from .email_stats_service import EmailStatsService
+from .send_scheduler_service import SendScheduler
+from .task_latency_service import TaskLatencyService
+from .context_storage_service import ContextStorageService
+from .email_tracking_service import EmailTrackingService
+from .async_smtp_engine import AsyncSendingEngine, AsyncSMTPSession
+from .email_retry_service import EmailRetryService
+from .email_dead_letter_service import EmailDeadLetterService
@@ -0,0 +1,277 @@
+import re
+import ssl
+import base64
+import asyncio
+import smtplib
+import logging
+from email.utils import parseaddr
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from django.conf import settings
+from django.core.mail.utils import DNS_NAME
+from django.core.mail.message import EmailMessage, sanitize_address
+
+from apps.mailer.constants import (
+    EMAIL_ASYNC_CONCURRENCY,
+    EMAIL_MAX_MESSAGES_PER_CONNECTION,
+)
+from .smtp_connection_pool import is_connection_lost
+
+logger = logging.getLogger("app.mailer.async_smtp")
+
+# Seconds to wait for the server when EMAIL_TIMEOUT is not set
+DEFAULT_TIMEOUT = 30
+
+LEADING_PERIOD = re.compile(rb"(?m)^\.")
+
+
+class AsyncSMTPSession:
+    """
+    Minimal SMTP client on asyncio streams.
+
+    Supports what Django's SMTP backend uses: implicit SSL, STARTTLS and
+    AUTH PLAIN. Failures raise the matching ``smtplib`` exceptions so
+    callers handle them exactly like errors of the blocking backend.
+    """
+
+    def __init__(self):
+        self.host = settings.EMAIL_HOST
+        self.port = settings.EMAIL_PORT
+        self.username = settings.EMAIL_HOST_USER
+        self.password = settings.EMAIL_HOST_PASSWORD
+        self.use_tls = settings.EMAIL_USE_TLS
+        self.use_ssl = settings.EMAIL_USE_SSL
+        self.timeout = settings.EMAIL_TIMEOUT or DEFAULT_TIMEOUT
+        self.sent = 0
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None
+
+    async def connect(self) -> None:
+        """Open the session: greeting, EHLO, STARTTLS and login."""
+        context = ssl.create_default_context() if self.use_ssl else None
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=context),
+            self.timeout,
+        )
+
+        code, reply = await self._read_reply()
+        if code != 220:
+            raise smtplib.SMTPConnectError(code, reply)
+
+        await self._ehlo()
+        if self.use_tls:
+            await self._expect("STARTTLS", 220)
+            await self._writer.start_tls(
+                ssl.create_default_context(), server_hostname=self.host
+            )
+            await self._ehlo()
+
+        if self.username and self.password:
+            token = base64.b64encode(
+                f"\0{self.username}\0{self.password}".encode()
+            ).decode()
+            code, reply = await self._command(f"AUTH PLAIN {token}")
+            if code != 235:
+                raise smtplib.SMTPAuthenticationError(code, reply)
+
+    @staticmethod
+    def _envelope_address(address: str, encoding: str) -> str:
+        """Bare address for MAIL FROM / RCPT TO, without any display name."""
+        return parseaddr(sanitize_address(address, encoding))[1]
+
+    async def send(self, message: EmailMessage) -> None:
+        """Deliver one message over the open session."""
+        encoding = message.encoding or settings.DEFAULT_CHARSET
+        from_email = self._envelope_address(message.from_email, encoding)
+        recipients = [
+            self._envelope_address(addr, encoding) for addr in message.recipients()
+        ]
+        data = message.message().as_bytes(linesep="\r\n")
+
+        code, reply = await self._command(f"MAIL FROM:<{from_email}>")
+        if code != 250:
+            await self._reset()
+            raise smtplib.SMTPSenderRefused(code, reply, from_email)
+
+        refused: Dict[str, Tuple[int, bytes]] = {}
+        for recipient in recipients:
+            code, reply = await self._command(f"RCPT TO:<{recipient}>")
+            if code not in (250, 251):
+                refused[recipient] = (code, reply)
+        if len(refused) == len(recipients):
+            await self._reset()
+            raise smtplib.SMTPRecipientsRefused(refused)
+
+        code, reply = await self._command("DATA")
+        if code != 354:
+            await self._reset()
+            raise smtplib.SMTPDataError(code, reply)
+
+        data = LEADING_PERIOD.sub(b"..", data)
+        if not data.endswith(b"\r\n"):
+            data += b"\r\n"
+        self._writer.write(data + b".\r\n")
+        code, reply = await self._read_reply()
+        if code != 250:
+            await self._reset()
+            raise smtplib.SMTPDataError(code, reply)
+
+        self.sent += 1
+
+    async def close(self, quit: bool = True) -> None:
+        """Say QUIT (unless the session is broken) and close, ignoring errors."""
+        if self._writer is None:
+            return
+        if quit:
+            try:
+                await self._command("QUIT")
+            except Exception:
+                pass
+        try:
+            self._writer.close()
+            await self._writer.wait_closed()
+        except Exception:
+            pass
+        self._reader = self._writer = None
+
+    async def _ehlo(self) -> None:
+        code, reply = await self._command(f"EHLO {DNS_NAME}")
+        if code != 250:
+            await self._expect(f"HELO {DNS_NAME}", 250)
+
+    async def _reset(self) -> None:
+        await self._command("RSET")
+
+    async def _expect(self, line: str, expected: int) -> bytes:
+        code, reply = await self._command(line)
+        if code != expected:
+            raise smtplib.SMTPResponseException(code, reply)
+        return reply
+
+    async def _command(self, line: str) -> Tuple[int, bytes]:
+        self._writer.write(f"{line}\r\n".encode())
+        return await self._read_reply()
+
+    async def _read_reply(self) -> Tuple[int, bytes]:
+        lines = []
+        try:
+            while True:
+                await self._writer.drain()
+                line = await asyncio.wait_for(self._reader.readline(), self.timeout)
+                if not line:
+                    raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+                lines.append(line[4:].strip())
+                if line[3:4] != b"-":
+                    return int(line[:3]), b"\n".join(lines)
+        except (ConnectionError, asyncio.IncompleteReadError) as e:
+            raise smtplib.SMTPServerDisconnected(str(e))
+
+
+class AsyncSendingEngine:
+    """
+    Sends a batch of messages over many concurrent SMTP sessions.
+
+    Every batch runs its own event loop: at most ``concurrency`` messages
+    are in flight at once, sessions are reused between messages of the
+    batch and closed when it is done. Like ``SMTPConnectionPool.send_each``
+    a rejected message only fails itself, and a dropped session is
+    replaced and the message retried once.
+    """
+
+    def __init__(self, concurrency: int = EMAIL_ASYNC_CONCURRENCY):
+        self.concurrency = max(1, concurrency)
+
+    def send_each(
+        self,
+        messages: Sequence[EmailMessage],
+        reserve: Optional[Callable[[], float]] = None,
+    ) -> List[Optional[Exception]]:
+        """
+        Send messages concurrently.
+
+        Args:
+            messages: Messages to send
+            reserve: Optional callable taking a send token and returning
+                the seconds to wait when none is available
+
+        Returns:
+            list: ``None`` for every sent message, else the raised error.
+        """
+        if not messages:
+            return []
+        return asyncio.run(self._send_each(messages, reserve))
+
+    async def _send_each(
+        self,
+        messages: Sequence[EmailMessage],
+        reserve: Optional[Callable[[], float]],
+    ) -> List[Optional[Exception]]:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        batch = _Batch()
+        errors: List[Optional[Exception]] = [None] * len(messages)
+
+        async def send_one(index: int, message: EmailMessage) -> None:
+            async with semaphore:
+                if reserve is not None and batch.unreachable is None:
+                    while wait := reserve():
+                        await asyncio.sleep(wait)
+                errors[index] = await self._deliver(message, batch)
+
+        try:
+            await asyncio.gather(
+                *(send_one(index, message) for index, message in enumerate(messages))
+            )
+        finally:
+            await asyncio.gather(
+                *(session.close() for session in batch.idle), return_exceptions=True
+            )
+        return errors
+
+    async def _deliver(self, message: EmailMessage, batch: "_Batch") -> Optional[Exception]:
+        for attempt in range(2):
+            if batch.unreachable is not None:
+                return batch.unreachable
+
+            session = batch.idle.pop() if batch.idle else None
+            if session is None:
+                session = AsyncSMTPSession()
+                try:
+                    await session.connect()
+                except Exception as e:
+                    await session.close(quit=False)
+                    if is_connection_lost(e) and not attempt:
+                        continue
+                    if is_connection_lost(e):
+                        # Server unreachable, fail the rest of the batch
+                        batch.unreachable = e
+                    return e
+
+            try:
+                await session.send(message)
+            except Exception as e:
+                if not is_connection_lost(e):
+                    # Message rejected, the session is still usable
+                    batch.idle.append(session)
+                    return e
+                await session.close(quit=False)
+                if attempt:
+                    return e
+                logger.warning(f"Async SMTP session failed, reconnecting: {e}")
+                continue
+
+            if session.sent >= EMAIL_MAX_MESSAGES_PER_CONNECTION:
+                await session.close()
+            else:
+                batch.idle.append(session)
+            return None
+
+
+class _Batch:
+    """Sessions and failure state shared by the messages of one batch."""
+
+    def __init__(self):
+        self.idle: List[AsyncSMTPSession] = []
+        self.unreachable: Optional[Exception] = None
@@ -0,0 +1,148 @@
+import hmac
+import json
+import hashlib
+import threading
+from typing import Dict, Iterable, List
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from apps.mailer.models import EmailTemplateModel
+from apps.mailer.repositories import EmailContextValueRepository
+
+# Key of the shared value ids in a stored context
+SHARED_KEY = "_shared"
+
+# Stored in place of redacted variables
+REDACTED = "***"
+
+# Shared value ids remembered per process before the memo is reset
+MAX_MEMOIZED_VALUES = 10000
+
+
+class ContextStorageService:
+    """
+    Compacts render contexts before they are stored on email logs.
+
+    A template's ``context_policy`` lists the variables to ``keep`` as is,
+    to ``hash`` (keyed HMAC, so equal values can still be matched), to
+    ``redact`` and to store once in the ``shared`` value table. Variables
+    the policy does not mention are dropped. Templates without a policy
+    store the full context.
+    """
+
+    _shared_ids: Dict[str, int] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def _dumps(value) -> str:
+        return json.dumps(value, cls=DjangoJSONEncoder, sort_keys=True)
+
+    @classmethod
+    def hash_value(cls, value) -> str:
+        """Return the stored form of a hashed variable."""
+        digest = hmac.new(
+            settings.SECRET_KEY.encode(),
+            cls._dumps(value).encode(),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"hmac:{digest[:16]}"
+
+    @classmethod
+    def compact(cls, template: EmailTemplateModel, context: Dict) -> Dict:
+        """Return the form of context to store on a log of template."""
+        return cls.compact_many(template, [context])[0]
+
+    @classmethod
+    def compact_many(
+        cls, template: EmailTemplateModel, contexts: Iterable[Dict]
+    ) -> List[Dict]:
+        """
+        Compact many contexts of one template.
+
+        Shared values are resolved together, with at most two queries for
+        values this process has not seen before.
+        """
+        contexts = list(contexts)
+        policy = template.context_policy or {}
+        if not policy:
+            return contexts
+
+        keep = policy.get("keep", [])
+        hashed = policy.get("hash", [])
+        redact = policy.get("redact", [])
+        shared = policy.get("shared", [])
+
+        stored_contexts, shared_digests = [], []
+        resolved: Dict[str, int] = {}
+        pending: Dict[str, Dict] = {}
+        for context in contexts:
+            stored = {name: context[name] for name in keep if name in context}
+            stored.update(
+                (name, cls.hash_value(context[name]))
+                for name in hashed
+                if name in context
+            )
+            stored.update((name, REDACTED) for name in redact if name in context)
+
+            digests = []
+            for name in shared:
+                if name not in context:
+                    continue
+                value = {"name": name, "value": context[name]}
+                digest = hashlib.sha256(cls._dumps(value).encode()).hexdigest()
+                digests.append(digest)
+                if digest in resolved or digest in pending:
+                    continue
+                known = cls._shared_ids.get(digest)
+                if known is None:
+                    pending[digest] = value
+                else:
+                    resolved[digest] = known
+
+            stored_contexts.append(stored)
+            shared_digests.append(digests)
+
+        if pending:
+            ids = EmailContextValueRepository.get_or_create_ids(pending)
+            resolved.update(ids)
+            with cls._lock:
+                if len(cls._shared_ids) + len(ids) > MAX_MEMOIZED_VALUES:
+                    cls._shared_ids.clear()
+                cls._shared_ids.update(ids)
+
+        for stored, digests in zip(stored_contexts, shared_digests):
+            if digests:
+                stored[SHARED_KEY] = sorted(resolved[digest] for digest in digests)
+        return stored_contexts
+
+    @staticmethod
+    def is_lossless(template: EmailTemplateModel, available: Iterable[str] = ()) -> bool:
+        """
+        True if stored contexts of template are enough to render it again.
+
+        That is the case without a policy, or when nothing is hashed or
+        redacted and every declared template variable is kept, shared or
+        in available (variables the caller restores from elsewhere).
+        """
+        policy = template.context_policy or {}
+        if not policy:
+            return True
+        if policy.get("hash") or policy.get("redact") or not template.variables:
+            return False
+        stored = set(policy.get("keep", [])) | set(policy.get("shared", []))
+        return set(template.variables) <= stored | set(available)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Forget the shared value ids memoized in this process."""
+        with cls._lock:
+            cls._shared_ids.clear()
+
+    @staticmethod
+    def expand(context_data: Dict) -> Dict:
+        """Return a stored context with its shared values filled back in."""
+        context = dict(context_data or {})
+        shared_ids = context.pop(SHARED_KEY, None)
+        if shared_ids:
+            context.update(EmailContextValueRepository.get_values(shared_ids))
+        return context
@@ -0,0 +1,107 @@
+from typing import Dict, List
+
+from apps.mailer.models import EmailCampaignModel
+from apps.mailer.exceptions import EmailServiceError
+from apps.mailer.repositories import EmailCampaignRepository
+from apps.mailer.constants import (
+    EmailStatus,
+    CampaignChunkStatus,
+    EMAIL_CAMPAIGN_CHUNK_SIZE,
+)
+from .email_sending_service import EmailSendingService
+
+
+class EmailCampaignService:
+    """
+    Service for chunked bulk campaigns.
+
+    A campaign stores its recipients as fixed-size chunks so that every
+    chunk can be sent by a separate task, and a task that crashes only
+    has its own chunk redone.
+    """
+
+    @staticmethod
+    def create_campaign(
+        template_slug: str,
+        recipients: List[Dict[str, str]],
+        context: Dict,
+        chunk_size: int = EMAIL_CAMPAIGN_CHUNK_SIZE,
+    ) -> EmailCampaignModel:
+        """Create a campaign and its recipient chunks."""
+        return EmailCampaignRepository.create_campaign(
+            template_slug=template_slug,
+            recipients=recipients,
+            context=context,
+            chunk_size=max(1, chunk_size),
+        )
+
+    @staticmethod
+    def send_chunk(chunk_id) -> Dict:
+        """
+        Send one chunk of a campaign and record its counts.
+
+        Sending an already completed chunk is a no-op, which makes
+        redelivered tasks safe.
+
+        Returns:
+            dict: sent/failed counts of the chunk.
+        """
+        chunk = EmailCampaignRepository.get_chunk(chunk_id)
+        if chunk is None:
+            raise EmailServiceError(f"Campaign chunk '{chunk_id}' not found")
+
+        if chunk.status != CampaignChunkStatus.PENDING:
+            return {"sent": chunk.sent, "failed": chunk.failed}
+
+        campaign = chunk.campaign
+        logs = EmailSendingService().send_bulk_emails(
+            template_slug=campaign.template_slug,
+            recipients=chunk.recipients,
+            context=campaign.context,
+        )
+        sent = len([log for log in logs if log.status == EmailStatus.SENT])
+        failed = len(chunk.recipients) - sent
+
+        EmailCampaignRepository.complete_chunk(chunk, sent=sent, failed=failed)
+        return {"sent": sent, "failed": failed}
+
+    @staticmethod
+    def fail_chunk(chunk_id) -> Dict:
+        """
+        Give up on a chunk that could not be sent.
+
+        Its recipients are counted as failed, so the campaign can still
+        be finalized.
+
+        Returns:
+            dict: sent/failed counts of the chunk.
+        """
+        chunk = EmailCampaignRepository.get_chunk(chunk_id)
+        if chunk is None:
+            return {"sent": 0, "failed": 0}
+
+        if EmailCampaignRepository.fail_chunk(chunk):
+            return {"sent": 0, "failed": len(chunk.recipients)}
+        return {"sent": chunk.sent, "failed": chunk.failed}
+
+    @staticmethod
+    def get_progress(campaign_id) -> Dict:
+        """
+        Return the aggregate progress of a campaign.
+
+        Raises:
+            EmailServiceError: If the campaign does not exist.
+        """
+        campaign = EmailCampaignRepository.get_by_id(campaign_id)
+        if campaign is None:
+            raise EmailServiceError(f"Campaign '{campaign_id}' not found")
+
+        return {
+            "campaign_id": str(campaign.id),
+            "status": campaign.status,
+            "total": campaign.total,
+            "queued": campaign.queued,
+            "sent": campaign.sent,
+            "failed": campaign.failed,
+            "finished_at": campaign.finished_at,
+        }
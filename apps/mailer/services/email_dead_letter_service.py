@@ -0,0 +1,42 @@
+import logging
+from typing import Dict, Iterable, Optional
+
+from apps.mailer.models import EmailDeadLetterModel
+from apps.mailer.repositories import EmailDeadLetterRepository
+
+logger = logging.getLogger("app.mailer.dead_letter")
+
+
+class EmailDeadLetterService:
+    """
+    Records send requests that can never succeed.
+
+    Rejecting costs one INSERT: nothing is rendered or sent, no email log
+    is written and the request is not retried.
+    """
+
+    @staticmethod
+    def reject(
+        template_slug: str,
+        recipient_email: str,
+        context: Dict,
+        reason: str,
+        recipient_name: str = "",
+        missing_variables: Iterable[str] = (),
+        idempotency_key: Optional[str] = None,
+    ) -> EmailDeadLetterModel:
+        """Dead-letter a send request."""
+        missing_variables = list(missing_variables)
+        logger.warning(
+            f"Rejected email '{template_slug}' to {recipient_email}: {reason}"
+            + (f" ({', '.join(missing_variables)})" if missing_variables else "")
+        )
+        return EmailDeadLetterRepository.create_entry(
+            template_slug=template_slug,
+            recipient_email=recipient_email,
+            recipient_name=recipient_name,
+            reason=reason,
+            missing_variables=missing_variables,
+            context_keys=context or {},
+            idempotency_key=idempotency_key or "",
+        )
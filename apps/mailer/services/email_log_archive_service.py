@@ -0,0 +1,143 @@
+import gzip
+import json
+import logging
+from pathlib import Path
+from datetime import datetime, timedelta
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from apps.mailer.repositories import EmailLogRepository
+from apps.mailer.constants import (
+    EMAIL_LOG_ARCHIVE_DIR,
+    EMAIL_LOG_RETENTION_DAYS,
+    EMAIL_LOG_ARCHIVE_BATCH_SIZE,
+)
+
+logger = logging.getLogger("app.mailer.archive")
+
+DATETIME_FIELDS = ("sent_at", "opened_at", "clicked_at", "updated_at", "created_at")
+
+
+class EmailLogArchiveService:
+    """
+    Service for moving old email logs to compressed JSONL files.
+
+    Logs are written to one gzip file per creation day
+    (``<archive_dir>/YYYY/MM/email_logs-YYYY-MM-DD.jsonl.gz``). Each batch
+    is appended as a separate gzip member, so a file can grow over many
+    runs and is still read back as one stream.
+    """
+
+    @staticmethod
+    def get_archive_dir(archive_dir: Optional[str] = None) -> Path:
+        """Resolve the archive directory (relative paths use BASE_DIR)."""
+        path = Path(archive_dir or EMAIL_LOG_ARCHIVE_DIR)
+        if not path.is_absolute():
+            path = Path(settings.BASE_DIR) / path
+        return path
+
+    @staticmethod
+    def archive(
+        retention_days: int = EMAIL_LOG_RETENTION_DAYS,
+        archive_dir: Optional[str] = None,
+        batch_size: int = EMAIL_LOG_ARCHIVE_BATCH_SIZE,
+    ) -> Dict:
+        """
+        Archive and delete logs older than the retention window.
+
+        Every batch is written to disk before its rows are deleted, so an
+        interrupted run never loses logs (a rerun may archive a batch
+        twice, which rehydration tolerates).
+
+        Returns:
+            dict: Number of archived logs and the files written to.
+        """
+        cutoff = timezone.now() - timedelta(days=retention_days)
+        root = EmailLogArchiveService.get_archive_dir(archive_dir)
+
+        archived = 0
+        files = set()
+        cursor = None
+
+        while True:
+            rows = EmailLogRepository.get_logs_before(
+                cutoff, limit=batch_size, after=cursor
+            )
+            if not rows:
+                break
+
+            files.update(EmailLogArchiveService._write_batch(root, rows))
+            EmailLogRepository.delete_by_ids([row["id"] for row in rows])
+
+            archived += len(rows)
+            cursor = (rows[-1]["created_at"], rows[-1]["id"])
+
+        if archived:
+            logger.info(f"Archived {archived} email logs older than {cutoff}")
+
+        return {"archived": archived, "files": sorted(str(f) for f in files)}
+
+    @staticmethod
+    def _write_batch(root: Path, rows: List[dict]) -> List[Path]:
+        """Append rows to their daily archive files."""
+        by_day = defaultdict(list)
+        for row in rows:
+            by_day[row["created_at"].date()].append(row)
+
+        paths = []
+        for day, day_rows in by_day.items():
+            path = root / f"{day:%Y}" / f"{day:%m}" / f"email_logs-{day:%Y-%m-%d}.jsonl.gz"
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            with gzip.open(path, "at", encoding="utf-8") as fh:
+                for row in day_rows:
+                    fh.write(EmailLogArchiveService.dumps(row) + "\n")
+            paths.append(path)
+
+        return paths
+
+    @staticmethod
+    def dumps(row: dict) -> str:
+        """Serialize a log row to one JSON line, keeping full timestamps."""
+
+        def default(value):
+            if isinstance(value, datetime):
+                return value.isoformat()
+            return str(value)
+
+        return json.dumps(row, default=default, ensure_ascii=False)
+
+    @staticmethod
+    def iter_archive(path: str) -> Iterator[dict]:
+        """Stream the logs stored in an archive file one by one."""
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            for line in fh:
+                if not line.strip():
+                    continue
+                row = json.loads(line)
+                for field in DATETIME_FIELDS:
+                    if row.get(field):
+                        row[field] = parse_datetime(row[field])
+                yield row
+
+    @staticmethod
+    def rehydrate(path: str, batch_size: int = EMAIL_LOG_ARCHIVE_BATCH_SIZE) -> int:
+        """
+        Load an archive file back into the log table.
+
+        Returns:
+            int: Number of restored logs.
+        """
+        restored = 0
+        batch = []
+        for row in EmailLogArchiveService.iter_archive(path):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                restored += EmailLogRepository.restore_logs(batch)
+                batch = []
+        if batch:
+            restored += EmailLogRepository.restore_logs(batch)
+        return restored
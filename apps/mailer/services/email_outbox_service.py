@@ -0,0 +1,80 @@
+import logging
+from typing import Dict
+from django.db import transaction
+
+from apps.mailer.models import EmailOutboxModel
+from apps.mailer.constants import EMAIL_OUTBOX_BATCH_SIZE
+from apps.mailer.repositories import EmailOutboxRepository
+
+logger = logging.getLogger("app.mailer.outbox")
+
+
+class EmailOutboxService:
+    """
+    Transactional outbox for emails.
+
+    ``enqueue`` only writes a row, so it can run inside the caller's
+    transaction without touching the broker. ``relay`` publishes due rows
+    to Celery in batches and is driven by the ``relay_email_outbox``
+    management command or the periodic ``relay_email_outbox_async`` task.
+    """
+
+    @staticmethod
+    def enqueue(
+        template_slug: str,
+        recipient_email: str,
+        context: Dict,
+        recipient_name: str = "",
+    ) -> EmailOutboxModel:
+        """Queue an email to be sent once the current transaction commits."""
+        return EmailOutboxRepository.create_entry(
+            template_slug=template_slug,
+            recipient_email=recipient_email,
+            recipient_name=recipient_name,
+            context=context,
+        )
+
+    @staticmethod
+    def relay(batch_size: int = EMAIL_OUTBOX_BATCH_SIZE) -> Dict:
+        """
+        Publish one batch of due outbox entries to ``send_email_async``.
+
+        Published rows are deleted. When the broker rejects a publish the
+        rest of the batch is postponed with exponential backoff.
+
+        Returns:
+            dict: Number of published and postponed entries.
+        """
+        from config.celery import app
+        from apps.mailer.tasks import send_email_async
+
+        with transaction.atomic():
+            entries = EmailOutboxRepository.claim_batch(batch_size)
+            if not entries:
+                return {"published": 0, "postponed": 0}
+
+            published, postponed = [], []
+            with app.producer_or_acquire() as producer:
+                for index, entry in enumerate(entries):
+                    try:
+                        send_email_async.apply_async(
+                            kwargs={
+                                "template_slug": entry.template_slug,
+                                "recipient_email": entry.recipient_email,
+                                "context": entry.context,
+                                "recipient_name": entry.recipient_name,
+                                # Publishing the entry twice still sends once
+                                "idempotency_key": f"outbox:{entry.pk}",
+                            },
+                            producer=producer,
+                        )
+                    except Exception as e:
+                        logger.error(f"Failed to relay email outbox entries: {e}")
+                        postponed = entries[index:]
+                        EmailOutboxRepository.postpone(postponed, str(e))
+                        break
+                    published.append(entry.pk)
+
+            EmailOutboxRepository.delete_entries(published)
+
+        return {"published": len(published), "postponed": len(postponed)}
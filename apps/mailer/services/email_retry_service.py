@@ -0,0 +1,179 @@
+import logging
+from datetime import timedelta
+from typing import Dict, List
+from django.conf import settings
+from django.utils import timezone
+from django.core.cache import cache
+
+from apps.mailer.models import EmailLogModel
+from apps.mailer.constants import (
+    EmailStatus,
+    EMAIL_RETRY_BATCH_SIZE,
+    EMAIL_RETRY_MAX_AGE_HOURS,
+    EMAIL_IDEMPOTENCY_TTL,
+    EMAIL_RECIPIENT_VARIABLES,
+)
+from apps.mailer.repositories import EmailLogRepository
+from .email_template_service import EmailTemplateService
+from .send_scheduler_service import SendScheduler
+from .context_storage_service import ContextStorageService
+from .email_tracking_service import EmailTrackingService
+from .email_sending_service import IDEMPOTENCY_CACHE_KEY, EmailSendingService
+from .smtp_connection_pool import get_connection_pool
+
+logger = logging.getLogger("app.mailer.retry")
+
+# Held while a sweep runs, renewed for every chunk. Overlapping runs
+# would not send twice (every log is claimed), they only waste work.
+SWEEP_LOCK_KEY = "mailer:retry:sweep"
+SWEEP_LOCK_TIMEOUT = 15 * 60
+
+
+class EmailRetryService:
+    """
+    Resends failed emails.
+
+    ``sweep`` walks failed logs that are due (see
+    ``EmailLogRepository.schedule_retry``) in chunks ordered by
+    (created_at, id), so memory stays bounded however many failures
+    there are. The logs of a chunk are claimed first, so a pending Celery
+    retry of the same send or another sweep cannot send them as well.
+    Claimed logs are rendered again from the log's template and stored
+    context, sent over the pooled SMTP connection and their statuses
+    written with one bulk update. Logs whose stored context
+    cannot render the template again (hashed or redacted variables) or
+    whose template is gone are given up instead.
+    """
+
+    def __init__(self):
+        self.template_service = EmailTemplateService()
+        self.log_repository = EmailLogRepository()
+        self.scheduler = SendScheduler()
+
+    def sweep(
+        self,
+        batch_size: int = EMAIL_RETRY_BATCH_SIZE,
+        max_age_hours: int = EMAIL_RETRY_MAX_AGE_HOURS,
+    ) -> Dict[str, int]:
+        """
+        Resend every due failed log created in the last max_age_hours.
+
+        Returns:
+            dict: Number of logs sent, failed again and given up.
+        """
+        totals = {"sent": 0, "failed": 0, "given_up": 0}
+        if not cache.add(SWEEP_LOCK_KEY, 1, timeout=SWEEP_LOCK_TIMEOUT):
+            logger.info("Email retry sweep already running, skipped")
+            return totals
+
+        try:
+            created_after = timezone.now() - timedelta(hours=max_age_hours)
+            cursor = None
+            while True:
+                logs = self.log_repository.get_retryable_logs(
+                    created_after, batch_size, after=cursor
+                )
+                if not logs:
+                    break
+                cursor = (logs[-1].created_at, logs[-1].pk)
+                cache.touch(SWEEP_LOCK_KEY, SWEEP_LOCK_TIMEOUT)
+                for outcome, count in self._retry_batch(logs).items():
+                    totals[outcome] += count
+                if len(logs) < batch_size:
+                    break
+        finally:
+            cache.delete(SWEEP_LOCK_KEY)
+
+        if any(totals.values()):
+            logger.info(f"Email retry sweep: {totals}")
+        return totals
+
+    def _retry_batch(self, logs: List[EmailLogModel]) -> Dict[str, int]:
+        """Claim, render, send and record statuses for one chunk of failed logs."""
+        counts = {"sent": 0, "failed": 0, "given_up": 0}
+        from_email = settings.DEFAULT_FROM_EMAIL
+
+        logs = self.log_repository.claim_for_retry(logs)
+        if not logs:
+            return counts
+
+        retried, messages = [], []
+        for log in logs:
+            message = self._build_message(log, from_email)
+            if message is None:
+                self.log_repository.give_up_retries(log)
+                counts["given_up"] += 1
+                continue
+            retried.append(log)
+            messages.append(message)
+
+        # Resends take tokens from the same rate budget as first sends
+        slugs = iter([log.template.slug for log in retried])
+        errors = get_connection_pool().send_each(
+            messages, before_send=lambda: self.scheduler.acquire(next(slugs))
+        )
+
+        now = timezone.now()
+        for log, error in zip(retried, errors):
+            log.retry_count += 1
+            if error is None:
+                log.status = EmailStatus.SENT
+                log.sent_at = now
+                log.error_message = ""
+                log.next_retry_at = None
+                self._remember_sent(log)
+                counts["sent"] += 1
+            else:
+                log.error_message = str(error)
+                self.log_repository.schedule_retry(log)
+                counts["failed"] += 1
+
+        self.log_repository.bulk_update_statuses(logs)
+        return counts
+
+    def _build_message(self, log: EmailLogModel, from_email: str):
+        """Render log's email again, or return None if that is not possible."""
+        template = log.template
+        if template is None or not template.is_active:
+            return None
+        # Recipient variables are restored from the log row itself
+        if not ContextStorageService.is_lossless(template, EMAIL_RECIPIENT_VARIABLES):
+            return None
+
+        try:
+            compiled = self.template_service.get_compiled_template(
+                template.slug, template.language
+            )
+            context = {
+                "recipient_name": log.recipient_name,
+                "recipient_email": log.recipient_email,
+                **ContextStorageService.expand(log.context_data),
+            }
+            html_content, text_content = self.template_service.render_template(
+                compiled, context
+            )
+        except Exception as e:
+            logger.warning(f"Cannot render failed email {log.pk} again: {e}")
+            return None
+
+        if template.track_engagement:
+            html_content = EmailTrackingService.instrument(html_content, log.pk)
+
+        # The subject is resent as logged, the first render already used it
+        return EmailSendingService._build_message(
+            subject=log.subject,
+            text_content=text_content,
+            html_content=html_content,
+            recipient_email=log.recipient_email,
+            from_email=from_email,
+        )
+
+    @staticmethod
+    def _remember_sent(log: EmailLogModel) -> None:
+        """Keep a pending Celery retry of the same send request from sending again."""
+        if log.idempotency_key:
+            cache.set(
+                IDEMPOTENCY_CACHE_KEY.format(key=log.idempotency_key),
+                {"log_id": str(log.pk), "sent": True},
+                timeout=EMAIL_IDEMPOTENCY_TTL,
+            )
@@ -1,20 +1,50 @@
 from django.conf import settings
+from django.utils import timezone
+from django.db import IntegrityError
+from django.core.cache import cache
 from typing import Dict, Optional, List
-from django.template import Context, Template
 from django.core.mail import EmailMultiAlternatives
 
+from apps.accounts.services import UserLanguageService
 from apps.mailer.models import EmailLogModel
-from apps.mailer.exceptions import EmailSendError
+from apps.mailer.constants import (
+    EmailStatus,
+    SendingEngine,
+    EMAIL_BULK_BATCH_SIZE,
+    EMAIL_SENDING_ENGINE,
+    EMAIL_IDEMPOTENCY_TTL,
+    EMAIL_RECIPIENT_VARIABLES,
+)
+from apps.mailer.exceptions import EmailSendError, SendRateLimited
 from apps.mailer.repositories import EmailLogRepository
-from .email_template_service import EmailTemplateService
+from .email_template_service import EmailTemplateService, RenderedSkeleton
+from .template_cache_service import CompiledEmailTemplate, CompiledTemplateFamily
+from .send_scheduler_service import SendScheduler
+from .context_storage_service import ContextStorageService
+from .email_tracking_service import EmailTrackingService
+from .smtp_connection_pool import get_connection_pool
+from .async_smtp_engine import AsyncSendingEngine
+
+IDEMPOTENCY_CACHE_KEY = "mailer:idempotency:{key}"
 
 
 class EmailSendingService:
-    """Service for sending emails."""
+    """
+    Service for sending emails.
+
+    Bulk batches are sent by the configured engine (``engine`` overrides
+    ``EMAIL_SENDING_ENGINE``): one message at a time over the SMTP
+    connection pool, or concurrently by the asyncio engine. The asyncio
+    engine speaks SMTP itself, so other email backends always use the pool.
+    """
+
+    SMTP_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 
-    def __init__(self):
+    def __init__(self, engine: Optional[str] = None):
         self.template_service = EmailTemplateService()
         self.log_repository = EmailLogRepository()
+        self.scheduler = SendScheduler()
+        self.engine = engine or EMAIL_SENDING_ENGINE
 
     def send_email(
         self,
@@ -23,38 +53,85 @@ class EmailSendingService:
         context: Dict,
         recipient_name: str = "",
         from_email: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        language: Optional[str] = None,
     ) -> EmailLogModel:
         """
         Send an email using a template.
 
+        Calls repeated with the same idempotency_key resume the log of the
+        first call: nothing is sent again once the message was delivered,
+        and a failed attempt is retried without creating another log.
+        Of concurrent calls with the same key only the one that claims the
+        log sends, the others return it unsent.
+
         Args:
             template_slug: The slug of the email template
             recipient_email: Recipient's email address
             context: Dictionary of variables for template rendering
             recipient_name: Optional recipient name
             from_email: Optional sender email (defaults to settings)
+            idempotency_key: Optional key identifying this send request
+            language: Optional language of the template variant to send
+                (defaults to the recipient's settings language)
 
         Returns:
             EmailLog: The created log entry
+
+        Raises:
+            SendRateLimited: If the send rate budget is used up, before
+                anything is logged or sent.
         """
         try:
-            # Get and render template
-            template = self.template_service.get_template(template_slug)
+            # A retried request picks up where the previous attempt stopped
+            email_log = self._resume_log(idempotency_key)
+            if email_log is not None and email_log.status == EmailStatus.SENT:
+                return email_log
+
+            # Get the compiled variant in the recipient's language
+            if language is None:
+                language = UserLanguageService.get_language(recipient_email)
+            compiled = self.template_service.get_compiled_template(
+                template_slug, language
+            )
+
+            # Take a token from the shared send rate budget
+            wait = self.scheduler.reserve(template_slug)
+            if wait:
+                raise SendRateLimited(retry_after=wait)
+
             html_content, text_content = self.template_service.render_template(
-                template, context
+                compiled, context
             )
 
             # Render subject with context
-            subject = Template(template.subject).render(Context(context))
+            subject = self.template_service.render_subject(compiled, context)
 
             # Create log entry
-            email_log = self.log_repository.create_log(
-                template=template,
-                recipient_email=recipient_email,
-                subject=subject,
-                context_data=context,
-                recipient_name=recipient_name,
-            )
+            if email_log is None:
+                email_log = self._create_log(
+                    template=compiled.template,
+                    recipient_email=recipient_email,
+                    subject=subject,
+                    context_data=ContextStorageService.compact(
+                        compiled.template, context
+                    ),
+                    recipient_name=recipient_name,
+                    idempotency_key=idempotency_key,
+                )
+                if email_log.status == EmailStatus.SENT:
+                    return email_log
+
+            # Concurrent deliveries of the same request: only one sends
+            if idempotency_key and not self.log_repository.claim_for_sending(
+                email_log
+            ):
+                return email_log
+
+            if compiled.template.track_engagement:
+                html_content = EmailTrackingService.instrument(
+                    html_content, email_log.pk
+                )
 
             # Send email
             self._send_email_message(
@@ -64,10 +141,13 @@ class EmailSendingService:
                 recipient_email=recipient_email,
                 from_email=from_email or settings.DEFAULT_FROM_EMAIL,
                 email_log=email_log,
+                idempotency_key=idempotency_key,
             )
 
             return email_log
 
+        except SendRateLimited:
+            raise
         except Exception as e:
             raise EmailSendError(f"Failed to send email: {str(e)}")
 
@@ -79,60 +159,281 @@ class EmailSendingService:
         recipient_email: str,
         from_email: str,
         email_log: EmailLogModel,
+        idempotency_key: Optional[str] = None,
     ):
         """Send the actual email message."""
         try:
-            email = EmailMultiAlternatives(
+            email = self._build_message(
                 subject=subject,
-                body=text_content,
+                text_content=text_content,
+                html_content=html_content,
+                recipient_email=recipient_email,
                 from_email=from_email,
-                to=[recipient_email],
             )
-            email.attach_alternative(html_content, "text/html")
-            email.send(fail_silently=False)
-
-            self.log_repository.mark_as_sent(email_log)
-
+            # Reuse a warm connection of this worker process
+            get_connection_pool().send_messages([email])
         except Exception as e:
             self.log_repository.mark_as_failed(email_log, str(e))
             raise
 
+        # Delivered: a retry must not send again even if the log update fails
+        if idempotency_key:
+            self._remember(idempotency_key, email_log, sent=True)
+        self.log_repository.mark_as_sent(email_log)
+
+    @staticmethod
+    def _idempotency_cache_key(key: str) -> str:
+        return IDEMPOTENCY_CACHE_KEY.format(key=key)
+
+    def _remember(self, key: str, email_log: EmailLogModel, sent: bool) -> None:
+        cache.set(
+            self._idempotency_cache_key(key),
+            {"log_id": str(email_log.pk), "sent": sent},
+            timeout=EMAIL_IDEMPOTENCY_TTL,
+        )
+
+    def _resume_log(self, key: Optional[str]) -> Optional[EmailLogModel]:
+        """
+        Return the log of an earlier attempt of the send request key.
+
+        Only the cache is consulted, so a first attempt costs no query;
+        a key that fell out of the cache is caught by the unique
+        constraint in ``_create_log`` instead.
+        """
+        if not key:
+            return None
+
+        state = cache.get(self._idempotency_cache_key(key))
+        if state is None:
+            return None
+
+        email_log = self.log_repository.get_by_id(state["log_id"])
+        if email_log is None:
+            return None
+
+        if state["sent"] and email_log.status != EmailStatus.SENT:
+            # Delivered, but the status update of that attempt was lost
+            self.log_repository.mark_as_sent(email_log)
+        return email_log
+
+    def _create_log(self, idempotency_key: Optional[str], **fields) -> EmailLogModel:
+        """Create the log of a send request, or return the one already created."""
+        try:
+            email_log = self.log_repository.create_log(
+                idempotency_key=idempotency_key, **fields
+            )
+        except IntegrityError:
+            email_log = (
+                self.log_repository.get_by_idempotency_key(idempotency_key)
+                if idempotency_key
+                else None
+            )
+            if email_log is None:
+                raise
+            return email_log
+
+        if idempotency_key:
+            self._remember(idempotency_key, email_log, sent=False)
+        return email_log
+
+    @staticmethod
+    def _build_message(
+        subject: str,
+        text_content: str,
+        html_content: str,
+        recipient_email: str,
+        from_email: str,
+    ) -> EmailMultiAlternatives:
+        """Build a multipart (text + HTML) email message."""
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=text_content,
+            from_email=from_email,
+            to=[recipient_email],
+        )
+        email.attach_alternative(html_content, "text/html")
+        return email
+
     def send_bulk_emails(
-        self, template_slug: str, recipients: List[Dict[str, str]], context: Dict
+        self,
+        template_slug: str,
+        recipients: List[Dict[str, str]],
+        context: Dict,
+        batch_size: int = EMAIL_BULK_BATCH_SIZE,
     ) -> List[EmailLogModel]:
         """
-        Send emails to multiple recipients.
+        Send emails to multiple recipients in batches.
+
+        All language variants of the template are fetched and compiled
+        once. Variants that print the recipient variables as they are get
+        rendered once too; each recipient's email is then filled into that
+        skeleton (see ``EmailTemplateService.render_skeleton``). For every
+        batch the recipients' languages are resolved
+        together, the log rows are inserted with one query, the messages
+        are sent over a single pooled connection and the resulting
+        statuses are written back with one bulk update.
 
         Args:
             template_slug: The slug of the email template
-            recipients: List of dicts with 'email' and optional 'name' keys
+            recipients: List of dicts with 'email' and optional 'name' and
+                'language' keys (language defaults to the settings language)
             context: Base context for all emails
+            batch_size: Number of recipients handled per batch
 
         Returns:
-            List of EmailLog entries
+            List of EmailLog entries (sent and failed)
         """
+        try:
+            family = self.template_service.get_compiled_family(template_slug)
+        except Exception as e:
+            raise EmailSendError(f"Failed to send email: {str(e)}")
+
+        from_email = settings.DEFAULT_FROM_EMAIL
+
         logs = []
+        skeletons: Dict[int, Optional[RenderedSkeleton]] = {}
+        for start in range(0, len(recipients), batch_size):
+            batch = recipients[start : start + batch_size]
+            logs.extend(
+                self._send_batch(family, batch, context, from_email, skeletons)
+            )
+
+        return logs
+
+    def _send_batch(
+        self,
+        family: CompiledTemplateFamily,
+        recipients: List[Dict[str, str]],
+        context: Dict,
+        from_email: str,
+        skeletons: Dict[int, Optional[RenderedSkeleton]],
+    ) -> List[EmailLogModel]:
+        """
+        Render, log, send and record statuses for one batch of recipients.
+
+        skeletons holds the variants rendered so far (None for those that
+        need a full render per recipient) and is filled in as they are met.
+        """
+        languages = UserLanguageService.get_languages(
+            recipient["email"]
+            for recipient in recipients
+            if recipient.get("email") and not recipient.get("language")
+        )
+
+        logs, messages, sending, contexts, variants = [], [], [], [], []
         for recipient in recipients:
+            email = recipient.get("email") or ""
+            name = recipient.get("name", "")
+            language = recipient.get("language") or languages.get(email.lower().strip())
+            compiled = family.resolve(language)
+
+            # Create recipient-specific context
+            recipient_context = {
+                **context,
+                "recipient_name": name,
+                "recipient_email": email,
+            }
+            log = EmailLogModel(
+                template=compiled.template,
+                recipient_email=email,
+                recipient_name=name,
+            )
             try:
-                # Create recipient-specific context
-                recipient_context = {
-                    **context,
-                    "recipient_name": recipient.get("name", ""),
-                    "recipient_email": recipient["email"],
-                }
-
-                log = self.send_email(
-                    template_slug=template_slug,
-                    recipient_email=recipient["email"],
-                    context=recipient_context,
-                    recipient_name=recipient.get("name", ""),
+                if not email:
+                    raise EmailSendError("Recipient has no email address")
+                messages.append(
+                    self._render_message(
+                        compiled, recipient_context, log, skeletons, from_email
+                    )
                 )
-                logs.append(log)
+                sending.append(log)
             except Exception as e:
-                continue
+                # Fail this recipient only, the rest of the batch is still sent
+                log.status = EmailStatus.FAILED
+                log.error_message = str(e)
+                self.log_repository.give_up_retries(log)
+
+            contexts.append(recipient_context)
+            variants.append(compiled)
+            logs.append(log)
+
+        # Context policies are per variant, compact each variant's contexts
+        by_variant: Dict[int, List[int]] = {}
+        for index, compiled in enumerate(variants):
+            by_variant.setdefault(id(compiled), []).append(index)
+        for indices in by_variant.values():
+            stored_contexts = ContextStorageService.compact_many(
+                variants[indices[0]].template, [contexts[i] for i in indices]
+            )
+            for index, stored_context in zip(indices, stored_contexts):
+                logs[index].context_data = stored_context
+        logs = self.log_repository.bulk_create_logs(logs)
+
+        slug = family.slug
+        if (
+            self.engine == SendingEngine.ASYNCIO
+            and settings.EMAIL_BACKEND == self.SMTP_BACKEND
+        ):
+            errors = AsyncSendingEngine().send_each(
+                messages, reserve=lambda: self.scheduler.reserve(slug)
+            )
+        else:
+            errors = get_connection_pool().send_each(
+                messages, before_send=lambda: self.scheduler.acquire(slug)
+            )
+
+        now = timezone.now()
+        for log, error in zip(sending, errors):
+            if error is None:
+                log.status = EmailStatus.SENT
+                log.sent_at = now
+            else:
+                log.status = EmailStatus.FAILED
+                log.error_message = str(error)
+                self.log_repository.schedule_retry(log)
+        self.log_repository.bulk_update_statuses(logs)
 
         return logs
 
+    def _render_message(
+        self,
+        compiled: CompiledEmailTemplate,
+        context: Dict,
+        log: EmailLogModel,
+        skeletons: Dict[int, Optional[RenderedSkeleton]],
+        from_email: str,
+    ) -> EmailMultiAlternatives:
+        """Render the email of one bulk recipient, setting log's subject."""
+        if id(compiled) not in skeletons:
+            base_context = {
+                name: value
+                for name, value in context.items()
+                if name not in EMAIL_RECIPIENT_VARIABLES
+            }
+            skeletons[id(compiled)] = self.template_service.render_skeleton(
+                compiled, base_context
+            )
+        skeleton = skeletons[id(compiled)]
+        if skeleton is not None:
+            subject, html_content, text_content = skeleton.fill(context)
+        else:
+            html_content, text_content = self.template_service.render_template(
+                compiled, context
+            )
+            subject = self.template_service.render_subject(compiled, context)
+
+        log.subject = subject
+        if compiled.template.track_engagement:
+            html_content = EmailTrackingService.instrument(html_content, log.pk)
+
+        return self._build_message(
+            subject=subject,
+            text_content=text_content,
+            html_content=html_content,
+            recipient_email=context["recipient_email"],
+            from_email=from_email,
+        )
+
 
 # Example usage (method 1)
 # from django.http import JsonResponse
@@ -0,0 +1,51 @@
+from typing import Dict, Optional
+from datetime import datetime
+from django.utils import timezone
+
+from apps.mailer.repositories import EmailStatsRepository
+
+
+class EmailStatsService:
+    """
+    Read API over the hourly delivery statistics.
+
+    Answers come from the EmailStats rollup only, never from the log
+    table, so they stay cheap however many logs exist.
+    """
+
+    @staticmethod
+    def count(
+        template_slug: Optional[str] = None,
+        status: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> int:
+        """
+        Count emails created in [since, until) matching the filters.
+
+        Args:
+            template_slug: Only count emails of this template
+            status: Only count emails currently in this status
+            since: Start of the window (rounded down to the hour)
+            until: End of the window (exclusive)
+        """
+        return EmailStatsRepository.get_count(
+            template_slug=template_slug, status=status, since=since, until=until
+        )
+
+    @staticmethod
+    def breakdown(
+        template_slug: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Dict[str, int]:
+        """Return counts per status for the given window."""
+        return EmailStatsRepository.get_breakdown(
+            template_slug=template_slug, since=since, until=until
+        )
+
+    @staticmethod
+    def today(template_slug: Optional[str] = None) -> Dict[str, int]:
+        """Return counts per status for emails created today."""
+        start = timezone.localtime().replace(hour=0, minute=0, second=0, microsecond=0)
+        return EmailStatsService.breakdown(template_slug=template_slug, since=start)
@@ -1,10 +1,73 @@
-from typing import Dict
+import re
+import secrets
+from typing import Dict, List, Optional, Tuple
 from html import unescape
-from django.template import Context, Template
+from django.template import Context
+from django.utils.html import escape
 
 from apps.mailer.models import EmailTemplateModel
-from apps.mailer.exceptions import TemplateNotFoundError
+from apps.mailer.constants import EMAIL_RECIPIENT_VARIABLES
+from apps.mailer.exceptions import InvalidTemplateContext
 from apps.mailer.repositories import EmailTemplateRepository
+from .template_cache_service import (
+    CompiledEmailTemplate,
+    CompiledTemplateFamily,
+    TemplateCacheService,
+)
+
+
+class RenderedSkeleton:
+    """
+    A template rendered once for every recipient of a bulk send.
+
+    The recipient variables were rendered as unique tokens, so each part
+    is kept as a list of segments where odd positions name the variable
+    to put in. ``fill`` only joins strings, escaping the values the way
+    the template engine would have.
+    """
+
+    def __init__(
+        self,
+        tokens: Dict[str, str],
+        subject: str,
+        html_content: str,
+        text_content: str,
+        text_escaped: bool,
+    ):
+        names = {token: name for name, token in tokens.items()}
+        pattern = re.compile("({})".format("|".join(map(re.escape, names))))
+
+        def split(content: str) -> List[str]:
+            segments = pattern.split(content)
+            segments[1::2] = [names[token] for token in segments[1::2]]
+            return segments
+
+        self.subject = split(subject)
+        self.html = split(html_content)
+        self.text = split(text_content)
+        self.text_escaped = text_escaped
+
+    @staticmethod
+    def _join(segments: List[str], values: Dict[str, str]) -> str:
+        return "".join(
+            values[segment] if index % 2 else segment
+            for index, segment in enumerate(segments)
+        )
+
+    def fill(self, context: Dict) -> Tuple[str, str, str]:
+        """
+        Return (subject, html_content, text_content) for one recipient.
+
+        Args:
+            context: Values of the recipient variables
+        """
+        raw = {name: str(context[name]) for name in EMAIL_RECIPIENT_VARIABLES}
+        escaped = {name: escape(value) for name, value in raw.items()}
+        return (
+            self._join(self.subject, escaped),
+            self._join(self.html, escaped),
+            self._join(self.text, escaped if self.text_escaped else raw),
+        )
 
 
 class EmailTemplateService:
@@ -13,15 +76,40 @@ class EmailTemplateService:
     def __init__(self):
         self.repository = EmailTemplateRepository()
 
-    def get_template(self, slug: str) -> EmailTemplateModel:
-        """Retrieve a template by slug."""
-        template = self.repository.get_by_slug(slug)
-        if not template:
-            raise TemplateNotFoundError(f"Template with slug '{slug}' not found")
-        return template
+    def get_template(
+        self, slug: str, language: Optional[str] = None
+    ) -> EmailTemplateModel:
+        """Retrieve the variant of a template for language by slug."""
+        return self.get_compiled_template(slug, language).template
+
+    def get_compiled_template(
+        self, slug: str, language: Optional[str] = None
+    ) -> CompiledEmailTemplate:
+        """Retrieve the compiled variant of slug for language (template cache)."""
+        return TemplateCacheService.get(slug, language)
+
+    def get_compiled_family(self, slug: str) -> CompiledTemplateFamily:
+        """Retrieve every compiled language variant of slug (template cache)."""
+        return TemplateCacheService.get_family(slug)
+
+    def validate_context(
+        self, template: EmailTemplateModel | CompiledEmailTemplate, context: Dict
+    ) -> None:
+        """
+        Check context against the template's required variables.
+
+        Uses the manifest stored with the template, so no rendering (and,
+        with a warm template cache, no query) is needed.
+
+        Raises:
+            InvalidTemplateContext: If required variables are missing.
+        """
+        missing = self._compiled(template).required_variables.difference(context)
+        if missing:
+            raise InvalidTemplateContext(sorted(missing))
 
     def render_template(
-        self, template: EmailTemplateModel, context: Dict
+        self, template: EmailTemplateModel | CompiledEmailTemplate, context: Dict
     ) -> tuple[str, str]:
         """
         Render both HTML and text content with context variables.
@@ -29,18 +117,63 @@ class EmailTemplateService:
         Returns:
             tuple: (rendered_html, rendered_text)
         """
-        html_template = Template(template.html_content)
-        html_content = html_template.render(Context(context))
+        compiled = self._compiled(template)
+        html_content = compiled.html.render(Context(context))
 
-        if template.text_content:
-            text_template = Template(template.text_content)
-            text_content = text_template.render(Context(context))
+        if compiled.text is not None:
+            text_content = compiled.text.render(Context(context))
         else:
             # Auto-generate plain text from HTML
             text_content = self._html_to_text(html_content)
 
         return html_content, text_content
 
+    def render_subject(
+        self, template: EmailTemplateModel | CompiledEmailTemplate, context: Dict
+    ) -> str:
+        """Render the subject line with context variables."""
+        return self._compiled(template).render_subject(Context(context))
+
+    def render_skeleton(
+        self, template: EmailTemplateModel | CompiledEmailTemplate, context: Dict
+    ) -> Optional[RenderedSkeleton]:
+        """
+        Render template once for all recipients sharing context.
+
+        Returns None when the template transforms or tests a recipient
+        variable, its output then has to be rendered per recipient.
+        """
+        compiled = self._compiled(template)
+        if not compiled.recipient_slots:
+            return None
+
+        tokens = {
+            name: f"SLOT{secrets.token_hex(8)}" for name in EMAIL_RECIPIENT_VARIABLES
+        }
+        skeleton_context = {**context, **tokens}
+        html_content, text_content = self.render_template(compiled, skeleton_context)
+        return RenderedSkeleton(
+            tokens,
+            subject=self.render_subject(compiled, skeleton_context),
+            html_content=html_content,
+            text_content=text_content,
+            # Generated text is unescaped from the HTML, values go in raw
+            text_escaped=compiled.text is not None,
+        )
+
+    def _compiled(
+        self, template: EmailTemplateModel | CompiledEmailTemplate
+    ) -> CompiledEmailTemplate:
+        """Resolve a template row to its cached compiled form."""
+        if isinstance(template, CompiledEmailTemplate):
+            return template
+
+        compiled = TemplateCacheService.get(template.slug, template.language)
+        if compiled.version != TemplateCacheService.version_of(template):
+            # Caller holds a different revision than the cache, honour it
+            compiled = CompiledEmailTemplate(template)
+        return compiled
+
     @staticmethod
     def _html_to_text(html: str) -> str:
         """Convert HTML to plain text (basic implementation)."""
@@ -0,0 +1,152 @@
+import re
+import time
+import logging
+from html import escape, unescape
+from datetime import datetime, timezone as dt_timezone
+from typing import Dict, Optional
+from django.urls import reverse
+from django.core import signing
+from django.utils.http import urlencode
+
+from apps.common.redis_client import AtomicScript, get_redis_client
+from apps.mailer.constants import EMAIL_TRACKING_URL, EMAIL_TRACKING_FLUSH_BATCH_SIZE
+from apps.mailer.repositories import EmailLogRepository
+
+logger = logging.getLogger("app.mailer.tracking")
+
+SIGNING_SALT = "apps.mailer.tracking"
+
+# Buffered hits: log id -> unix time of the first hit
+OPENS_KEY = "mailer:tracking:opens"
+CLICKS_KEY = "mailer:tracking:clicks"
+
+HREF_PATTERN = re.compile(r'href="(https?://[^"]+)"', re.IGNORECASE)
+BODY_END_PATTERN = re.compile(r"</body>", re.IGNORECASE)
+
+# Returns and deletes a hash in one step, so hits recorded while a flush
+# runs go to a fresh hash instead of being lost
+POP_HASH_LUA = """
+local values = redis.call("HGETALL", KEYS[1])
+redis.call("DEL", KEYS[1])
+return values
+"""
+
+
+def _pop_hash_local(client, keys, args):
+    values = client.hgetall(keys[0])
+    client.delete(keys[0])
+    return [item for pair in values.items() for item in pair]
+
+
+pop_hash = AtomicScript(POP_HASH_LUA, _pop_hash_local)
+
+
+class EmailTrackingService:
+    """
+    Open and click tracking of sent emails.
+
+    Emails of templates with ``track_engagement`` get a tracking pixel
+    and links that go through a signed redirect. Hits are only buffered
+    in Redis (the first hit per log wins); ``flush`` writes them to
+    ``opened_at`` / ``clicked_at`` with one UPDATE per batch of logs.
+    """
+
+    @staticmethod
+    def _absolute(path: str) -> str:
+        return EMAIL_TRACKING_URL.rstrip("/") + path
+
+    @classmethod
+    def open_url(cls, log_id) -> str:
+        """Return the tracking pixel URL of a log."""
+        token = signing.Signer(salt=SIGNING_SALT).sign(str(log_id))
+        return cls._absolute(reverse("track-open", args=[token]))
+
+    @classmethod
+    def click_url(cls, log_id, url: str) -> str:
+        """Return the tracked redirect URL to url for a log."""
+        token = signing.dumps({"l": str(log_id), "u": url}, salt=SIGNING_SALT)
+        return cls._absolute(reverse("track-click") + "?" + urlencode({"t": token}))
+
+    @classmethod
+    def instrument(cls, html: str, log_id) -> str:
+        """Rewrite the links of html through the click redirect and add the pixel."""
+        html = HREF_PATTERN.sub(
+            lambda match: 'href="{}"'.format(
+                escape(cls.click_url(log_id, unescape(match.group(1))))
+            ),
+            html,
+        )
+        pixel = (
+            f'<img src="{escape(cls.open_url(log_id))}" width="1" height="1" '
+            'alt="" style="display:none">'
+        )
+        if BODY_END_PATTERN.search(html):
+            return BODY_END_PATTERN.sub(lambda _: pixel + "</body>", html, count=1)
+        return html + pixel
+
+    @staticmethod
+    def parse_open_token(token: str) -> Optional[str]:
+        """Return the log id of a pixel token, or None if it is invalid."""
+        try:
+            return signing.Signer(salt=SIGNING_SALT).unsign(token)
+        except signing.BadSignature:
+            return None
+
+    @staticmethod
+    def parse_click_token(token: str) -> Optional[Dict[str, str]]:
+        """Return {"log_id", "url"} of a click token, or None if it is invalid."""
+        try:
+            data = signing.loads(token, salt=SIGNING_SALT)
+        except signing.BadSignature:
+            return None
+        return {"log_id": data["l"], "url": data["u"]}
+
+    @staticmethod
+    def record_open(log_id: str) -> None:
+        """Buffer an open of a log."""
+        get_redis_client().hsetnx(OPENS_KEY, log_id, repr(time.time()))
+
+    @staticmethod
+    def record_click(log_id: str) -> None:
+        """Buffer a click in an email (which implies it was opened)."""
+        now = repr(time.time())
+        client = get_redis_client()
+        client.hsetnx(CLICKS_KEY, log_id, now)
+        client.hsetnx(OPENS_KEY, log_id, now)
+
+    @classmethod
+    def flush(cls, batch_size: int = EMAIL_TRACKING_FLUSH_BATCH_SIZE) -> Dict[str, int]:
+        """
+        Write buffered hits to the email log table.
+
+        Returns:
+            dict: Number of logs whose opened_at / clicked_at were set.
+        """
+        return {
+            "opened": cls._flush_field(OPENS_KEY, "opened_at", batch_size),
+            "clicked": cls._flush_field(CLICKS_KEY, "clicked_at", batch_size),
+        }
+
+    @staticmethod
+    def _flush_field(key: str, field: str, batch_size: int) -> int:
+        client = get_redis_client()
+        values = pop_hash(client, [key], [])
+        hits = dict(zip(values[::2], values[1::2]))
+
+        updated = 0
+        log_ids = list(hits)
+        for start in range(0, len(log_ids), batch_size):
+            batch = log_ids[start : start + batch_size]
+            timestamps = {
+                log_id: datetime.fromtimestamp(float(hits[log_id]), tz=dt_timezone.utc)
+                for log_id in batch
+            }
+            try:
+                updated += EmailLogRepository.set_first_timestamps(field, timestamps)
+            except Exception as e:
+                logger.error(f"Failed to flush {len(log_ids) - start} {field} hits: {e}")
+                # Put the unwritten hits back for the next flush
+                for log_id in log_ids[start:]:
+                    client.hsetnx(key, log_id, hits[log_id])
+                raise
+        return updated
@@ -0,0 +1,141 @@
+import math
+import time
+from typing import Dict, List, Optional, Tuple
+from django.conf import settings
+
+from apps.common.redis_client import AtomicScript, get_redis_client
+
+RATE_KEY = "mailer:send_rate:{scope}:{name}"
+
+PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# KEYS: one bucket per key. ARGV: (tokens per ms, capacity) per key.
+# Takes one token from every bucket, or none of them and returns the
+# milliseconds to wait until all of them have one.
+TOKEN_BUCKET_LUA = """
+local time = redis.call("TIME")
+local now = tonumber(time[1]) * 1000 + math.floor(tonumber(time[2]) / 1000)
+local wait = 0
+local tokens = {}
+for i, key in ipairs(KEYS) do
+    local rate = tonumber(ARGV[i * 2 - 1])
+    local capacity = tonumber(ARGV[i * 2])
+    local state = redis.call("HMGET", key, "tokens", "ts")
+    local available = tonumber(state[1]) or capacity
+    local ts = tonumber(state[2]) or now
+    available = math.min(capacity, available + math.max(0, now - ts) * rate)
+    if available < 1 then
+        wait = math.max(wait, math.ceil((1 - available) / rate))
+    end
+    tokens[i] = available
+end
+if wait == 0 then
+    for i, key in ipairs(KEYS) do
+        local rate = tonumber(ARGV[i * 2 - 1])
+        local capacity = tonumber(ARGV[i * 2])
+        redis.call("HSET", key, "tokens", tostring(tokens[i] - 1), "ts", now)
+        redis.call("PEXPIRE", key, math.ceil(capacity / rate) + 1000)
+    end
+end
+return wait
+"""
+
+
+def _token_bucket_local(client, keys, args):
+    now = int(client.time() * 1000)
+    wait = 0
+    tokens = []
+    for i, key in enumerate(keys):
+        rate, capacity = float(args[i * 2]), float(args[i * 2 + 1])
+        state = client.hgetall(key)
+        available = float(state.get("tokens", capacity))
+        ts = int(state.get("ts", now))
+        available = min(capacity, available + max(0, now - ts) * rate)
+        if available < 1:
+            wait = max(wait, math.ceil((1 - available) / rate))
+        tokens.append(available)
+    if wait == 0:
+        for i, key in enumerate(keys):
+            rate, capacity = float(args[i * 2]), float(args[i * 2 + 1])
+            client.hset(key, {"tokens": str(tokens[i] - 1), "ts": now})
+            client.pexpire(key, math.ceil(capacity / rate) + 1000)
+    return wait
+
+
+token_bucket = AtomicScript(TOKEN_BUCKET_LUA, _token_bucket_local)
+
+
+def parse_rate(rate: Optional[str]) -> Optional[Tuple[int, int]]:
+    """
+    Parse a rate like ``"10/s"`` or ``"500/h"``.
+
+    Returns:
+        tuple: (number of sends, period in seconds), or None if unlimited.
+    """
+    if not rate:
+        return None
+    num, period = rate.split("/")
+    return int(num), PERIODS[period.strip()[0]]
+
+
+class SendScheduler:
+    """
+    Shared token-bucket scheduler for outgoing email.
+
+    Every SMTP host and template can have its own rate in
+    ``settings.MAILER_SEND_RATES``; the bucket size equals the number of
+    sends in the rate's period. Buckets live in Redis so that all workers
+    draw from the same budget.
+    """
+
+    def __init__(self, rates: Optional[Dict] = None, client=None):
+        rates = settings.MAILER_SEND_RATES if rates is None else rates
+        self.host_rates = rates.get("hosts", {})
+        self.template_rates = rates.get("templates", {})
+        self._client = client
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = get_redis_client()
+        return self._client
+
+    def _buckets(self, template_slug: str, host: Optional[str]) -> List[Tuple]:
+        buckets = []
+        for scope, name, rate in (
+            # Without a host (EMAIL_HOST unset) there is no host bucket
+            ("host", host, self.host_rates.get(host) if host else None),
+            ("template", template_slug, self.template_rates.get(template_slug)),
+        ):
+            parsed = parse_rate(rate)
+            if parsed:
+                num, period = parsed
+                key = RATE_KEY.format(scope=scope, name=name)
+                buckets.append((key, num / (period * 1000), num))
+        return buckets
+
+    def reserve(self, template_slug: str, host: Optional[str] = None) -> float:
+        """
+        Try to take a send token for template_slug on host.
+
+        Returns:
+            float: 0 if the send may go ahead, else seconds to wait.
+        """
+        host = settings.EMAIL_HOST if host is None else host
+        buckets = self._buckets(template_slug, host)
+        if not buckets:
+            return 0
+
+        args = []
+        for _, rate, capacity in buckets:
+            args.extend([repr(rate), capacity])
+        wait_ms = token_bucket(self.client, [key for key, _, _ in buckets], args)
+        return int(wait_ms) / 1000
+
+    def acquire(self, template_slug: str, host: Optional[str] = None) -> None:
+        """Block until a send token for template_slug on host is taken."""
+        while True:
+            wait = self.reserve(template_slug, host)
+            if not wait:
+                return
+            time.sleep(wait)
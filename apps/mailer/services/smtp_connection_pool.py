@@ -0,0 +1,257 @@
+import os
+import time
+import socket
+import smtplib
+import logging
+import threading
+from typing import Callable, List, Optional, Sequence
+from contextlib import contextmanager
+from django.core.mail import get_connection
+from django.core.mail.message import EmailMessage
+
+from apps.mailer.constants import (
+    EMAIL_POOL_SIZE,
+    EMAIL_HEALTHCHECK_INTERVAL,
+    EMAIL_MAX_MESSAGES_PER_CONNECTION,
+)
+
+logger = logging.getLogger("app.mailer.smtp_pool")
+
+# Errors that mean the connection itself is gone and a fresh one may succeed
+CONNECTION_ERRORS = (
+    smtplib.SMTPServerDisconnected,
+    smtplib.SMTPConnectError,
+    ConnectionError,
+    socket.timeout,
+)
+
+
+def is_connection_lost(error: Exception) -> bool:
+    """
+    True if error means the connection is unusable.
+
+    SMTP replies such as a rejected recipient are ``OSError`` subclasses
+    too, but leave the session open.
+    """
+    if isinstance(error, CONNECTION_ERRORS):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+
+class PooledConnection:
+    """An open email backend connection plus its usage bookkeeping."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.sent = 0
+        self.last_used_at = time.monotonic()
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the connection reached its message limit."""
+        return self.sent >= EMAIL_MAX_MESSAGES_PER_CONNECTION
+
+    def is_healthy(self) -> bool:
+        """
+        Check the connection with a NOOP if it has been idle for too long.
+
+        Backends without a live SMTP session (console, locmem, ...)
+        are always considered healthy.
+        """
+        if time.monotonic() - self.last_used_at < EMAIL_HEALTHCHECK_INTERVAL:
+            return True
+
+        smtp = getattr(self.backend, "connection", None)
+        if smtp is None:
+            return not hasattr(self.backend, "connection")
+
+        try:
+            status, _ = smtp.noop()
+            return status == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def close(self) -> None:
+        """Close the underlying connection, ignoring errors."""
+        try:
+            self.backend.close()
+        except Exception:
+            pass
+
+
+class SMTPConnectionPool:
+    """
+    Pool of persistent email backend connections for one worker process.
+
+    Connections are opened lazily, checked with NOOP after being idle,
+    recycled after a fixed number of messages and replaced when the
+    server drops them.
+    """
+
+    def __init__(
+        self,
+        size: int = EMAIL_POOL_SIZE,
+        backend: Optional[str] = None,
+    ):
+        self.size = size
+        self.backend = backend
+        self._idle: List[PooledConnection] = []
+        self._lock = threading.Lock()
+
+    def _open(self) -> PooledConnection:
+        backend = get_connection(backend=self.backend, fail_silently=False)
+        backend.open()
+        return PooledConnection(backend)
+
+    def _acquire(self) -> PooledConnection:
+        while True:
+            with self._lock:
+                conn = self._idle.pop() if self._idle else None
+            if conn is None:
+                return self._open()
+            if conn.is_healthy():
+                return conn
+            logger.info("Dropping unhealthy pooled SMTP connection")
+            conn.close()
+
+    def _release(self, conn: PooledConnection) -> None:
+        conn.last_used_at = time.monotonic()
+        if conn.exhausted:
+            conn.close()
+            return
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self):
+        """
+        Borrow an open connection.
+
+        The connection is returned to the pool on success and closed if
+        the block raises.
+        """
+        conn = self._acquire()
+        try:
+            yield conn
+        except Exception:
+            conn.close()
+            raise
+        self._release(conn)
+
+    def send_messages(self, messages: Sequence[EmailMessage]) -> int:
+        """
+        Send messages over a pooled connection.
+
+        A dropped connection is replaced and the send retried once.
+
+        Returns:
+            int: Number of messages sent.
+        """
+        try:
+            return self._send(messages)
+        except CONNECTION_ERRORS as e:
+            logger.warning(f"Pooled SMTP connection failed, reconnecting: {e}")
+            return self._send(messages)
+
+    def _send(self, messages: Sequence[EmailMessage]) -> int:
+        with self.connection() as conn:
+            sent = conn.backend.send_messages(messages) or 0
+            conn.sent += len(messages)
+            return sent
+
+    def send_each(
+        self,
+        messages: Sequence[EmailMessage],
+        before_send: Optional[Callable[[], None]] = None,
+    ) -> List[Optional[Exception]]:
+        """
+        Send messages one by one over as few connections as possible.
+
+        Unlike ``send_messages`` a failing message does not abort the
+        rest of the batch. A dropped connection is replaced and the
+        message retried once; if that fails too only the message fails.
+        If no connection can be opened the remaining messages fail with
+        the same error. ``before_send`` is called before every message
+        (e.g. to wait for a rate limit).
+
+        Returns:
+            list: ``None`` for every sent message, else the raised error.
+        """
+        errors: List[Optional[Exception]] = []
+        conn: Optional[PooledConnection] = None
+
+        try:
+            for index, message in enumerate(messages):
+                if before_send is not None:
+                    before_send()
+                try:
+                    if conn is None:
+                        conn = self._acquire()
+                    try:
+                        conn.backend.send_messages([message])
+                    except CONNECTION_ERRORS as e:
+                        logger.warning(f"Pooled SMTP connection failed: {e}")
+                        conn.close()
+                        conn = None
+                        conn = self._acquire()
+                        conn.backend.send_messages([message])
+                    conn.sent += 1
+                    errors.append(None)
+                except Exception as e:
+                    if conn is None:
+                        # No connection could be opened, fail the rest of the batch
+                        errors.extend([e] * (len(messages) - index))
+                        break
+                    errors.append(e)
+                    if is_connection_lost(e):
+                        # Dropped again, go on with a fresh connection
+                        conn.close()
+                        conn = None
+
+                if conn is not None and conn.exhausted:
+                    conn.close()
+                    conn = None
+        finally:
+            if conn is not None:
+                self._release(conn)
+
+        return errors
+
+    def close_all(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_pool: Optional[SMTPConnectionPool] = None
+_pool_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+
+
+def get_connection_pool() -> SMTPConnectionPool:
+    """
+    Return the SMTP connection pool of the current process.
+
+    Forked children (prefork Celery workers) get a fresh pool instead of
+    sharing the parent's sockets.
+    """
+    global _pool, _pool_pid
+
+    pid = os.getpid()
+    if _pool is None or _pool_pid != pid:
+        with _pool_lock:
+            if _pool is None or _pool_pid != pid:
+                _pool = SMTPConnectionPool()
+                _pool_pid = pid
+    return _pool
+
+
+def close_connection_pool() -> None:
+    """Close the current process's pool, if any."""
+    if _pool is not None and _pool_pid == os.getpid():
+        _pool.close_all()
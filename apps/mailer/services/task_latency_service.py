@@ -0,0 +1,120 @@
+import time
+import logging
+from typing import Dict, List, Optional
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.mailer.constants import (
+    TASK_LATENCY_BUCKETS,
+    TASK_LATENCY_RETENTION_MINUTES,
+)
+
+logger = logging.getLogger("app.mailer.task_latency")
+
+LATENCY_KEY = "mailer:task_latency:{queue}:{minute}:{bucket}"
+
+# Label of the bucket above the last bound
+OVERFLOW_BUCKET = "inf"
+
+
+class TaskLatencyService:
+    """
+    Enqueue-to-start latency of Celery tasks, per queue.
+
+    Every task start increments one histogram bucket of the current
+    minute in the shared cache, so all workers report into the same
+    numbers and percentiles can be read for any recent window.
+    """
+
+    @staticmethod
+    def _bucket_of(seconds: float) -> str:
+        for bound in TASK_LATENCY_BUCKETS:
+            if seconds <= bound:
+                return str(bound)
+        return OVERFLOW_BUCKET
+
+    @staticmethod
+    def _key(queue: str, minute: int, bucket: str) -> str:
+        return LATENCY_KEY.format(queue=queue, minute=minute, bucket=bucket)
+
+    @classmethod
+    def record(cls, queue: str, seconds: float) -> None:
+        """Count one task of queue that waited seconds before starting."""
+        minute = int(time.time() // 60)
+        key = cls._key(queue, minute, cls._bucket_of(max(seconds, 0)))
+        cache.add(key, 0, timeout=TASK_LATENCY_RETENTION_MINUTES * 60)
+        try:
+            cache.incr(key)
+        except ValueError:
+            # Expired between add and incr
+            cache.add(key, 1, timeout=TASK_LATENCY_RETENTION_MINUTES * 60)
+
+        logger.debug(f"Task on '{queue}' started after {seconds:.3f}s")
+
+    @classmethod
+    def histogram(cls, queue: str, minutes: int = 15) -> Dict[str, int]:
+        """
+        Return task counts per latency bucket over the last minutes.
+
+        Returns:
+            dict: Bucket upper bound (``"inf"`` for the overflow) -> count.
+        """
+        now = int(time.time() // 60)
+        buckets = [str(bound) for bound in TASK_LATENCY_BUCKETS] + [OVERFLOW_BUCKET]
+        keys = {
+            cls._key(queue, minute, bucket): bucket
+            for minute in range(now - minutes + 1, now + 1)
+            for bucket in buckets
+        }
+
+        counts = dict.fromkeys(buckets, 0)
+        for key, value in cache.get_many(list(keys)).items():
+            counts[keys[key]] += int(value)
+        return counts
+
+    @classmethod
+    def summary(
+        cls, queue: str, minutes: int = 15, threshold: float = 1.0
+    ) -> Dict[str, Optional[float]]:
+        """
+        Summarize the latency of queue over the last minutes.
+
+        Percentiles are bucket upper bounds, so they are never lower than
+        the real value.
+
+        Returns:
+            dict: count, p50, p95, p99 (seconds, ``inf`` if above the last
+                bucket, ``None`` without data) and the fraction of tasks
+                that started within threshold seconds.
+        """
+        counts = cls.histogram(queue, minutes)
+        total = sum(counts.values())
+
+        def percentile(q: float) -> Optional[float]:
+            if not total:
+                return None
+            seen = 0
+            for bucket, count in counts.items():
+                seen += count
+                if seen >= q * total:
+                    return float(bucket)
+            return float(OVERFLOW_BUCKET)
+
+        within = sum(
+            count
+            for bucket, count in counts.items()
+            if bucket != OVERFLOW_BUCKET and float(bucket) <= threshold
+        )
+        return {
+            "count": total,
+            "p50": percentile(0.50),
+            "p95": percentile(0.95),
+            "p99": percentile(0.99),
+            "within_threshold": within / total if total else None,
+        }
+
+    @staticmethod
+    def queues() -> List[str]:
+        """Return the queues that task routing sends work to."""
+        routed = {route["queue"] for route in settings.CELERY_TASK_ROUTES.values()}
+        return sorted(routed | {settings.CELERY_TASK_DEFAULT_QUEUE})
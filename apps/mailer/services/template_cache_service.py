@@ -0,0 +1,181 @@
+import logging
+import threading
+from typing import Dict, Iterable, Optional
+from django.core.cache import cache
+from django.template import Context, Template
+
+from apps.mailer.models import EmailTemplateModel
+from apps.mailer.constants import EMAIL_DEFAULT_LANGUAGE, EMAIL_RECIPIENT_VARIABLES
+from apps.mailer.validators import TemplateValidator
+from apps.mailer.exceptions import TemplateNotFoundError
+from apps.mailer.repositories import EmailTemplateRepository
+
+logger = logging.getLogger("app.mailer.template_cache")
+
+TEMPLATE_VERSION_CACHE_KEY = "mailer:template_version:{slug}"
+
+
+class CompiledEmailTemplate:
+    """Parsed subject, HTML and text templates of a single template row."""
+
+    def __init__(self, template: EmailTemplateModel):
+        self.template = template
+        self.version = TemplateCacheService.version_of(template)
+        self.subject = Template(template.subject)
+        self.html = Template(template.html_content)
+        self.text = Template(template.text_content) if template.text_content else None
+        # Manifest extracted when the template was saved
+        self.required_variables = frozenset(template.required_variables or ())
+        # Bulk sends may render once and substitute the recipient variables
+        self.recipient_slots = TemplateValidator.outputs_plainly(
+            EMAIL_RECIPIENT_VARIABLES,
+            template.subject,
+            template.html_content,
+            template.text_content,
+        )
+
+    def render_subject(self, context: Context) -> str:
+        """Render the subject line."""
+        return self.subject.render(context)
+
+
+class CompiledTemplateFamily:
+    """
+    Every active language variant of one slug, compiled.
+
+    ``resolve`` picks the variant for a language, falling back to
+    ``EMAIL_DEFAULT_LANGUAGE``, then to the variant without a language,
+    then to any variant.
+    """
+
+    def __init__(self, slug: str, templates: Iterable[EmailTemplateModel]):
+        self.slug = slug
+        self.variants: Dict[str, CompiledEmailTemplate] = {
+            template.language: CompiledEmailTemplate(template) for template in templates
+        }
+        # The newest variant's version, which is what a save publishes
+        self.version = max(entry.version for entry in self.variants.values())
+
+    def resolve(self, language: Optional[str] = None) -> CompiledEmailTemplate:
+        """Return the variant to send to a recipient using language."""
+        for candidate in (language, EMAIL_DEFAULT_LANGUAGE, ""):
+            entry = self.variants.get(candidate) if candidate is not None else None
+            if entry is not None:
+                return entry
+        return next(iter(self.variants.values()))
+
+
+class TemplateCacheService:
+    """
+    Per-process cache of compiled email templates.
+
+    Entries are keyed by slug and hold every language variant of it,
+    compiled together, tagged with the newest variant's version (its
+    ``updated_at``). The current version of every slug is published in
+    the shared cache whenever a variant is saved, so each worker only has
+    to compare versions to know if its compiled copies are still valid.
+    """
+
+    _entries: Dict[str, CompiledTemplateFamily] = {}
+    _lock = threading.Lock()
+    _hits = 0
+    _misses = 0
+
+    @staticmethod
+    def version_of(template: EmailTemplateModel) -> str:
+        """Return the cache version of a template row."""
+        return template.updated_at.isoformat() if template.updated_at else ""
+
+    @staticmethod
+    def _version_key(slug: str) -> str:
+        return TEMPLATE_VERSION_CACHE_KEY.format(slug=slug)
+
+    @classmethod
+    def get(cls, slug: str, language: Optional[str] = None) -> CompiledEmailTemplate:
+        """
+        Return the compiled variant of slug for language.
+
+        Raises:
+            TemplateNotFoundError: If no active template exists for slug.
+        """
+        return cls.get_family(slug).resolve(language)
+
+    @classmethod
+    def get_family(cls, slug: str) -> CompiledTemplateFamily:
+        """
+        Return all compiled variants of slug, compiling them on a miss.
+
+        Raises:
+            TemplateNotFoundError: If no active template exists for slug.
+        """
+        shared_version = cache.get(cls._version_key(slug))
+        entry = cls._entries.get(slug)
+
+        if (
+            entry is not None
+            and shared_version is not None
+            and entry.version == shared_version
+        ):
+            cls._hits += 1
+            return entry
+
+        cls._misses += 1
+        templates = EmailTemplateRepository.get_variants(slug)
+        if not templates:
+            with cls._lock:
+                cls._entries.pop(slug, None)
+            raise TemplateNotFoundError(f"Template with slug '{slug}' not found")
+
+        entry = CompiledTemplateFamily(slug, templates)
+        if shared_version is not None:
+            # Rows read after that version was published are at least as
+            # new, even if the saved variant was deactivated since
+            entry.version = shared_version
+        else:
+            # Never overwrite a version published by a newer save
+            cache.add(cls._version_key(slug), entry.version, timeout=None)
+        with cls._lock:
+            cls._entries[slug] = entry
+
+        logger.debug(
+            f"Compiled email template '{slug}' (version {entry.version}, "
+            f"languages {sorted(entry.variants)})"
+        )
+        return entry
+
+    @classmethod
+    def publish(cls, slug: str, version: Optional[str]) -> None:
+        """
+        Publish a new version for slug to all workers.
+
+        A ``None`` version removes the slug, forcing every worker to
+        reload it from the database on next use.
+        """
+        if version is None:
+            cache.delete(cls._version_key(slug))
+        else:
+            cache.set(cls._version_key(slug), version, timeout=None)
+
+        with cls._lock:
+            entry = cls._entries.get(slug)
+            if entry is not None and entry.version != version:
+                cls._entries.pop(slug, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        """Drop every compiled template and reset counters in this process."""
+        with cls._lock:
+            cls._entries.clear()
+            cls._hits = 0
+            cls._misses = 0
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Return hit/miss counters for this process."""
+        total = cls._hits + cls._misses
+        return {
+            "hits": cls._hits,
+            "misses": cls._misses,
+            "size": len(cls._entries),
+            "hit_ratio": cls._hits / total if total else 0.0,
+        }
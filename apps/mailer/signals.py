@@ -0,0 +1,84 @@
+import time
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from celery.signals import before_task_publish, task_prerun, worker_process_shutdown
+from django.dispatch import receiver
+from django.db.models.signals import post_delete, post_save, pre_save
+
+from apps.mailer.models import EmailTemplateModel
+from apps.mailer.repositories import flush_log_buffer
+from apps.mailer.services import (
+    TaskLatencyService,
+    TemplateCacheService,
+    close_connection_pool,
+)
+
+
+@receiver(pre_save, sender=EmailTemplateModel)
+def remember_previous_slug(sender, instance, **kwargs):
+    """Keep the stored slug so a rename can invalidate the old cache entry."""
+    instance._previous_slug = (
+        EmailTemplateModel.objects.filter(pk=instance.pk)
+        .values_list("slug", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=EmailTemplateModel)
+def publish_template_version(sender, instance, **kwargs):
+    """Invalidate compiled copies of the template in every worker."""
+    slug = instance.slug
+    version = TemplateCacheService.version_of(instance)
+    previous_slug = getattr(instance, "_previous_slug", None)
+
+    def publish():
+        if previous_slug and previous_slug != slug:
+            TemplateCacheService.publish(previous_slug, None)
+        TemplateCacheService.publish(slug, version)
+
+    transaction.on_commit(publish)
+
+
+@receiver(post_delete, sender=EmailTemplateModel)
+def drop_template_version(sender, instance, **kwargs):
+    """Invalidate compiled copies of a deleted template in every worker."""
+    slug = instance.slug
+    transaction.on_commit(lambda: TemplateCacheService.publish(slug, None))
+
+
+@worker_process_shutdown.connect
+def close_smtp_connections(**kwargs):
+    """Close pooled SMTP connections when a Celery worker process exits."""
+    close_connection_pool()
+
+
+@worker_process_shutdown.connect
+def flush_email_log_statuses(**kwargs):
+    """Write buffered email log statuses before a Celery worker process exits."""
+    flush_log_buffer()
+
+
+@before_task_publish.connect
+def stamp_enqueued_at(headers=None, **kwargs):
+    """Record when a task message was published."""
+    if headers is not None:
+        headers.setdefault("enqueued_at", time.time())
+
+
+@task_prerun.connect
+def record_task_latency(task=None, **kwargs):
+    """Record how long a task waited in its queue before starting."""
+    request = task.request
+    enqueued_at = request.get("enqueued_at")
+    if enqueued_at is None or request.is_eager:
+        return
+
+    # Delayed tasks (countdown / eta) only start waiting once they are due
+    if request.eta:
+        eta = request.eta
+        if isinstance(eta, str):
+            eta = parse_datetime(eta)
+        enqueued_at = max(enqueued_at, eta.timestamp())
+
+    queue = (request.delivery_info or {}).get("routing_key") or "unknown"
+    TaskLatencyService.record(queue, time.time() - enqueued_at)
@@ -1,20 +1,88 @@
-from celery import shared_task
+import time
+import random
+import logging
+from celery import chord, shared_task
 
 from config.env import ENV_MAX_RETRY_ATTEMPTS
-from apps.mailer.services import EmailSendingService
+from apps.accounts.services import UserLanguageService
+from apps.mailer.constants import (
+    DeadLetterReason,
+    EMAIL_DEFAULT_LANGUAGE,
+    EMAIL_CAMPAIGN_CHUNK_SIZE,
+    EMAIL_OUTBOX_BATCH_SIZE,
+)
+from apps.mailer.exceptions import (
+    InvalidTemplateContext,
+    SendRateLimited,
+    TemplateNotFoundError,
+)
+from apps.mailer.repositories import EmailCampaignRepository
+from apps.mailer.services import (
+    EmailSendingService,
+    EmailCampaignService,
+    EmailOutboxService,
+    EmailLogArchiveService,
+    EmailTrackingService,
+    EmailRetryService,
+    EmailDeadLetterService,
+    EmailTemplateService,
+)
+
+logger = logging.getLogger("app.mailer.tasks")
 
 
 @shared_task(bind=True, max_retries=ENV_MAX_RETRY_ATTEMPTS)
-def send_email_async(self, template_slug, recipient_email, context, recipient_name=""):
+def send_email_async(
+    self,
+    template_slug,
+    recipient_email,
+    context,
+    recipient_name="",
+    idempotency_key=None,
+    language=None,
+):
     """
     Celery task to send emails asynchronously.
 
+    Retries reuse the task id, which serves as the idempotency key unless
+    one is given, so a retry never sends or logs the email twice. A
+    context missing required template variables (or an unknown template)
+    is dead-lettered up front instead of being rendered, sent and retried.
+
     Args:
         template_slug: The slug of the email template
         recipient_email: Recipient's email address
         context: Dictionary of variables for template rendering
         recipient_name: Optional recipient name
+        idempotency_key: Optional key identifying the send request
+        language: Optional template language (defaults to the recipient's)
     """
+    idempotency_key = idempotency_key or self.request.id
+    if language is None:
+        language = (
+            UserLanguageService.get_language(recipient_email) or EMAIL_DEFAULT_LANGUAGE
+        )
+    try:
+        template_service = EmailTemplateService()
+        template_service.validate_context(
+            template_service.get_compiled_template(template_slug, language), context
+        )
+    except (InvalidTemplateContext, TemplateNotFoundError) as e:
+        EmailDeadLetterService.reject(
+            template_slug=template_slug,
+            recipient_email=recipient_email,
+            recipient_name=recipient_name,
+            context=context,
+            reason=(
+                DeadLetterReason.MISSING_VARIABLES
+                if isinstance(e, InvalidTemplateContext)
+                else DeadLetterReason.TEMPLATE_NOT_FOUND
+            ),
+            missing_variables=getattr(e, "missing", ()),
+            idempotency_key=idempotency_key,
+        )
+        return {"status": "rejected", "recipient": recipient_email, "error": str(e)}
+
     try:
         service = EmailSendingService()
         email_log = service.send_email(
@@ -22,33 +90,193 @@ def send_email_async(self, template_slug, recipient_email, context, recipient_na
             recipient_email=recipient_email,
             context=context,
             recipient_name=recipient_name,
+            idempotency_key=idempotency_key,
+            language=language,
         )
         return {
             "status": "success",
             "log_id": email_log.id,
             "recipient": recipient_email,
         }
+    except SendRateLimited as e:
+        # Over the send budget: run again later without using a retry
+        return defer_task(self, e.retry_after)
     except Exception as e:
         # Retry with exponential backoff
         raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
 
 
+def defer_task(task, seconds: float):
+    """
+    Re-enqueue the running task after seconds, keeping its id and retry count.
+
+    Jitter spreads out tasks that were deferred at the same moment.
+    """
+    countdown = seconds + random.uniform(0, min(seconds, 1.0))
+    if task.request.is_eager:
+        time.sleep(countdown)
+        return task.run(*task.request.args, **task.request.kwargs)
+    task.signature_from_request(countdown=countdown).apply_async()
+    return {"status": "deferred", "countdown": countdown}
+
+
 @shared_task
-def send_bulk_emails_async(template_slug, recipients, context):
+def send_bulk_emails_async(
+    template_slug, recipients, context, chunk_size=EMAIL_CAMPAIGN_CHUNK_SIZE
+):
     """
     Celery task to send bulk emails asynchronously.
 
+    Recipients are stored as a campaign split into chunks, and the chunks
+    are sent in parallel by separate tasks. Progress can be polled with
+    ``EmailCampaignService.get_progress(campaign_id)``.
+
     Args:
         template_slug: The slug of the email template
         recipients: List of dicts with 'email' and optional 'name' keys
         context: Base context for all emails
+        chunk_size: Number of recipients per chunk task
     """
-    service = EmailSendingService()
-    results = service.send_bulk_emails(
-        template_slug=template_slug, recipients=recipients, context=context
+    campaign = EmailCampaignService.create_campaign(
+        template_slug=template_slug,
+        recipients=recipients,
+        context=context,
+        chunk_size=chunk_size,
     )
+    chunks = dispatch_campaign(campaign)
     return {
-        "total": len(recipients),
-        "sent": len([r for r in results if r.status == "SENT"]),
-        "failed": len([r for r in results if r.status == "FAILED"]),
+        "campaign_id": str(campaign.id),
+        "total": campaign.total,
+        "chunks": chunks,
     }
+
+
+@shared_task(
+    bind=True,
+    acks_late=True,
+    reject_on_worker_lost=True,
+    max_retries=ENV_MAX_RETRY_ATTEMPTS,
+)
+def send_campaign_chunk_async(self, chunk_id):
+    """
+    Celery task to send one chunk of a bulk campaign.
+
+    The message is acknowledged only after the chunk is done, so a lost
+    worker makes the broker redeliver just this chunk. A chunk that still
+    fails after its last retry is marked failed, so the campaign's chord
+    completes anyway.
+
+    Args:
+        chunk_id: Id of the EmailCampaignChunkModel to send
+    """
+    try:
+        return EmailCampaignService.send_chunk(chunk_id)
+    except Exception as e:
+        if self.request.retries >= self.max_retries:
+            logger.error(f"Campaign chunk {chunk_id} failed for good: {e}")
+            return EmailCampaignService.fail_chunk(chunk_id)
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
+
+
+@shared_task
+def finalize_campaign_async(results, campaign_id):
+    """
+    Celery task run once every chunk of a campaign was sent.
+
+    Args:
+        results: Results of the chunk tasks
+        campaign_id: Id of the finished campaign
+    """
+    EmailCampaignRepository.mark_completed(campaign_id)
+    return EmailCampaignService.get_progress(campaign_id)
+
+
+@shared_task
+def fail_campaign_async(request, exc, traceback, campaign_id):
+    """
+    Error callback of a campaign's chord, run if it cannot be finalized.
+
+    Args:
+        request: Request of the failed task
+        exc: The raised exception
+        traceback: Its traceback
+        campaign_id: Id of the campaign
+    """
+    logger.error(f"Campaign {campaign_id} failed: {exc}")
+    EmailCampaignRepository.mark_failed(campaign_id)
+
+
+@shared_task
+def resume_campaign_async(campaign_id):
+    """
+    Celery task to re-dispatch the unsent chunks of a campaign.
+
+    Args:
+        campaign_id: Id of the campaign to resume
+    """
+    campaign = EmailCampaignRepository.get_by_id(campaign_id)
+    if campaign is None:
+        return {"campaign_id": campaign_id, "chunks": 0}
+    return {"campaign_id": campaign_id, "chunks": dispatch_campaign(campaign)}
+
+
+def dispatch_campaign(campaign) -> int:
+    """
+    Send the pending chunks of a campaign as a chord.
+
+    Returns:
+        int: Number of dispatched chunks.
+    """
+    chunk_ids = EmailCampaignRepository.get_pending_chunk_ids(campaign)
+    if not chunk_ids:
+        EmailCampaignRepository.mark_completed(campaign.id)
+        return 0
+
+    EmailCampaignRepository.mark_running(campaign)
+    callback = finalize_campaign_async.s(str(campaign.id)).on_error(
+        fail_campaign_async.s(str(campaign.id))
+    )
+    chord(send_campaign_chunk_async.s(str(chunk_id)) for chunk_id in chunk_ids)(
+        callback
+    )
+    return len(chunk_ids)
+
+
+@shared_task
+def relay_email_outbox_async():
+    """
+    Periodic Celery task that publishes due email outbox entries.
+
+    Acts as a safety net for the ``relay_email_outbox`` command.
+    """
+    total = {"published": 0, "postponed": 0}
+    while True:
+        result = EmailOutboxService.relay()
+        total["published"] += result["published"]
+        total["postponed"] += result["postponed"]
+        if result["published"] < EMAIL_OUTBOX_BATCH_SIZE:
+            return total
+
+
+@shared_task
+def archive_email_logs_async():
+    """
+    Periodic Celery task that archives email logs past the retention window.
+    """
+    return EmailLogArchiveService.archive()
+
+
+@shared_task
+def flush_email_tracking_async():
+    """
+    Periodic Celery task that writes buffered opens and clicks to email logs.
+    """
+    return EmailTrackingService.flush()
+
+
+@shared_task
+def retry_failed_emails_async():
+    """
+    Periodic Celery task that resends failed emails that are due for a retry.
+    """
+    return EmailRetryService().sweep()
@@ -0,0 +1,160 @@
+import smtplib
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from apps.mailer.constants import EmailStatus, EMAIL_SEND_CLAIM_TIMEOUT
+from apps.mailer.exceptions import EmailSendError
+from apps.mailer.models import EmailLogModel, EmailTemplateModel
+from apps.mailer.repositories import EmailLogRepository
+from apps.mailer.services.email_retry_service import EmailRetryService
+from apps.mailer.services.email_sending_service import EmailSendingService
+
+EMAIL = "guest@example.com"
+
+
+class MailerTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.template = EmailTemplateModel.objects.create(
+            name="Welcome",
+            slug="welcome",
+            subject="Welcome {{ name }}",
+            html_content="<p>Hello {{ name }}</p>",
+        )
+
+    def create_log(self, **fields) -> EmailLogModel:
+        return EmailLogModel.objects.create(
+            template=self.template,
+            recipient_email=EMAIL,
+            subject="Welcome Ann",
+            context_data={"name": "Ann"},
+            **fields,
+        )
+
+
+class EmailRetrySweepTests(MailerTestCase):
+    def sweep_with(self, concurrently):
+        """Sweep, running concurrently(logs) after the due logs are read."""
+        get_retryable_logs = EmailLogRepository.get_retryable_logs
+
+        def read_then_race(*args, **kwargs):
+            logs = get_retryable_logs(*args, **kwargs)
+            concurrently(logs)
+            return logs
+
+        with mock.patch.object(
+            EmailLogRepository, "get_retryable_logs", side_effect=read_then_race
+        ):
+            return EmailRetryService().sweep()
+
+    def test_sweep_resends_due_failed_log(self):
+        log = self.create_log(status=EmailStatus.FAILED)
+
+        totals = EmailRetryService().sweep()
+
+        self.assertEqual(totals, {"sent": 1, "failed": 0, "given_up": 0})
+        self.assertEqual(len(mail.outbox), 1)
+        log.refresh_from_db()
+        self.assertEqual(log.status, EmailStatus.SENT)
+        self.assertEqual(log.retry_count, 1)
+
+    def test_sweep_skips_log_claimed_concurrently(self):
+        # A pending Celery retry of the same send request takes the log
+        log = self.create_log(status=EmailStatus.FAILED)
+
+        totals = self.sweep_with(
+            lambda logs: EmailLogRepository.claim_for_sending(logs[0])
+        )
+
+        self.assertEqual(totals, {"sent": 0, "failed": 0, "given_up": 0})
+        self.assertEqual(mail.outbox, [])
+        log.refresh_from_db()
+        self.assertEqual(log.status, EmailStatus.SENDING)
+        self.assertEqual(log.retry_count, 0)
+
+    def test_sweep_keeps_status_of_log_sent_concurrently(self):
+        log = self.create_log(status=EmailStatus.FAILED)
+
+        self.sweep_with(
+            lambda logs: EmailLogModel.objects.filter(pk=logs[0].pk).update(
+                status=EmailStatus.SENT
+            )
+        )
+
+        self.assertEqual(mail.outbox, [])
+        log.refresh_from_db()
+        self.assertEqual(log.status, EmailStatus.SENT)
+
+
+class IdempotentSendTests(MailerTestCase):
+    def send(self, key: str = "signup:1") -> EmailLogModel:
+        return EmailSendingService().send_email(
+            template_slug="welcome",
+            recipient_email=EMAIL,
+            context={"name": "Ann"},
+            idempotency_key=key,
+            language="",
+        )
+
+    def test_retry_resumes_log_of_failed_attempt(self):
+        with mock.patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=smtplib.SMTPServerDisconnected("dropped"),
+        ):
+            with self.assertRaises(EmailSendError):
+                self.send()
+        failed = EmailLogModel.objects.get()
+        self.assertEqual(failed.status, EmailStatus.FAILED)
+
+        log = self.send()
+
+        self.assertEqual(log.pk, failed.pk)
+        self.assertEqual(EmailLogModel.objects.count(), 1)
+        self.assertEqual(EmailLogModel.objects.get().status, EmailStatus.SENT)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_claim_of_sending_log_is_refused_until_it_is_stale(self):
+        log = self.create_log()
+
+        self.assertTrue(EmailLogRepository.claim_for_sending(log))
+        self.assertFalse(EmailLogRepository.claim_for_sending(log))
+
+        EmailLogModel.objects.filter(pk=log.pk).update(
+            updated_at=timezone.now()
+            - timedelta(seconds=EMAIL_SEND_CLAIM_TIMEOUT - 60)
+        )
+        self.assertFalse(EmailLogRepository.claim_for_sending(log))
+
+        EmailLogModel.objects.filter(pk=log.pk).update(
+            updated_at=timezone.now()
+            - timedelta(seconds=EMAIL_SEND_CLAIM_TIMEOUT + 60)
+        )
+        self.assertTrue(EmailLogRepository.claim_for_sending(log))
+
+    def test_claim_of_sent_log_is_refused(self):
+        log = self.create_log(status=EmailStatus.SENT)
+
+        self.assertFalse(EmailLogRepository.claim_for_sending(log))
+
+    def test_sent_log_is_not_resent(self):
+        first = self.send()
+
+        self.assertEqual(self.send().pk, first.pk)
+        # Without the cached state the unique key finds the log
+        cache.clear()
+        self.assertEqual(self.send().pk, first.pk)
+
+        self.assertEqual(EmailLogModel.objects.count(), 1)
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_send_claimed_by_concurrent_attempt_is_skipped(self):
+        log = self.create_log(idempotency_key="signup:1")
+        EmailLogRepository.claim_for_sending(log)
+
+        self.assertEqual(self.send().pk, log.pk)
+        self.assertEqual(mail.outbox, [])
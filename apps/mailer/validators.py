@@ -1,6 +1,18 @@
-from typing import List
+from typing import Iterable, List, Optional, Set, Tuple
 from django.core.exceptions import ValidationError
 from django.template import Template, TemplateSyntaxError
+from django.template.base import FilterExpression, NodeList, VariableNode
+from django.template.defaulttags import (
+    AutoEscapeControlNode,
+    ForNode,
+    IfNode,
+    WithNode,
+)
+
+CONTEXT_POLICY_RULES = ("keep", "hash", "redact", "shared")
+
+# Filters that render something sensible for a missing variable
+DEFAULT_FILTERS = ("default", "default_if_none")
 
 
 class TemplateValidator:
@@ -17,7 +29,194 @@ class TemplateValidator:
     @staticmethod
     def extract_variables(content: str) -> List[str]:
         """Extract variable names from template content."""
-        import re
+        return TemplateValidator.extract_manifest(content)[0]
+
+    @staticmethod
+    def extract_manifest(*contents: str) -> Tuple[List[str], List[str]]:
+        """
+        Extract the context variables read by one or more template sources.
+
+        Only the first name of a lookup counts (``user`` for
+        ``{{ user.name }}``); loop and ``with`` variables are skipped.
+
+        Returns:
+            tuple: (variables, required) where required are the variables
+            printed unconditionally and without a ``default`` filter.
+        """
+        used: Set[str] = set()
+        required: Set[str] = set()
+        for content in contents:
+            if content:
+                TemplateValidator._collect_nodes(
+                    Template(content).nodelist, used, required, frozenset()
+                )
+        return sorted(used), sorted(required)
+
+    @staticmethod
+    def outputs_plainly(names: Iterable[str], *contents: str) -> bool:
+        """
+        Check that names are only ever printed as is (``{{ name }}``).
+
+        False if any of them is filtered, tested, looped over, bound by a
+        tag or printed under ``{% autoescape %}``; the rendered output then
+        depends on the value in ways a plain substitution cannot reproduce.
+        """
+        names = set(names)
+        return all(
+            TemplateValidator._prints_plainly(Template(content).nodelist, names)
+            for content in contents
+            if content
+        )
+
+    @staticmethod
+    def _prints_plainly(nodelist: NodeList, names: Set[str]) -> bool:
+        for node in nodelist:
+            if isinstance(node, VariableNode):
+                expression = node.filter_expression
+                if TemplateValidator._references(expression) & names and (
+                    expression.filters or len(expression.var.lookups) != 1
+                ):
+                    return False
+                continue
+
+            if isinstance(node, AutoEscapeControlNode):
+                used: Set[str] = set()
+                TemplateValidator._collect_nodes(node.nodelist, used, None, frozenset())
+                expressions = None if used & names else []
+            elif isinstance(node, IfNode):
+                expressions = [
+                    part
+                    for condition, _ in node.conditions_nodelists
+                    for part in TemplateValidator._condition_parts(condition)
+                ]
+            elif isinstance(node, ForNode):
+                expressions = None if names & set(node.loopvars) else [node.sequence]
+            elif isinstance(node, WithNode):
+                expressions = (
+                    None
+                    if names & set(node.extra_context)
+                    else list(node.extra_context.values())
+                )
+            else:
+                expressions = TemplateValidator._held_expressions(node)
+            if expressions is None or any(
+                TemplateValidator._references(expression) & names
+                for expression in expressions
+            ):
+                return False
+
+            for attr in node.child_nodelists:
+                child = getattr(node, attr, None)
+                if child and not TemplateValidator._prints_plainly(child, names):
+                    return False
+        return True
+
+    @staticmethod
+    def _held_expressions(node) -> List[FilterExpression]:
+        """Return the expressions a tag holds, alone or in a list or dict."""
+        expressions = []
+        for value in vars(node).values():
+            if isinstance(value, dict):
+                value = list(value.values())
+            elif not isinstance(value, (list, tuple)):
+                value = [value]
+            expressions += [
+                item for item in value if isinstance(item, FilterExpression)
+            ]
+        return expressions
+
+    @staticmethod
+    def _references(expression: FilterExpression) -> Set[str]:
+        """Return the root names an expression (and its filter arguments) reads."""
+        variables = [expression.var] + [
+            arg for _, args in expression.filters for is_lookup, arg in args if is_lookup
+        ]
+        return {
+            variable.lookups[0]
+            for variable in variables
+            if getattr(variable, "lookups", None)
+        }
+
+    @staticmethod
+    def _collect_nodes(
+        nodelist: NodeList,
+        used: Set[str],
+        required: Optional[Set[str]],
+        local: frozenset,
+    ) -> None:
+        collect = TemplateValidator._collect_nodes
+        expression = TemplateValidator._collect_expression
+
+        for node in nodelist:
+            if isinstance(node, VariableNode):
+                filters = {func.__name__ for func, _ in node.filter_expression.filters}
+                printed = None if filters & set(DEFAULT_FILTERS) else required
+                expression(node.filter_expression, used, printed, local)
+            elif isinstance(node, IfNode):
+                for condition, body in node.conditions_nodelists:
+                    for part in TemplateValidator._condition_parts(condition):
+                        expression(part, used, None, local)
+                    collect(body, used, None, local)
+            elif isinstance(node, ForNode):
+                expression(node.sequence, used, None, local)
+                loop_local = local | set(node.loopvars) | {"forloop"}
+                collect(node.nodelist_loop, used, None, loop_local)
+                collect(node.nodelist_empty, used, None, local)
+            elif isinstance(node, WithNode):
+                for value in node.extra_context.values():
+                    expression(value, used, None, local)
+                collect(node.nodelist, used, required, local | set(node.extra_context))
+            else:
+                # Other tags, e.g. {% firstof a b %}, read what they hold
+                for held in TemplateValidator._held_expressions(node):
+                    expression(held, used, None, local)
+                for attr in node.child_nodelists:
+                    collect(getattr(node, attr, None) or [], used, required, local)
+
+    @staticmethod
+    def _condition_parts(condition) -> Iterable[FilterExpression]:
+        """Yield the operands of an ``{% if %}`` condition (None for ``else``)."""
+        if condition is None:
+            return
+        if isinstance(getattr(condition, "value", None), FilterExpression):
+            yield condition.value
+            return
+        for side in ("first", "second"):
+            yield from TemplateValidator._condition_parts(getattr(condition, side, None))
+
+    @staticmethod
+    def _collect_expression(
+        expression: FilterExpression,
+        used: Set[str],
+        required: Optional[Set[str]],
+        local: frozenset,
+    ) -> None:
+        variables = [expression.var] + [
+            arg for _, args in expression.filters for is_lookup, arg in args if is_lookup
+        ]
+        for index, variable in enumerate(variables):
+            lookups = getattr(variable, "lookups", None)
+            if not lookups or lookups[0] in local:
+                continue
+            used.add(lookups[0])
+            if required is not None and index == 0:
+                required.add(lookups[0])
+
+    @staticmethod
+    def validate_context_policy(policy: dict) -> None:
+        """Validate a template's context storage policy."""
+        if not isinstance(policy, dict):
+            raise ValidationError("Context policy must be an object")
 
-        pattern = r"\{\{\s*(\w+)\s*\}\}"
-        return list(set(re.findall(pattern, content)))
+        for rule, names in policy.items():
+            if rule not in CONTEXT_POLICY_RULES:
+                raise ValidationError(
+                    f"Unknown context policy rule '{rule}', "
+                    f"expected one of: {', '.join(CONTEXT_POLICY_RULES)}"
+                )
+            if not isinstance(names, list) or not all(
+                isinstance(name, str) for name in names
+            ):
+                raise ValidationError(
+                    f"Context policy rule '{rule}' must be a list of variable names"
+                )
@@ -27,6 +27,58 @@ ENV_EMAIL_HOST_USER: str | None = os.getenv("EMAIL_HOST_USER")
 ENV_EMAIL_HOST_PASSWORD: str | None = os.getenv("EMAIL_HOST_PASSWORD")
 ENV_DEFAULT_FROM_EMAIL: str | None = os.getenv("DEFAULT_FROM_EMAIL")
 ENV_MAX_RETRY_ATTEMPTS: int = int(os.getenv("MAX_RETRY_ATTEMPTS", 3))
+ENV_EMAIL_POOL_SIZE: int = int(os.getenv("EMAIL_POOL_SIZE", 2))
+ENV_EMAIL_MAX_MESSAGES_PER_CONNECTION: int = int(
+    os.getenv("EMAIL_MAX_MESSAGES_PER_CONNECTION", 100)
+)
+ENV_EMAIL_HEALTHCHECK_INTERVAL: int = int(os.getenv("EMAIL_HEALTHCHECK_INTERVAL", 30))
+ENV_EMAIL_HOST_RATE: str = os.getenv("EMAIL_HOST_RATE", "")
+ENV_EMAIL_SENDING_ENGINE: str = os.getenv("EMAIL_SENDING_ENGINE", "pool")
+ENV_EMAIL_ASYNC_CONCURRENCY: int = int(os.getenv("EMAIL_ASYNC_CONCURRENCY", 10))
+ENV_EMAIL_BULK_BATCH_SIZE: int = int(os.getenv("EMAIL_BULK_BATCH_SIZE", 100))
+ENV_EMAIL_CAMPAIGN_CHUNK_SIZE: int = int(os.getenv("EMAIL_CAMPAIGN_CHUNK_SIZE", 500))
+ENV_EMAIL_LOG_BUFFERING: bool = os.getenv("EMAIL_LOG_BUFFERING", "False") == "True"
+ENV_EMAIL_LOG_BUFFER_SIZE: int = int(os.getenv("EMAIL_LOG_BUFFER_SIZE", 100))
+ENV_EMAIL_LOG_BUFFER_INTERVAL: float = float(os.getenv("EMAIL_LOG_BUFFER_INTERVAL", 5.0))
+ENV_EMAIL_DEFAULT_LANGUAGE: str = os.getenv("EMAIL_DEFAULT_LANGUAGE", "fa")
+ENV_EMAIL_RETRY_MAX_ATTEMPTS: int = int(os.getenv("EMAIL_RETRY_MAX_ATTEMPTS", 5))
+ENV_EMAIL_RETRY_BASE_DELAY: int = int(os.getenv("EMAIL_RETRY_BASE_DELAY", 600))
+ENV_EMAIL_RETRY_MAX_DELAY: int = int(os.getenv("EMAIL_RETRY_MAX_DELAY", 21600))
+ENV_EMAIL_RETRY_MAX_AGE_HOURS: int = int(os.getenv("EMAIL_RETRY_MAX_AGE_HOURS", 48))
+ENV_EMAIL_LOG_RETENTION_DAYS: int = int(os.getenv("EMAIL_LOG_RETENTION_DAYS", 90))
+ENV_EMAIL_LOG_ARCHIVE_DIR: str = os.getenv("EMAIL_LOG_ARCHIVE_DIR", "archives/email_logs")
+ENV_EMAIL_IDEMPOTENCY_TTL: int = int(os.getenv("EMAIL_IDEMPOTENCY_TTL", 86400))
+# Public origin of the API, used in open/click tracking links
+ENV_EMAIL_TRACKING_URL: str = os.getenv("EMAIL_TRACKING_URL", "http://localhost:8000")
+ENV_EMAIL_OUTBOX_BATCH_SIZE: int = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 100))
+ENV_EMAIL_OUTBOX_RELAY_INTERVAL: float = float(
+    os.getenv("EMAIL_OUTBOX_RELAY_INTERVAL", 1.0)
+)
+
+# ---------------------------------------------------------------
+# Cache Configuration
+# ---------------------------------------------------------------
+# Shared cache, e.g. CACHE_URL=redis://localhost:6379/1. Without a
+# CACHE_URL each process gets its own in-memory cache (LocMemCache).
+ENV_CACHE_URL: str = os.getenv("CACHE_URL", "")
+ENV_CACHE_BACKEND: str = os.getenv(
+    "CACHE_BACKEND",
+    (
+        "django.core.cache.backends.redis.RedisCache"
+        if ENV_CACHE_URL
+        else "django.core.cache.backends.locmem.LocMemCache"
+    ),
+)
+# Shared state (rate limits, ...), "local://" keeps it in process memory
+ENV_REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379/2")
+
+# ---------------------------------------------------------------
+# Celery Configuration
+# ---------------------------------------------------------------
+ENV_CELERY_TRANSACTIONAL_CONCURRENCY: int = int(
+    os.getenv("CELERY_TRANSACTIONAL_CONCURRENCY", 4)
+)
+ENV_CELERY_BULK_CONCURRENCY: int = int(os.getenv("CELERY_BULK_CONCURRENCY", 2))
 
 # ---------------------------------------------------------------
 # JWT & AUTH Configuration
@@ -34,6 +86,8 @@ ENV_MAX_RETRY_ATTEMPTS: int = int(os.getenv("MAX_RETRY_ATTEMPTS", 3))
 ENV_OTP_LENGTH: int = int(os.getenv("OTP_LENGTH", 6))
 ENV_OTP_EXPIRY_MINUTES: int = int(os.getenv("OTP_EXPIRY_MINUTES", 5))
 ENV_MAX_VERIFY_ATTEMPTS: int = int(os.getenv("MAX_VERIFY_ATTEMPTS", 3))
+# Where OTPs are kept: "database" or "redis" (REDIS_URL)
+ENV_OTP_STORAGE_BACKEND: str = os.getenv("OTP_STORAGE_BACKEND", "database")
 
 ENV_MINUTES: int = int(os.getenv("ACCESS_TOKEN_LIFETIME", 15))
 ENV_HOURS: int = int(os.getenv("REFRESH_TOKEN_LIFETIME", 24))
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 from datetime import timedelta
+from celery.schedules import crontab
 
 from config.env import *
 
@@ -105,9 +106,9 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.BasicAuthentication",
     ],
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.UserRateThrottle",
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.ScopedRateThrottle",
+        "apps.common.throttling.UserRateThrottle",
+        "apps.common.throttling.AnonRateThrottle",
+        "apps.common.throttling.ScopedRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "10/minute",
@@ -127,6 +128,28 @@ EMAIL_HOST_USER = ENV_EMAIL_HOST_USER
 EMAIL_HOST_PASSWORD = ENV_EMAIL_HOST_PASSWORD
 DEFAULT_FROM_EMAIL = ENV_DEFAULT_FROM_EMAIL
 
+# Send rates enforced across all mailer workers, e.g. "14/s" or "500/h"
+MAILER_SEND_RATES = {
+    # Per SMTP host, none without an EMAIL_HOST to key it by
+    "hosts": (
+        {EMAIL_HOST: ENV_EMAIL_HOST_RATE}
+        if EMAIL_HOST and ENV_EMAIL_HOST_RATE
+        else {}
+    ),
+    # Per template slug, e.g. {"newsletter": "100/m"}
+    "templates": {},
+}
+
+# ---------------------------------------------------------------
+# Cache Configuration
+# ---------------------------------------------------------------
+CACHES = {
+    "default": {
+        "BACKEND": ENV_CACHE_BACKEND,
+        "LOCATION": ENV_CACHE_URL,
+    }
+}
+
 # ---------------------------------------------------------------
 # Celery Configuration
 # ---------------------------------------------------------------
@@ -137,6 +160,57 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = "UTC"
 
+# Transactional mail (OTP codes, single sends) never waits behind bulk
+# campaigns: each kind has its own queue served by its own workers.
+CELERY_TASK_DEFAULT_QUEUE = "default"
+CELERY_TASK_ROUTES = {
+    "apps.mailer.tasks.send_email_async": {"queue": "mail_transactional"},
+    "apps.mailer.tasks.relay_email_outbox_async": {"queue": "mail_transactional"},
+    "apps.mailer.tasks.send_bulk_emails_async": {"queue": "mail_bulk"},
+    "apps.mailer.tasks.send_campaign_chunk_async": {"queue": "mail_bulk"},
+    "apps.mailer.tasks.finalize_campaign_async": {"queue": "mail_bulk"},
+    "apps.mailer.tasks.resume_campaign_async": {"queue": "mail_bulk"},
+    "apps.mailer.tasks.retry_failed_emails_async": {"queue": "mail_bulk"},
+}
+
+# Worker pools started with `manage.py run_mailer_worker <pool>`
+MAILER_WORKER_POOLS = {
+    "transactional": {
+        "queues": ["mail_transactional"],
+        "concurrency": ENV_CELERY_TRANSACTIONAL_CONCURRENCY,
+        # Short tasks: reserve one at a time so none waits behind another
+        "prefetch_multiplier": 1,
+    },
+    "bulk": {
+        "queues": ["mail_bulk", "default"],
+        "concurrency": ENV_CELERY_BULK_CONCURRENCY,
+        "prefetch_multiplier": 1,
+    },
+}
+
+CELERY_BEAT_SCHEDULE = {
+    "relay-email-outbox": {
+        "task": "apps.mailer.tasks.relay_email_outbox_async",
+        "schedule": 10.0,
+    },
+    "flush-email-tracking": {
+        "task": "apps.mailer.tasks.flush_email_tracking_async",
+        "schedule": 10.0,
+    },
+    "retry-failed-emails": {
+        "task": "apps.mailer.tasks.retry_failed_emails_async",
+        "schedule": 300.0,
+    },
+    "purge-expired-otps": {
+        "task": "apps.authentication.tasks.purge_expired_otps_async",
+        "schedule": 600.0,
+    },
+    "archive-email-logs": {
+        "task": "apps.mailer.tasks.archive_email_logs_async",
+        "schedule": crontab(hour=3, minute=0),
+    },
+}
+
 # ---------------------------------------------------------------
 # Simple JWT Configuration
 # ---------------------------------------------------------------